@@ -8,6 +8,7 @@ from kaynat.dsa.graph import Graph
 from kaynat.dsa.heap import MinHeap, MaxHeap
 from kaynat.dsa.hash_map import HashMap
 from kaynat.dsa.trie import Trie
+from kaynat.dsa.text_search import SuffixArray
 
 __all__ = [
     'Stack',
@@ -18,5 +19,6 @@ __all__ = [
     'MinHeap',
     'MaxHeap',
     'HashMap',
-    'Trie'
+    'Trie',
+    'SuffixArray'
 ]
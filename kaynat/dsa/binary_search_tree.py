@@ -1,47 +1,303 @@
-"""Kaynat Binary Search Tree - Stub implementation."""
+"""Kaynat Binary Search Tree - AVL-balanced ordered tree."""
+
+from kaynat.errors.error_types import RuntimeError as KaynatRuntimeError, ValueError as KaynatValueError
+
 
 class TreeNode:
+    __slots__ = ('values', 'left', 'right', 'height', 'size')
+
     def __init__(self, value):
-        self.value = value
+        # Every value with this node's key, in insertion order
+        self.values = [value]
         self.left = None
         self.right = None
+        self.height = 1
+        # Elements in this subtree, counting duplicates
+        self.size = 1
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _size(node):
+    return node.size if node is not None else 0
+
+
+def _update(node):
+    left, right = node.left, node.right
+    lh = left.height if left is not None else 0
+    rh = right.height if right is not None else 0
+    node.height = (lh if lh > rh else rh) + 1
+    node.size = len(node.values) + (left.size if left is not None else 0) + (right.size if right is not None else 0)
+
+
+def _rotate_left(node):
+    pivot = node.right
+    node.right = pivot.left
+    pivot.left = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rotate_right(node):
+    pivot = node.left
+    node.left = pivot.right
+    pivot.right = node
+    _update(node)
+    _update(pivot)
+    return pivot
+
+
+def _rebalance(node):
+    """Restore the AVL property at node and return the subtree root."""
+    _update(node)
+    balance = _height(node.left) - _height(node.right)
+    if balance > 1:
+        if _height(node.left.left) < _height(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if balance < -1:
+        if _height(node.right.right) < _height(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
 
 
 class BinarySearchTree:
-    """Binary Search Tree data structure."""
-    
-    def __init__(self):
+    """
+    Self-balancing (AVL) binary search tree.
+
+    Every operation is iterative, so sorted input neither degrades
+    lookups to O(n) nor hits the recursion limit. Values are ordered
+    by key(value) when a key function is given; values with equal keys
+    share a node and keep the order they were inserted in.
+    """
+
+    def __init__(self, key=None):
         self.root = None
-    
+        self.key = key if key is not None else (lambda value: value)
+
+    def _relink(self, path, index, subtree):
+        """Attach subtree where path[index] was."""
+        if index == 0:
+            self.root = subtree
+        else:
+            parent = path[index - 1]
+            if parent.left is path[index]:
+                parent.left = subtree
+            else:
+                parent.right = subtree
+
+    def _rebalance_path(self, path):
+        for index in range(len(path) - 1, -1, -1):
+            node = path[index]
+            balanced = _rebalance(node)
+            if balanced is not node:
+                self._relink(path, index, balanced)
+
     def insert(self, value):
         """Insert value into BST."""
-        if not self.root:
+        if self.root is None:
             self.root = TreeNode(value)
-        else:
-            self._insert_recursive(self.root, value)
-    
-    def _insert_recursive(self, node, value):
-        if value < node.value:
-            if node.left is None:
-                node.left = TreeNode(value)
-            else:
-                self._insert_recursive(node.left, value)
-        else:
-            if node.right is None:
-                node.right = TreeNode(value)
+            return
+
+        key = self.key
+        k = key(value)
+        path = []
+        node = self.root
+        while True:
+            path.append(node)
+            nk = key(node.values[0])
+            if k == nk:
+                node.values.append(value)
+                break
+            if k < nk:
+                if node.left is None:
+                    node.left = TreeNode(value)
+                    break
+                node = node.left
             else:
-                self._insert_recursive(node.right, value)
-    
+                if node.right is None:
+                    node.right = TreeNode(value)
+                    break
+                node = node.right
+        self._rebalance_path(path)
+
+    def _find(self, value):
+        key = self.key
+        k = key(value)
+        node = self.root
+        while node is not None:
+            nk = key(node.values[0])
+            if k == nk:
+                return node
+            node = node.left if k < nk else node.right
+        return None
+
     def search(self, value):
         """Search for value in BST."""
-        return self._search_recursive(self.root, value)
-    
-    def _search_recursive(self, node, value):
-        if node is None:
+        node = self._find(value)
+        return node is not None and value in node.values
+
+    def delete(self, value):
+        """Remove one copy of value; return whether it was found."""
+        key = self.key
+        k = key(value)
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            nk = key(node.values[0])
+            if k == nk:
+                break
+            node = node.left if k < nk else node.right
+        if node is None or value not in node.values:
             return False
-        if node.value == value:
+
+        if len(node.values) > 1:
+            node.values.remove(value)
+            for item in path:
+                item.size -= 1
             return True
-        elif value < node.value:
-            return self._search_recursive(node.left, value)
-        else:
-            return self._search_recursive(node.right, value)
+
+        if node.left is not None and node.right is not None:
+            # Replace with the in-order successor, then remove that instead
+            successor = node.right
+            path.append(successor)
+            while successor.left is not None:
+                successor = successor.left
+                path.append(successor)
+            node.values = successor.values
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        self._relink(path, len(path) - 1, child)
+        path.pop()
+        self._rebalance_path(path)
+        return True
+
+    def __len__(self):
+        return _size(self.root)
+
+    def __contains__(self, value):
+        return self.search(value)
+
+    def __iter__(self):
+        return self.inorder()
+
+    def height(self):
+        """Get height of tree (0 when empty)."""
+        return _height(self.root)
+
+    def min(self):
+        """Get smallest value."""
+        node = self.root
+        if node is None:
+            raise KaynatRuntimeError("Tree is empty")
+        while node.left is not None:
+            node = node.left
+        return node.values[0]
+
+    def max(self):
+        """Get largest value."""
+        node = self.root
+        if node is None:
+            raise KaynatRuntimeError("Tree is empty")
+        while node.right is not None:
+            node = node.right
+        return node.values[-1]
+
+    def kth_smallest(self, k):
+        """Get the kth smallest value, counting from 1."""
+        if k < 1 or k > len(self):
+            raise KaynatValueError(f"Position {k} out of range")
+        node = self.root
+        while True:
+            left = _size(node.left)
+            if k <= left:
+                node = node.left
+            elif k <= left + len(node.values):
+                return node.values[k - left - 1]
+            else:
+                k -= left + len(node.values)
+                node = node.right
+
+    def rank(self, value):
+        """Count values smaller than value."""
+        key = self.key
+        k = key(value)
+        smaller = 0
+        node = self.root
+        while node is not None:
+            nk = key(node.values[0])
+            if k <= nk:
+                if k == nk:
+                    return smaller + _size(node.left)
+                node = node.left
+            else:
+                smaller += _size(node.left) + len(node.values)
+                node = node.right
+        return smaller
+
+    def range(self, low, high):
+        """Yield values from low to high inclusive, in order."""
+        key = self.key
+        lo, hi = key(low), key(high)
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                if key(node.values[0]) >= lo:
+                    stack.append(node)
+                    node = node.left
+                else:
+                    node = node.right
+                continue
+            node = stack.pop()
+            if key(node.values[0]) > hi:
+                return
+            yield from node.values
+            node = node.right
+
+    def inorder(self):
+        """Yield values in sorted order."""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield from node.values
+                node = node.right
+
+    def preorder(self):
+        """Yield values node first, then left and right subtrees."""
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield from node.values
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def postorder(self):
+        """Yield values left and right subtrees first, then node."""
+        stack = []
+        last = None
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+                continue
+            top = stack[-1]
+            if top.right is not None and last is not top.right:
+                node = top.right
+            else:
+                yield from top.values
+                last = stack.pop()
@@ -1,51 +1,641 @@
-"""Kaynat Graph - Stub implementation."""
+"""Kaynat Graph - Directed or undirected graph with compact adjacency storage."""
 
-from collections import defaultdict, deque
+import csv
+import json
+import heapq
+import re
+import struct
+import sys
+from array import array
+from collections import deque
+
+from kaynat.errors.error_types import RuntimeError as KaynatRuntimeError, ValueError as KaynatValueError, FileError
+
+
+# Binary graph file: magic, then directed flag, node count, edge count
+# and label bytes, followed by the labels as JSON and the raw arrays
+GRAPH_MAGIC = b'KGRAPH1\n'
+_GRAPH_HEADER = struct.Struct('<BQQQ')
+
+# Header names skipped when they appear on the first row of an edge list
+_HEADER_NAMES = {'source', 'target', 'from', 'to', 'src', 'dst', 'weight', 'node', 'neighbor'}
+
+# CSV and TSV cells read as numbers, so they match nodes added as numbers
+_INTEGER = re.compile(r'[-+]?\d+')
+_DECIMAL = re.compile(r'[-+]?(\d+\.\d*|\.\d+)([eE][-+]?\d+)?|[-+]?\d+[eE][-+]?\d+')
+
+
+def _csv_field(text):
+    """Read a node name from a CSV or TSV cell, as a number when it looks like one."""
+    text = text.strip()
+    if _INTEGER.fullmatch(text):
+        return int(text)
+    if _DECIMAL.fullmatch(text):
+        return float(text)
+    return text
+
+
+def _weight(weight, where=''):
+    """Convert an edge weight to a float before anything is stored."""
+    try:
+        return float(weight)
+    except (TypeError, ValueError):
+        raise KaynatValueError(f"Invalid weight{where}: {weight!r}")
+
+
+class UnionFind:
+    """Disjoint sets over integer ids with path halving and union by size."""
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b):
+        """Join the sets of a and b; return False if already joined."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if self.size[ra] < self.size[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.size[ra] += self.size[rb]
+        return True
 
 
 class Graph:
-    """Graph data structure."""
-    
-    def __init__(self):
-        self.adjacency_list = defaultdict(list)
-        self.weights = {}
-    
+    """
+    Graph data structure.
+
+    Node labels are mapped to integer ids and edges are kept in flat
+    arrays. Algorithms run on a CSR (compressed sparse row) adjacency
+    built from those arrays on first use and rebuilt after changes, so
+    large graphs stay compact and neighbors are contiguous slices.
+    """
+
+    def __init__(self, directed=True):
+        self.directed = directed
+        self.ids = {}
+        self.labels = []
+        self.sources = array('q')
+        self.targets = array('q')
+        self.weights = array('d')
+        self._csr = {}
+
+    def _id(self, node):
+        node_id = self.ids.get(node)
+        if node_id is None:
+            node_id = len(self.labels)
+            self.ids[node] = node_id
+            self.labels.append(node)
+        return node_id
+
+    def _require(self, node):
+        node_id = self.ids.get(node)
+        if node_id is None:
+            raise KaynatValueError(f"Node {node} is not in the graph")
+        return node_id
+
     def add_node(self, node):
         """Add node to graph."""
-        if node not in self.adjacency_list:
-            self.adjacency_list[node] = []
-    
+        self._id(node)
+
     def add_edge(self, from_node, to_node, weight=1):
         """Add edge between nodes."""
-        self.adjacency_list[from_node].append(to_node)
-        self.weights[(from_node, to_node)] = weight
-    
+        weight = _weight(weight)
+        self.sources.append(self._id(from_node))
+        self.targets.append(self._id(to_node))
+        self.weights.append(weight)
+        self._csr.clear()
+
+    def load_edges(self, filepath, format=None, weighted=True, dedupe=False, label=None):
+        """
+        Add every edge of a CSV, TSV or JSON-lines edge list in one pass.
+
+        Rows are source, target and an optional weight; JSON lines may
+        also be objects with source/target/weight (or from/to) keys.
+        The format is taken from the file extension when not given.
+        CSV and TSV node names that look like numbers are read as
+        numbers. label converts each node name read from the file, and
+        dedupe skips edges the graph already has. Returns the number of
+        edges added.
+        """
+        if format is None:
+            lower = filepath.lower()
+            if lower.endswith(('.jsonl', '.ndjson')):
+                format = 'jsonl'
+            elif lower.endswith('.tsv'):
+                format = 'tsv'
+            else:
+                format = 'csv'
+        if format not in ('csv', 'tsv', 'jsonl'):
+            raise KaynatValueError(f"Unknown edge list format: {format}")
+
+        convert = label if label is not None else (lambda name: name)
+        ids = self.ids
+        labels = self.labels
+        sources, targets, weights = self.sources, self.targets, self.weights
+        seen = None
+        if dedupe:
+            seen = set(self._edge_key(u, v) for u, v in zip(sources, targets))
+
+        def node_id(name):
+            node = convert(name)
+            i = ids.get(node)
+            if i is None:
+                i = len(labels)
+                ids[node] = i
+                labels.append(node)
+            return i
+
+        try:
+            f = open(filepath, 'r', encoding='utf-8', newline='')
+        except FileNotFoundError:
+            raise FileError(f"File not found: {filepath}")
+        except OSError as e:
+            raise FileError(f"Error reading file: {e}")
+
+        added = 0
+        with f:
+            for line_number, (src, dst, weight) in enumerate(self._edge_rows(f, format), 1):
+                if not weighted or weight is None:
+                    weight = 1.0
+                else:
+                    weight = _weight(weight, f" on edge {line_number}")
+                u, v = node_id(src), node_id(dst)
+                if seen is not None:
+                    key = self._edge_key(u, v)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                sources.append(u)
+                targets.append(v)
+                weights.append(weight)
+                added += 1
+
+        self._csr.clear()
+        return added
+
+    def _edge_key(self, u, v):
+        if not self.directed and v < u:
+            u, v = v, u
+        return (u, v)
+
+    @staticmethod
+    def _edge_rows(f, format):
+        """Yield (source, target, weight or None) from an edge list file."""
+        if format == 'jsonl':
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise KaynatValueError(f"Invalid JSON in edge list: {e}")
+                if isinstance(record, dict):
+                    src = record.get('source', record.get('from'))
+                    dst = record.get('target', record.get('to'))
+                    if src is None or dst is None:
+                        raise KaynatValueError("Edge records need source and target")
+                    yield src, dst, record.get('weight')
+                elif isinstance(record, list) and len(record) >= 2:
+                    yield record[0], record[1], record[2] if len(record) > 2 else None
+                else:
+                    raise KaynatValueError("Edge records must be objects or arrays")
+            return
+
+        reader = csv.reader(f, delimiter='\t' if format == 'tsv' else ',')
+        first = True
+        for row in reader:
+            if not row or row[0].startswith('#'):
+                continue
+            if first:
+                first = False
+                if row[0].strip().lower() in _HEADER_NAMES:
+                    continue
+            if len(row) < 2:
+                raise KaynatValueError(f"Edge rows need a source and a target, got {row!r}")
+            weight = None
+            if len(row) > 2 and row[2].strip():
+                weight = row[2]
+            yield _csv_field(row[0]), _csv_field(row[1]), weight
+
+    def save(self, filepath, encode=None):
+        """
+        Write the graph, including its adjacency, to a compact binary file.
+
+        Labels are stored as JSON; encode converts labels that JSON
+        cannot represent.
+        """
+        labels = self.labels if encode is None else [encode(node) for node in self.labels]
+        try:
+            label_bytes = json.dumps(labels, separators=(',', ':')).encode('utf-8')
+        except TypeError as e:
+            raise KaynatValueError(f"Cannot save node labels: {e}")
+
+        arrays = [self.sources, self.targets, self.weights]
+        arrays.extend(self.adjacency())
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(GRAPH_MAGIC)
+                f.write(_GRAPH_HEADER.pack(int(self.directed), len(self.labels), len(self.sources), len(label_bytes)))
+                f.write(label_bytes)
+                for data in arrays:
+                    if sys.byteorder != 'little':
+                        data = array(data.typecode, data)
+                        data.byteswap()
+                    data.tofile(f)
+        except OSError as e:
+            raise FileError(f"Error writing graph: {e}")
+
+    @classmethod
+    def load(cls, filepath, decode=None):
+        """Read a graph written by save, without rebuilding its adjacency."""
+        try:
+            f = open(filepath, 'rb')
+        except FileNotFoundError:
+            raise FileError(f"File not found: {filepath}")
+        except OSError as e:
+            raise FileError(f"Error reading graph: {e}")
+
+        with f:
+            if f.read(len(GRAPH_MAGIC)) != GRAPH_MAGIC:
+                raise KaynatValueError(f"Not a Kaynat graph file: {filepath}")
+            try:
+                directed, n, m, label_size = _GRAPH_HEADER.unpack(f.read(_GRAPH_HEADER.size))
+                labels = json.loads(f.read(label_size).decode('utf-8'))
+                graph = cls(directed=bool(directed))
+                adjacency_size = m if directed else 2 * m
+                arrays = []
+                for typecode, count in (('q', m), ('q', m), ('d', m),
+                                        ('q', n + 1), ('q', adjacency_size), ('d', adjacency_size)):
+                    data = array(typecode)
+                    data.fromfile(f, count)
+                    if sys.byteorder != 'little':
+                        data.byteswap()
+                    arrays.append(data)
+            except (struct.error, EOFError, ValueError) as e:
+                raise KaynatValueError(f"Corrupt graph file {filepath}: {e}")
+
+        if decode is not None:
+            labels = [decode(node) for node in labels]
+        graph.labels = labels
+        graph.ids = {node: i for i, node in enumerate(labels)}
+        graph.sources, graph.targets, graph.weights = arrays[:3]
+        graph._csr[not graph.directed] = tuple(arrays[3:])
+        return graph
+
+    def __len__(self):
+        return len(self.labels)
+
+    def __iter__(self):
+        return iter(self.labels)
+
+    def node_count(self):
+        """Get number of nodes."""
+        return len(self.labels)
+
+    def edge_count(self):
+        """Get number of edges."""
+        return len(self.sources)
+
+    def adjacency(self, undirected=None):
+        """
+        Get the CSR adjacency as (offsets, targets, weights).
+
+        The neighbors of node id i are targets[offsets[i]:offsets[i + 1]].
+        Edges of an undirected graph appear in both directions.
+        """
+        if undirected is None:
+            undirected = not self.directed
+        csr = self._csr.get(undirected)
+        if csr is not None:
+            return csr
+
+        n = len(self.labels)
+        sources, targets, weights = self.sources, self.targets, self.weights
+        counts = [0] * (n + 1)
+        for s in sources:
+            counts[s + 1] += 1
+        if undirected:
+            for t in targets:
+                counts[t + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        offsets = array('q', counts)
+
+        m = counts[n]
+        adj_targets = array('q', bytes(8 * m))
+        adj_weights = array('d', bytes(8 * m))
+        cursor = counts[:n]
+        for s, t, w in zip(sources, targets, weights):
+            pos = cursor[s]
+            adj_targets[pos] = t
+            adj_weights[pos] = w
+            cursor[s] = pos + 1
+            if undirected:
+                pos = cursor[t]
+                adj_targets[pos] = s
+                adj_weights[pos] = w
+                cursor[t] = pos + 1
+
+        csr = (offsets, adj_targets, adj_weights)
+        self._csr[undirected] = csr
+        return csr
+
+    def neighbors(self, node):
+        """Get the nodes an edge leads to from node."""
+        offsets, targets, _ = self.adjacency()
+        i = self._require(node)
+        labels = self.labels
+        return [labels[t] for t in targets[offsets[i]:offsets[i + 1]]]
+
     def bfs(self, start):
         """Breadth-first search."""
-        visited = set()
-        queue = deque([start])
-        result = []
-        
+        offsets, targets, _ = self.adjacency()
+        s = self._require(start)
+        visited = bytearray(len(self.labels))
+        visited[s] = 1
+        order = [s]
+        queue = deque([s])
         while queue:
             node = queue.popleft()
-            if node not in visited:
-                visited.add(node)
-                result.append(node)
-                queue.extend(self.adjacency_list[node])
-        
-        return result
-    
+            for t in targets[offsets[node]:offsets[node + 1]]:
+                if not visited[t]:
+                    visited[t] = 1
+                    order.append(t)
+                    queue.append(t)
+        labels = self.labels
+        return [labels[i] for i in order]
+
     def dfs(self, start):
-        """Depth-first search."""
-        visited = set()
-        result = []
-        
-        def dfs_recursive(node):
-            if node not in visited:
-                visited.add(node)
-                result.append(node)
-                for neighbor in self.adjacency_list[node]:
-                    dfs_recursive(neighbor)
-        
-        dfs_recursive(start)
-        return result
+        """Depth-first search (iterative, in recursive visiting order)."""
+        offsets, targets, _ = self.adjacency()
+        s = self._require(start)
+        visited = bytearray(len(self.labels))
+        order = []
+        stack = [s]
+        while stack:
+            node = stack.pop()
+            if visited[node]:
+                continue
+            visited[node] = 1
+            order.append(node)
+            neighbors = targets[offsets[node]:offsets[node + 1]]
+            stack.extend(t for t in reversed(neighbors) if not visited[t])
+        labels = self.labels
+        return [labels[i] for i in order]
+
+    def _dijkstra(self, s, target=-1):
+        offsets, targets, weights = self.adjacency()
+        if any(w < 0 for w in weights):
+            raise KaynatValueError("Dijkstra requires non-negative edge weights")
+
+        n = len(self.labels)
+        inf = float('inf')
+        dist = [inf] * n
+        prev = [-1] * n
+        dist[s] = 0
+        heap = [(0, s)]
+        pop, push = heapq.heappop, heapq.heappush
+        while heap:
+            d, node = pop(heap)
+            if d > dist[node]:
+                continue
+            if node == target:
+                break
+            for pos in range(offsets[node], offsets[node + 1]):
+                t = targets[pos]
+                nd = d + weights[pos]
+                if nd < dist[t]:
+                    dist[t] = nd
+                    prev[t] = node
+                    push(heap, (nd, t))
+        return dist, prev
+
+    def dijkstra(self, source):
+        """Get the shortest distance from source to every reachable node."""
+        dist, _ = self._dijkstra(self._require(source))
+        labels = self.labels
+        return {labels[i]: d for i, d in enumerate(dist) if d != float('inf')}
+
+    def shortest_path(self, source, target):
+        """Get (distance, path) of the shortest path, or (None, []) if unreachable."""
+        s, t = self._require(source), self._require(target)
+        dist, prev = self._dijkstra(s, t)
+        if dist[t] == float('inf'):
+            return None, []
+        path = []
+        node = t
+        while node != -1:
+            path.append(self.labels[node])
+            node = prev[node]
+        path.reverse()
+        return dist[t], path
+
+    def bellman_ford(self, source):
+        """Get shortest distances from source, allowing negative weights."""
+        s = self._require(source)
+        n = len(self.labels)
+        inf = float('inf')
+        dist = [inf] * n
+        dist[s] = 0
+
+        edges = list(zip(self.sources, self.targets, self.weights))
+        if not self.directed:
+            edges += [(t, u, w) for u, t, w in edges]
+
+        for _ in range(n - 1):
+            changed = False
+            for u, v, w in edges:
+                du = dist[u]
+                if du != inf and du + w < dist[v]:
+                    dist[v] = du + w
+                    changed = True
+            if not changed:
+                break
+        else:
+            for u, v, w in edges:
+                if dist[u] != inf and dist[u] + w < dist[v]:
+                    raise KaynatRuntimeError("Graph contains a negative cycle")
+
+        labels = self.labels
+        return {labels[i]: d for i, d in enumerate(dist) if d != inf}
+
+    def _spanning_result(self, edges):
+        labels = self.labels
+        total = sum(w for _, _, w in edges)
+        return total, [(labels[u], labels[v], w) for u, v, w in edges]
+
+    def kruskal(self):
+        """Minimum spanning forest as (total weight, [(from, to, weight)])."""
+        sources, targets, weights = self.sources, self.targets, self.weights
+        sets = UnionFind(len(self.labels))
+        chosen = []
+        for i in sorted(range(len(sources)), key=weights.__getitem__):
+            if sets.union(sources[i], targets[i]):
+                chosen.append((sources[i], targets[i], weights[i]))
+        return self._spanning_result(chosen)
+
+    def prim(self):
+        """Minimum spanning forest grown from each component with a heap."""
+        offsets, targets, weights = self.adjacency(undirected=True)
+        n = len(self.labels)
+        in_tree = bytearray(n)
+        chosen = []
+        pop, push = heapq.heappop, heapq.heappush
+        for root in range(n):
+            if in_tree[root]:
+                continue
+            in_tree[root] = 1
+            heap = [(weights[p], root, targets[p]) for p in range(offsets[root], offsets[root + 1])]
+            heapq.heapify(heap)
+            while heap:
+                w, u, v = pop(heap)
+                if in_tree[v]:
+                    continue
+                in_tree[v] = 1
+                chosen.append((u, v, w))
+                for p in range(offsets[v], offsets[v + 1]):
+                    t = targets[p]
+                    if not in_tree[t]:
+                        push(heap, (weights[p], v, t))
+        return self._spanning_result(chosen)
+
+    def topological_sort(self):
+        """Order nodes so every edge points forward (Kahn's algorithm)."""
+        if not self.directed:
+            raise KaynatValueError("Topological order requires a directed graph")
+        offsets, targets, _ = self.adjacency()
+        n = len(self.labels)
+        indegree = [0] * n
+        for t in targets:
+            indegree[t] += 1
+
+        queue = deque(i for i in range(n) if indegree[i] == 0)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for t in targets[offsets[node]:offsets[node + 1]]:
+                indegree[t] -= 1
+                if indegree[t] == 0:
+                    queue.append(t)
+
+        if len(order) != n:
+            raise KaynatRuntimeError("Graph contains a cycle")
+        labels = self.labels
+        return [labels[i] for i in order]
+
+    def strongly_connected_components(self):
+        """Strongly connected components (iterative Tarjan)."""
+        offsets, targets, _ = self.adjacency(undirected=False)
+        n = len(self.labels)
+        index = [-1] * n
+        low = [0] * n
+        on_stack = bytearray(n)
+        stack = []
+        components = []
+        counter = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            # Each frame is (node, position of the next edge to follow)
+            work = [(root, offsets[root])]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            while work:
+                node, pos = work[-1]
+                if pos < offsets[node + 1]:
+                    work[-1] = (node, pos + 1)
+                    t = targets[pos]
+                    if index[t] == -1:
+                        index[t] = low[t] = counter
+                        counter += 1
+                        stack.append(t)
+                        on_stack[t] = 1
+                        work.append((t, offsets[t]))
+                    elif on_stack[t] and index[t] < low[node]:
+                        low[node] = index[t]
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+        labels = self.labels
+        return [[labels[i] for i in component] for component in components]
+
+    def connected_components(self):
+        """Components ignoring edge direction, each in discovery order."""
+        offsets, targets, _ = self.adjacency(undirected=True)
+        n = len(self.labels)
+        seen = bytearray(n)
+        components = []
+        for root in range(n):
+            if seen[root]:
+                continue
+            seen[root] = 1
+            component = [root]
+            queue = deque([root])
+            while queue:
+                node = queue.popleft()
+                for t in targets[offsets[node]:offsets[node + 1]]:
+                    if not seen[t]:
+                        seen[t] = 1
+                        component.append(t)
+                        queue.append(t)
+            components.append(component)
+
+        labels = self.labels
+        return [[labels[i] for i in component] for component in components]
+
+    def has_cycle(self):
+        """Check if the graph contains a cycle."""
+        if not self.directed:
+            sets = UnionFind(len(self.labels))
+            return any(not sets.union(u, v) for u, v in zip(self.sources, self.targets))
+
+        offsets, targets, _ = self.adjacency()
+        n = len(self.labels)
+        # 0 = unvisited, 1 = on the current path, 2 = finished
+        state = bytearray(n)
+        for root in range(n):
+            if state[root]:
+                continue
+            state[root] = 1
+            work = [(root, offsets[root])]
+            while work:
+                node, pos = work[-1]
+                if pos < offsets[node + 1]:
+                    work[-1] = (node, pos + 1)
+                    t = targets[pos]
+                    if state[t] == 1:
+                        return True
+                    if state[t] == 0:
+                        state[t] = 1
+                        work.append((t, offsets[t]))
+                else:
+                    state[node] = 2
+                    work.pop()
+        return False
@@ -1,37 +1,317 @@
-"""Kaynat Hash Map."""
+"""Kaynat Hash Map - Open addressing hash table."""
 
+from collections.abc import Mapping, MutableMapping, ValuesView, ItemsView
+
+from kaynat.errors.error_types import (
+    RuntimeError as KaynatRuntimeError, TypeError as KaynatTypeError, ValueError as KaynatValueError
+)
+
+
+# Slot markers; a deleted slot keeps probe chains through it intact
+_EMPTY = object()
+_DELETED = object()
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix(hash_value):
+    """
+    Spread every bit of a hash into the low bits (the splitmix64 finalizer).
+
+    Probes mask the hash to the table size, and Python's hash of an int
+    is the int itself, so keys that differ only in their high bits
+    would otherwise all share one probe chain.
+    """
+    z = hash_value & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def linear_probe(hash_value, attempt, capacity):
+    """Try consecutive slots."""
+    return (hash_value + attempt) & (capacity - 1)
+
+
+def quadratic_probe(hash_value, attempt, capacity):
+    """Step by triangular numbers, which visits every slot of a power-of-two table."""
+    return (hash_value + attempt * (attempt + 1) // 2) & (capacity - 1)
+
+
+def double_hash_probe(hash_value, attempt, capacity):
+    """Step by an odd stride taken from the high bits of the hash."""
+    step = ((hash_value >> 16) ^ (hash_value >> 5)) | 1
+    return (hash_value + attempt * step) & (capacity - 1)
+
+
+PROBING = {
+    'linear': linear_probe,
+    'quadratic': quadratic_probe,
+    'double': double_hash_probe,
+}
+
+
+class HashMap(MutableMapping):
+    """
+    Hash Map data structure.
+
+    An open addressing table whose capacity is always a power of two.
+    The hash function and probing strategy are pluggable: probing is
+    'linear', 'quadratic', 'double' or a function of (hash, attempt,
+    capacity) returning a slot; either way it sees the hash after it is
+    mixed, so all of its bits matter. The table grows once used and deleted
+    slots pass max_load of its capacity. keys(), values() and items()
+    are live views rather than copies.
+    """
+
+    def __init__(self, capacity=8, max_load=0.75, hash_function=None, probing='linear'):
+        if not 0 < max_load < 1:
+            raise KaynatValueError("Maximum load factor must be between 0 and 1")
+        if callable(probing):
+            self._probe = probing
+        elif probing in PROBING:
+            self._probe = PROBING[probing]
+        else:
+            raise KaynatValueError(f"Unknown probing strategy: {probing}")
+        self.max_load = max_load
+        self._hash = hash_function if hash_function is not None else hash
+        self._size = 0
+        self._deleted = 0
+        self._resizes = 0
+        # Bumped on every structural change so iterators notice edits
+        self._version = 0
+        self._allocate(self._capacity_for(capacity))
+
+    def _capacity_for(self, count):
+        capacity = 8
+        while capacity * self.max_load < count:
+            capacity *= 2
+        return capacity
+
+    def _allocate(self, capacity):
+        self._capacity = capacity
+        self._hashes = [None] * capacity
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+
+    def _hash_of(self, key):
+        try:
+            return _mix(self._hash(key))
+        except TypeError:
+            raise KaynatTypeError(f"Hash map key cannot be hashed: {type(key).__name__}")
+
+    def _lookup(self, key, hash_value):
+        """
+        Find key's slot.
+
+        Returns:
+            (slot, found, probes) where slot is the key's slot when found,
+            otherwise the first free slot on its probe chain
+        """
+        keys = self._keys
+        hashes = self._hashes
+        probe = self._probe
+        capacity = self._capacity
+        free = -1
+        for attempt in range(capacity):
+            slot = probe(hash_value, attempt, capacity)
+            current = keys[slot]
+            if current is _EMPTY:
+                return (free if free >= 0 else slot), False, attempt + 1
+            if current is _DELETED:
+                if free < 0:
+                    free = slot
+            elif hashes[slot] == hash_value and (current is key or current == key):
+                return slot, True, attempt + 1
+        if free >= 0:
+            return free, False, capacity
+        raise KaynatRuntimeError("Probing strategy did not find a free slot")
+
+    def _resize(self, capacity):
+        old_hashes, old_keys, old_values = self._hashes, self._keys, self._values
+        self._allocate(capacity)
+        self._deleted = 0
+        self._resizes += 1
+        keys, hashes, values = self._keys, self._hashes, self._values
+        probe = self._probe
+        for hash_value, key, value in zip(old_hashes, old_keys, old_values):
+            if key is _EMPTY or key is _DELETED:
+                continue
+            # Keys are unique, so only an empty slot needs finding
+            for attempt in range(capacity):
+                slot = probe(hash_value, attempt, capacity)
+                if keys[slot] is _EMPTY:
+                    break
+            else:
+                raise KaynatRuntimeError("Probing strategy did not find a free slot")
+            hashes[slot] = hash_value
+            keys[slot] = key
+            values[slot] = value
+
+    def _reserve(self, extra):
+        """Make sure extra new keys fit without passing the load limit."""
+        if (self._size + self._deleted + extra) > self._capacity * self.max_load:
+            self._resize(self._capacity_for(self._size + extra))
 
-class HashMap:
-    """Hash Map data structure."""
-    
-    def __init__(self):
-        self.map = {}
-    
     def put(self, key, value):
         """Put key-value pair."""
-        self.map[key] = value
-    
-    def get(self, key):
+        hash_value = self._hash_of(key)
+        slot, found, _ = self._lookup(key, hash_value)
+        if found:
+            self._values[slot] = value
+            return
+        if (self._size + self._deleted + 1) > self._capacity * self.max_load:
+            self._reserve(1)
+            slot, _, _ = self._lookup(key, hash_value)
+        if self._keys[slot] is _DELETED:
+            self._deleted -= 1
+        self._hashes[slot] = hash_value
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._size += 1
+        self._version += 1
+
+    def put_all(self, pairs):
+        """Put every pair from a KaynatMap, a mapping or an iterable of pairs."""
+        from kaynat.interpreter.runtime_types import KaynatMap
+        if isinstance(pairs, KaynatMap):
+            pairs = pairs.value
+        if isinstance(pairs, Mapping):
+            # Grow once up front instead of doubling repeatedly
+            self._reserve(len(pairs))
+            pairs = pairs.items()
+        for key, value in pairs:
+            self.put(key, value)
+
+    def get(self, key, default=None):
         """Get value by key."""
-        return self.map.get(key)
-    
+        slot, found, _ = self._lookup(key, self._hash_of(key))
+        return self._values[slot] if found else default
+
     def remove(self, key):
-        """Remove key-value pair."""
-        if key in self.map:
-            del self.map[key]
-    
+        """Remove key-value pair; return whether the key was present."""
+        slot, found, _ = self._lookup(key, self._hash_of(key))
+        if not found:
+            return False
+        self._keys[slot] = _DELETED
+        self._hashes[slot] = None
+        self._values[slot] = None
+        self._size -= 1
+        self._deleted += 1
+        self._version += 1
+        return True
+
     def contains(self, key):
         """Check if key exists."""
-        return key in self.map
-    
+        return self._lookup(key, self._hash_of(key))[1]
+
     def size(self):
         """Get size of map."""
-        return len(self.map)
-    
+        return self._size
+
+    def clear(self):
+        """Remove all pairs, keeping the current capacity."""
+        self._allocate(self._capacity)
+        self._size = 0
+        self._deleted = 0
+        self._version += 1
+
+    def capacity(self):
+        """Get number of slots in the table."""
+        return self._capacity
+
+    def load_factor(self):
+        """Get the fraction of slots holding a pair."""
+        return self._size / self._capacity
+
+    def stats(self):
+        """
+        Report how full the table is and how long lookups probe.
+
+        Probe lengths are measured for every stored key, counting the
+        slot the key sits in, so a key in its home slot has length 1.
+        """
+        lengths = []
+        for slot, key in enumerate(self._keys):
+            if key is _EMPTY or key is _DELETED:
+                continue
+            lengths.append(self._lookup(key, self._hashes[slot])[2])
+        return {
+            'size': self._size,
+            'capacity': self._capacity,
+            'load_factor': self._size / self._capacity,
+            'deleted_slots': self._deleted,
+            'resizes': self._resizes,
+            'average_probe_length': sum(lengths) / len(lengths) if lengths else 0.0,
+            'max_probe_length': max(lengths, default=0),
+        }
+
+    def _slots(self):
+        """Yield occupied slots, failing if the map changes meanwhile."""
+        version = self._version
+        keys = self._keys
+        for slot in range(len(keys)):
+            if self._version != version:
+                raise KaynatRuntimeError("Hash map changed during iteration")
+            key = keys[slot]
+            if key is not _EMPTY and key is not _DELETED:
+                yield slot
+        if self._version != version:
+            raise KaynatRuntimeError("Hash map changed during iteration")
+
+    def __getitem__(self, key):
+        slot, found, _ = self._lookup(key, self._hash_of(key))
+        if not found:
+            raise KeyError(key)
+        return self._values[slot]
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        if not self.remove(key):
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        try:
+            return self.contains(key)
+        except KaynatTypeError:
+            return False
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        keys = self._keys
+        for slot in self._slots():
+            yield keys[slot]
+
     def keys(self):
-        """Get all keys."""
-        return list(self.map.keys())
-    
+        """Get a live view of the keys."""
+        return super().keys()
+
     def values(self):
-        """Get all values."""
-        return list(self.map.values())
+        """Get a live view of the values."""
+        return _ValuesView(self)
+
+    def items(self):
+        """Get a live view of the key-value pairs."""
+        return _ItemsView(self)
+
+
+class _ValuesView(ValuesView):
+    """Values read straight from the table's slots."""
+
+    def __iter__(self):
+        values = self._mapping._values
+        for slot in self._mapping._slots():
+            yield values[slot]
+
+
+class _ItemsView(ItemsView):
+    """Pairs read straight from the table's slots."""
+
+    def __iter__(self):
+        keys, values = self._mapping._keys, self._mapping._values
+        for slot in self._mapping._slots():
+            yield keys[slot], values[slot]
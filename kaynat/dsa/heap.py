@@ -1,57 +1,304 @@
-"""Kaynat Heap - Min and Max Heap implementations."""
+"""Kaynat Heap - Min and Max Heap implementations and an indexed priority queue."""
 
 import heapq
+from itertools import count
 
+from kaynat.errors.error_types import (
+    RuntimeError as KaynatRuntimeError, TypeError as KaynatTypeError, ValueError as KaynatValueError
+)
 
-class MinHeap:
-    """Min Heap data structure."""
-    
-    def __init__(self):
+
+class _Reversed:
+    """Wrapper that inverts ordering, so MaxHeap works for any comparable value."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class _BinaryHeap:
+    """
+    Binary heap over a list, shared by MinHeap and MaxHeap.
+
+    With a key function, values are ordered by key(value), computed
+    once on insert; equal keys come out in insertion order.
+    """
+
+    def __init__(self, key=None):
         self.heap = []
-    
+        self.key = key
+        self._counter = count()
+
+    def _entry(self, value):
+        if self.key is None:
+            return value
+        return (self.key(value), next(self._counter), value)
+
+    def _value(self, entry):
+        return entry if self.key is None else entry[2]
+
     def insert(self, value):
         """Insert value into heap."""
-        heapq.heappush(self.heap, value)
-    
-    def extract_min(self):
-        """Extract minimum value."""
+        heapq.heappush(self.heap, self._entry(value))
+
+    def _extract(self):
         if not self.heap:
-            raise RuntimeError("Heap is empty")
-        return heapq.heappop(self.heap)
-    
+            raise KaynatRuntimeError("Heap is empty")
+        return self._value(heapq.heappop(self.heap))
+
     def peek(self):
-        """Peek at minimum value."""
+        """Peek at the value that comes out next."""
         if not self.heap:
-            raise RuntimeError("Heap is empty")
-        return self.heap[0]
-    
+            raise KaynatRuntimeError("Heap is empty")
+        return self._value(self.heap[0])
+
     def size(self):
         """Get size of heap."""
         return len(self.heap)
 
+    def __len__(self):
+        return len(self.heap)
+
+    def __iter__(self):
+        """Iterate values in heap storage order, which is not sorted."""
+        for entry in self.heap:
+            yield self._value(entry)
+
+
+class MinHeap(_BinaryHeap):
+    """Min Heap data structure."""
+
+    def extract_min(self):
+        """Extract minimum value."""
+        return self._extract()
 
-class MaxHeap:
+
+class MaxHeap(_BinaryHeap):
     """Max Heap data structure."""
-    
-    def __init__(self):
-        self.heap = []
-    
-    def insert(self, value):
-        """Insert value into heap."""
-        heapq.heappush(self.heap, -value)
-    
+
+    def _entry(self, value):
+        if self.key is None:
+            return _Reversed(value)
+        return (_Reversed(self.key(value)), next(self._counter), value)
+
+    def _value(self, entry):
+        return entry.value if self.key is None else entry[2]
+
     def extract_max(self):
         """Extract maximum value."""
-        if not self.heap:
-            raise RuntimeError("Heap is empty")
-        return -heapq.heappop(self.heap)
-    
+        return self._extract()
+
+
+class PriorityHandle:
+    """Reference to an entry in a PriorityQueue, used to change or remove it."""
+
+    __slots__ = ('priority', 'order', 'item', 'index')
+
+    def __init__(self, priority, order, item):
+        self.priority = priority
+        self.order = order
+        self.item = item
+        # Position in the heap, or -1 once the entry has left the queue
+        self.index = -1
+
+
+class PriorityQueue:
+    """
+    Indexed binary heap of (priority, item) entries.
+
+    Entries with equal priority come out in the order they were pushed.
+    Every entry has a handle that tracks its position, so changing its
+    priority or removing it takes O(log n). With highest_first the
+    largest priority comes out first.
+    """
+
+    def __init__(self, highest_first=False):
+        self.heap = []
+        self.highest_first = highest_first
+        self._counter = count()
+
+    def _before(self, a, b):
+        if a.priority == b.priority:
+            return a.order < b.order
+        if self.highest_first:
+            return b.priority < a.priority
+        return a.priority < b.priority
+
+    def _comparable(self, priorities):
+        """Check new priorities against the queue before anything changes."""
+        reference = self.heap[0].priority if self.heap else None
+        try:
+            for priority in priorities:
+                if reference is None:
+                    reference = priority
+                priority < reference
+                reference < priority
+        except TypeError:
+            raise KaynatTypeError("Priorities must be comparable with each other")
+
+    def _sift_up(self, index):
+        heap = self.heap
+        entry = heap[index]
+        try:
+            while index > 0:
+                parent = (index - 1) >> 1
+                above = heap[parent]
+                if not self._before(entry, above):
+                    break
+                heap[index] = above
+                above.index = index
+                index = parent
+        finally:
+            # Even if a comparison fails, every entry stays in the heap once
+            heap[index] = entry
+            entry.index = index
+
+    def _sift_down(self, index):
+        heap = self.heap
+        n = len(heap)
+        entry = heap[index]
+        try:
+            while True:
+                child = 2 * index + 1
+                if child >= n:
+                    break
+                right = child + 1
+                if right < n and self._before(heap[right], heap[child]):
+                    child = right
+                below = heap[child]
+                if not self._before(below, entry):
+                    break
+                heap[index] = below
+                below.index = index
+                index = child
+        finally:
+            heap[index] = entry
+            entry.index = index
+
+    def _check(self, handle):
+        if not isinstance(handle, PriorityHandle) or handle.index < 0 \
+                or handle.index >= len(self.heap) or self.heap[handle.index] is not handle:
+            raise KaynatValueError("Handle is not in this priority queue")
+
+    def push(self, item, priority):
+        """Add item with priority and return its handle."""
+        self._comparable((priority,))
+        handle = PriorityHandle(priority, next(self._counter), item)
+        handle.index = len(self.heap)
+        self.heap.append(handle)
+        self._sift_up(handle.index)
+        return handle
+
+    def push_all(self, pairs):
+        """Add many (item, priority) pairs and return their handles."""
+        pairs = list(pairs)
+        self._comparable(priority for _, priority in pairs)
+        handles = [PriorityHandle(priority, next(self._counter), item) for item, priority in pairs]
+        if len(handles) > len(self.heap):
+            # Re-heapifying everything is O(n + k), cheaper than k sift-ups
+            self.heap.extend(handles)
+            self._heapify()
+        else:
+            for handle in handles:
+                handle.index = len(self.heap)
+                self.heap.append(handle)
+                self._sift_up(handle.index)
+        return handles
+
+    def _heapify(self):
+        heap = self.heap
+        for i, handle in enumerate(heap):
+            handle.index = i
+        for i in range(len(heap) // 2 - 1, -1, -1):
+            self._sift_down(i)
+
+    @classmethod
+    def from_pairs(cls, pairs, highest_first=False):
+        """Build a queue from (item, priority) pairs in O(n)."""
+        queue = cls(highest_first)
+        queue.heap = [PriorityHandle(priority, next(queue._counter), item) for item, priority in pairs]
+        queue._comparable(handle.priority for handle in queue.heap)
+        queue._heapify()
+        return queue
+
     def peek(self):
-        """Peek at maximum value."""
+        """Get the (item, priority) that comes out next."""
+        if not self.heap:
+            raise KaynatRuntimeError("Priority queue is empty")
+        top = self.heap[0]
+        return top.item, top.priority
+
+    def pop(self):
+        """Remove and return the (item, priority) that comes out next."""
         if not self.heap:
-            raise RuntimeError("Heap is empty")
-        return -self.heap[0]
-    
+            raise KaynatRuntimeError("Priority queue is empty")
+        return self._remove_at(0)
+
+    def pop_many(self, k):
+        """Remove and return up to k (item, priority) pairs in order."""
+        return [self._remove_at(0) for _ in range(min(k, len(self.heap)))]
+
+    def _remove_at(self, index):
+        heap = self.heap
+        handle = heap[index]
+        last = heap.pop()
+        if last is not handle:
+            heap[index] = last
+            last.index = index
+            self._sift_down(index)
+            if last.index == index:
+                self._sift_up(index)
+        handle.index = -1
+        return handle.item, handle.priority
+
+    def remove(self, handle):
+        """Remove an entry by its handle and return its (item, priority)."""
+        self._check(handle)
+        return self._remove_at(handle.index)
+
+    def change_priority(self, handle, priority):
+        """Give an entry a new priority."""
+        self._check(handle)
+        self._comparable((priority,))
+        handle.priority = priority
+        self._sift_up(handle.index)
+        self._sift_down(handle.index)
+
+    def decrease_key(self, handle, priority):
+        """Lower an entry's priority value."""
+        self._check(handle)
+        self._comparable((priority,))
+        if handle.priority < priority:
+            raise KaynatValueError("New priority is greater than the current one")
+        self.change_priority(handle, priority)
+
+    def increase_key(self, handle, priority):
+        """Raise an entry's priority value."""
+        self._check(handle)
+        self._comparable((priority,))
+        if priority < handle.priority:
+            raise KaynatValueError("New priority is less than the current one")
+        self.change_priority(handle, priority)
+
+    def __contains__(self, handle):
+        return isinstance(handle, PriorityHandle) and 0 <= handle.index < len(self.heap) \
+            and self.heap[handle.index] is handle
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __iter__(self):
+        """Iterate items in heap storage order, which is not sorted."""
+        for handle in self.heap:
+            yield handle.item
+
     def size(self):
-        """Get size of heap."""
+        """Get size of queue."""
         return len(self.heap)
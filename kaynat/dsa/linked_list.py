@@ -1,78 +1,204 @@
 """Kaynat Linked List."""
 
-from kaynat.interpreter.runtime_types import KaynatNumber
+from kaynat.errors.error_types import RuntimeError as KaynatRuntimeError, ValueError as KaynatValueError
 
 
 class Node:
     """Node in linked list."""
+
+    __slots__ = ('value', 'prev', 'next', 'owner')
+
     def __init__(self, value):
         self.value = value
+        self.prev = None
         self.next = None
+        # List holding this node, or None once it has been removed
+        self.owner = None
 
 
 class LinkedList:
-    """Singly linked list."""
-    
-    def __init__(self):
+    """
+    Doubly linked list with head and tail pointers.
+
+    Adding or removing at either end is O(1). Inserting and adding
+    return the new node, which serves as a handle for O(1) removal,
+    insertion next to it, or moving it to either end.
+    """
+
+    def __init__(self, values=None):
         self.head = None
+        self.tail = None
         self._size = 0
-    
-    def append(self, value):
-        """Add node to end."""
-        new_node = Node(value)
-        if not self.head:
-            self.head = new_node
+        if values is not None:
+            for value in values:
+                self.append(value)
+
+    def _check(self, node):
+        if not isinstance(node, Node) or node.owner is not self:
+            raise KaynatValueError("Node is not in this linked list")
+
+    def _link_after(self, before, node):
+        """Link node after before, or at the head when before is None."""
+        node.owner = self
+        node.prev = before
+        if before is None:
+            node.next = self.head
+            self.head = node
+        else:
+            node.next = before.next
+            before.next = node
+        if node.next is None:
+            self.tail = node
         else:
-            current = self.head
-            while current.next:
-                current = current.next
-            current.next = new_node
+            node.next.prev = node
         self._size += 1
-    
+        return node
+
+    def _unlink(self, node):
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        node.prev = node.next = node.owner = None
+        self._size -= 1
+        return node.value
+
+    def append(self, value):
+        """Add node to end and return it."""
+        return self._link_after(self.tail, Node(value))
+
     def prepend(self, value):
-        """Add node to beginning."""
-        new_node = Node(value)
-        new_node.next = self.head
-        self.head = new_node
-        self._size += 1
-    
+        """Add node to beginning and return it."""
+        return self._link_after(None, Node(value))
+
+    def insert_after(self, node, value):
+        """Add a node after node and return it."""
+        self._check(node)
+        return self._link_after(node, Node(value))
+
+    def insert_before(self, node, value):
+        """Add a node before node and return it."""
+        self._check(node)
+        return self._link_after(node.prev, Node(value))
+
+    def remove(self, node):
+        """Remove node and return its value."""
+        self._check(node)
+        return self._unlink(node)
+
+    def move_to_end(self, node):
+        """Move node to the end, as an LRU cache does on each use."""
+        self._check(node)
+        if node is not self.tail:
+            self._unlink(node)
+            self._link_after(self.tail, node)
+
+    def move_to_front(self, node):
+        """Move node to the beginning."""
+        self._check(node)
+        if node is not self.head:
+            self._unlink(node)
+            self._link_after(None, node)
+
+    def pop(self):
+        """Remove and return the last value."""
+        if self.tail is None:
+            raise KaynatRuntimeError("Cannot pop from empty linked list")
+        return self._unlink(self.tail)
+
+    def pop_first(self):
+        """Remove and return the first value."""
+        if self.head is None:
+            raise KaynatRuntimeError("Cannot pop from empty linked list")
+        return self._unlink(self.head)
+
+    def first(self):
+        """Get the first value."""
+        if self.head is None:
+            raise KaynatRuntimeError("Linked list is empty")
+        return self.head.value
+
+    def last(self):
+        """Get the last value."""
+        if self.tail is None:
+            raise KaynatRuntimeError("Linked list is empty")
+        return self.tail.value
+
     def delete(self, value):
-        """Delete first node with value."""
-        if not self.head:
-            return
-        
-        if self.head.value == value:
-            self.head = self.head.next
-            self._size -= 1
-            return
-        
+        """Delete first node with value; return whether one was found."""
+        node = self.find_node(value)
+        if node is None:
+            return False
+        self._unlink(node)
+        return True
+
+    def find_node(self, value):
+        """Find first node with value, or None."""
         current = self.head
-        while current.next:
-            if current.next.value == value:
-                current.next = current.next.next
-                self._size -= 1
-                return
+        while current:
+            if current.value == value:
+                return current
             current = current.next
-    
+        return None
+
     def find(self, value):
         """Find node with value."""
+        node = self.find_node(value)
+        return node.value if node is not None else None
+
+    def clear(self):
+        """Remove all nodes."""
         current = self.head
         while current:
-            if current.value == value:
-                return current.value
-            current = current.next
-        return None
-    
+            following = current.next
+            current.prev = current.next = current.owner = None
+            current = following
+        self.head = self.tail = None
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        # Step ahead before yielding, so the current node may be removed
+        current = self.head
+        while current:
+            following = current.next
+            yield current.value
+            current = following
+
+    def __reversed__(self):
+        current = self.tail
+        while current:
+            following = current.prev
+            yield current.value
+            current = following
+
+    def nodes(self):
+        """Yield each node from head to tail."""
+        current = self.head
+        while current:
+            following = current.next
+            yield current
+            current = following
+
     def size(self):
         """Get size of list."""
+        from kaynat.interpreter.runtime_types import KaynatNumber
         return KaynatNumber(self._size)
-    
+
     def to_list(self):
         """Convert to Kaynat list."""
         from kaynat.interpreter.runtime_types import KaynatList
-        result = []
+        result = [None] * self._size
         current = self.head
+        i = 0
         while current:
-            result.append(current.value)
+            result[i] = current.value
             current = current.next
+            i += 1
         return KaynatList(result)
@@ -1,7 +1,6 @@
 """Kaynat Queue - FIFO data structure."""
 
 from collections import deque
-from kaynat.interpreter.runtime_types import KaynatNumber
 from kaynat.errors.error_types import RuntimeError as KaynatRuntimeError
 
 
@@ -34,12 +33,23 @@ class Queue:
     
     def size(self):
         """Get size of queue."""
+        from kaynat.interpreter.runtime_types import KaynatNumber
         return KaynatNumber(len(self.items))
     
     def clear(self):
         """Clear all items from queue."""
         self.items.clear()
     
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        """Iterate from the front of the queue to the rear."""
+        try:
+            yield from self.items
+        except RuntimeError:
+            raise KaynatRuntimeError("Queue changed during iteration")
+    
     def to_list(self):
         """Convert queue to list."""
         from kaynat.interpreter.runtime_types import KaynatList
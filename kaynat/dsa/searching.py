@@ -1,5 +1,9 @@
 """Kaynat Searching Algorithms."""
 
+import math
+
+from kaynat.dsa.sorting import raw_key
+
 
 def linear_search(arr, target):
     """Linear search algorithm."""
@@ -9,41 +13,51 @@ def linear_search(arr, target):
     return -1
 
 
-def binary_search(arr, target):
-    """Binary search algorithm (requires sorted array)."""
-    left, right = 0, len(arr) - 1
-    
-    while left <= right:
+def binary_search(arr, target, key=None):
+    """
+    Binary search algorithm (requires sorted array).
+
+    Elements and target are compared by key, which defaults to the
+    raw value of Kaynat numbers and strings. Returns the index of the
+    first match, or -1.
+    """
+    key = key if key is not None else raw_key
+    k = key(target)
+    left, right = 0, len(arr)
+    while left < right:
         mid = (left + right) // 2
-        if arr[mid] == target:
-            return mid
-        elif arr[mid] < target:
+        if key(arr[mid]) < k:
             left = mid + 1
         else:
-            right = mid - 1
-    
+            right = mid
+    if left < len(arr) and key(arr[left]) == k:
+        return left
     return -1
 
 
-def jump_search(arr, target):
-    """Jump search algorithm."""
-    import math
+def jump_search(arr, target, key=None):
+    """Jump search algorithm (requires sorted array); compares by key like binary_search."""
+    key = key if key is not None else raw_key
+    k = key(target)
     n = len(arr)
-    step = int(math.sqrt(n))
+    if n == 0:
+        return -1
+    step = int(math.sqrt(n)) or 1
     prev = 0
-    
-    while arr[min(step, n) - 1] < target:
-        prev = step
-        step += int(math.sqrt(n))
+    end = step
+
+    while key(arr[min(end, n) - 1]) < k:
+        prev = end
+        end += step
         if prev >= n:
             return -1
-    
-    while arr[prev] < target:
+
+    while key(arr[prev]) < k:
         prev += 1
-        if prev == min(step, n):
+        if prev == min(end, n):
             return -1
-    
-    if arr[prev] == target:
+
+    if key(arr[prev]) == k:
         return prev
-    
+
     return -1
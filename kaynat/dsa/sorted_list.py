@@ -0,0 +1,146 @@
+"""Kaynat Sorted List - List kept in order by bisection."""
+
+from bisect import bisect_left, bisect_right
+from numbers import Real
+
+from kaynat.dsa.sorting import raw_key
+from kaynat.errors.error_types import (
+    RuntimeError as KaynatRuntimeError, TypeError as KaynatTypeError, ValueError as KaynatValueError
+)
+
+
+class SortedList:
+    """
+    List that stays sorted as values are added.
+
+    Each value's key is computed once, when it is added, and kept in a
+    parallel list that bisect searches, so lookups are O(log n) and an
+    insert is one binary search plus a list shift. Equal keys keep the
+    order they were added in. Without a key function, Kaynat numbers
+    and strings are ordered by their raw values.
+    """
+
+    def __init__(self, values=None, key=None):
+        self.key = key if key is not None else raw_key
+        self.keys = []
+        self.values = []
+        if values is not None:
+            self.add_all(values)
+
+    def add(self, value):
+        """Insert value after any with an equal key; return its index."""
+        k = self.key(value)
+        try:
+            index = bisect_right(self.keys, k)
+        except TypeError:
+            raise KaynatTypeError("Sorted list keys must be comparable with each other")
+        self.keys.insert(index, k)
+        self.values.insert(index, value)
+        return index
+
+    def add_all(self, values):
+        """Insert many values at once."""
+        pairs = [(self.key(value), value) for value in values]
+        if len(pairs) * 8 < len(self.keys):
+            for k, value in pairs:
+                index = bisect_right(self.keys, k)
+                self.keys.insert(index, k)
+                self.values.insert(index, value)
+            return
+        # Re-sorting the whole list is cheaper than many shifting inserts
+        combined = list(zip(self.keys, self.values))
+        combined.extend(pairs)
+        try:
+            combined.sort(key=lambda pair: pair[0])
+        except TypeError:
+            raise KaynatTypeError("Sorted list keys must be comparable with each other")
+        self.keys = [k for k, _ in combined]
+        self.values = [value for _, value in combined]
+
+    def _find(self, value):
+        """Index of value, or -1; compares values only among equal keys."""
+        k = self.key(value)
+        index = bisect_left(self.keys, k)
+        end = bisect_right(self.keys, k, index)
+        for i in range(index, end):
+            if self.values[i] == value:
+                return i
+        return -1
+
+    def remove(self, value):
+        """Remove one occurrence of value; return whether it was found."""
+        index = self._find(value)
+        if index < 0:
+            return False
+        del self.keys[index]
+        del self.values[index]
+        return True
+
+    def pop(self, index=-1):
+        """Remove and return the value at index (the largest by default)."""
+        if not self.values:
+            raise KaynatRuntimeError("Cannot pop from empty sorted list")
+        try:
+            del self.keys[index]
+            return self.values.pop(index)
+        except IndexError:
+            raise KaynatValueError(f"Index {index} out of range")
+
+    def index(self, value):
+        """Get index of value, or -1."""
+        return self._find(value)
+
+    def lower_bound(self, key):
+        """Index of the first value whose key is at least key."""
+        return bisect_left(self.keys, key)
+
+    def upper_bound(self, key):
+        """Index of the first value whose key is greater than key."""
+        return bisect_right(self.keys, key)
+
+    def count_range(self, low, high):
+        """Count values with keys from low to high inclusive."""
+        return max(0, bisect_right(self.keys, high) - bisect_left(self.keys, low))
+
+    def range(self, low, high):
+        """Get values with keys from low to high inclusive, in order."""
+        return self.values[bisect_left(self.keys, low):bisect_right(self.keys, high)]
+
+    def floor(self, key):
+        """Get the last value whose key is at most key, or None."""
+        index = bisect_right(self.keys, key)
+        return self.values[index - 1] if index else None
+
+    def ceiling(self, key):
+        """Get the first value whose key is at least key, or None."""
+        index = bisect_left(self.keys, key)
+        return self.values[index] if index < len(self.values) else None
+
+    def nearest(self, key):
+        """Get the value whose numeric key is closest to key, preferring the smaller on a tie."""
+        if not isinstance(key, Real):
+            raise KaynatTypeError("Nearest requires a numeric key")
+        if not self.values:
+            return None
+        index = bisect_left(self.keys, key)
+        if index == 0:
+            return self.values[0]
+        if index == len(self.values):
+            return self.values[-1]
+        before, after = self.keys[index - 1], self.keys[index]
+        return self.values[index - 1] if key - before <= after - key else self.values[index]
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __contains__(self, value):
+        try:
+            return self._find(value) >= 0
+        except TypeError:
+            return False
@@ -1,5 +1,25 @@
 """Kaynat Sorting Algorithms."""
 
+import heapq
+import os
+import pickle
+import tempfile
+from array import array
+from itertools import repeat
+from operator import itemgetter
+
+from kaynat.errors.error_types import (
+    RuntimeError as KaynatRuntimeError, ValueError as KaynatValueError, FileError
+)
+
+
+# Counting sort beats timsort while the value span stays within this multiple of the length
+COUNTING_SPAN_FACTOR = 2
+# Items sorted in memory per run before external_sort spills to disk
+EXTERNAL_RUN_SIZE = 100000
+# Items pickled together when writing a run
+_SPILL_BATCH = 1024
+
 
 def bubble_sort(arr):
     """Bubble sort algorithm."""
@@ -12,45 +32,71 @@ def bubble_sort(arr):
 
 
 def merge_sort(arr):
-    """Merge sort algorithm."""
-    if len(arr) <= 1:
-        return arr
-    
-    mid = len(arr) // 2
-    left = merge_sort(arr[:mid])
-    right = merge_sort(arr[mid:])
-    
-    return _merge(left, right)
-
-
-def _merge(left, right):
-    result = []
-    i = j = 0
-    
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            result.append(left[i])
-            i += 1
-        else:
-            result.append(right[j])
+    """Merge sort algorithm (bottom-up, one scratch buffer)."""
+    source = list(arr)
+    n = len(source)
+    target = [None] * n
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            _merge(source, target, lo, mid, hi)
+        source, target = target, source
+        width *= 2
+    return source
+
+
+def _merge(source, target, lo, mid, hi):
+    """Merge source[lo:mid] and source[mid:hi] into target[lo:hi]."""
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if source[j] < source[i]:
+            target[k] = source[j]
             j += 1
-    
-    result.extend(left[i:])
-    result.extend(right[j:])
-    return result
+        else:
+            target[k] = source[i]
+            i += 1
+        k += 1
+    if i < mid:
+        target[k:hi] = source[i:mid]
+    else:
+        target[k:hi] = source[j:hi]
 
 
 def quick_sort(arr):
-    """Quick sort algorithm."""
-    if len(arr) <= 1:
-        return arr
-    
-    pivot = arr[len(arr) // 2]
-    left = [x for x in arr if x < pivot]
-    middle = [x for x in arr if x == pivot]
-    right = [x for x in arr if x > pivot]
-    
-    return quick_sort(left) + middle + quick_sort(right)
+    """Quick sort algorithm; returns a new list and leaves arr unchanged."""
+    return quick_sort_in_place(list(arr))
+
+
+def quick_sort_in_place(arr):
+    """Quick sort algorithm (in place, three-way partitioning)."""
+    # Sort the smaller side first so the stack stays O(log n)
+    stack = [(0, len(arr) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        while lo < hi:
+            mid = (lo + hi) // 2
+            a, b, c = arr[lo], arr[mid], arr[hi]
+            pivot = b if (a < b) == (b < c) else (a if (b < a) == (a < c) else c)
+            lt, i, gt = lo, lo, hi
+            while i <= gt:
+                if arr[i] < pivot:
+                    arr[lt], arr[i] = arr[i], arr[lt]
+                    lt += 1
+                    i += 1
+                elif pivot < arr[i]:
+                    arr[i], arr[gt] = arr[gt], arr[i]
+                    gt -= 1
+                else:
+                    i += 1
+            if lt - lo < hi - gt:
+                stack.append((gt + 1, hi))
+                hi = lt - 1
+            else:
+                stack.append((lo, lt - 1))
+                lo = gt + 1
+    return arr
 
 
 def insertion_sort(arr):
@@ -75,3 +121,173 @@ def selection_sort(arr):
                 min_idx = j
         arr[i], arr[min_idx] = arr[min_idx], arr[i]
     return arr
+
+
+def counting_sort(values, reverse=False):
+    """Sort integers by counting each value; O(n + span)."""
+    values = values if isinstance(values, (list, array)) else list(values)
+    if not values:
+        return []
+    lo, hi = min(values), max(values)
+    counts = [0] * (hi - lo + 1)
+    for value in values:
+        counts[value - lo] += 1
+    result = []
+    order = range(len(counts) - 1, -1, -1) if reverse else range(len(counts))
+    for offset in order:
+        if counts[offset]:
+            result.extend(repeat(lo + offset, counts[offset]))
+    return result
+
+
+def radix_sort(values, reverse=False, bits=11):
+    """Sort integers least significant digit first, bits at a time; O(n * width / bits)."""
+    values = list(values)
+    if not values:
+        return values
+    lo = min(values)
+    shifted = [value - lo for value in values]
+    width = max(shifted).bit_length()
+    mask = (1 << bits) - 1
+    shift = 0
+    while shift < width:
+        buckets = [[] for _ in range(mask + 1)]
+        for value in shifted:
+            buckets[(value >> shift) & mask].append(value)
+        shifted = [value for bucket in buckets for value in bucket]
+        shift += bits
+    result = [value + lo for value in shifted]
+    if reverse:
+        result.reverse()
+    return result
+
+
+def sort_integers(values, reverse=False):
+    """
+    Sort integers with counting sort when their span is small, else timsort.
+
+    Counting sort wins while the span is within a small multiple of
+    the length. Beyond that, timsort's C loop beats anything a Python
+    radix sort can do, so it is used instead.
+    """
+    if len(values) > 1:
+        lo, hi = min(values), max(values)
+        if hi - lo <= COUNTING_SPAN_FACTOR * len(values):
+            return counting_sort(values, reverse)
+    return sorted(values, reverse=reverse)
+
+
+def raw_key(item):
+    """Comparable raw value of a number, string or boolean."""
+    return item.value if hasattr(item, 'value') else item
+
+
+def sort_list(lst, key=None, reverse=False):
+    """
+    Sort a KaynatList in place.
+
+    Keys are computed once per element. Lists of numbers stored
+    unboxed are sorted without boxing, using counting sort for
+    integers with a small span.
+    """
+    data = lst.numbers
+    try:
+        if data is not None and key is None:
+            if data.typecode == 'q':
+                ordered = sort_integers(data, reverse)
+            else:
+                ordered = sorted(data, reverse=reverse)
+            data[:] = array(data.typecode, ordered)
+            return lst
+        lst.value.sort(key=key if key is not None else raw_key, reverse=reverse)
+    except TypeError as e:
+        raise KaynatRuntimeError(f"Cannot sort list: {e}")
+    return lst
+
+
+def sort_list_by(lst, keys):
+    """
+    Sort a KaynatList in place by several keys.
+
+    keys is a list of (key function, descending) pairs, most
+    significant first. Each key is applied in its own stable pass, from
+    the least significant up, so ascending and descending keys mix
+    without negating or re-wrapping values.
+    """
+    if not keys:
+        raise KaynatValueError("Sort by requires at least one key")
+    try:
+        for key, descending in reversed(keys):
+            lst.value.sort(key=key, reverse=descending)
+    except TypeError as e:
+        raise KaynatRuntimeError(f"Cannot sort list: {e}")
+    return lst
+
+
+def _spill(pairs, directory):
+    """Write sorted (key, item) pairs to a temporary file and return its path."""
+    handle, path = tempfile.mkstemp(prefix='kaynat-sort-', suffix='.run', dir=directory)
+    try:
+        with os.fdopen(handle, 'wb') as f:
+            for start in range(0, len(pairs), _SPILL_BATCH):
+                pickle.dump(pairs[start:start + _SPILL_BATCH], f, pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        os.remove(path)
+        raise KaynatValueError(f"Cannot spill item to disk: {e}")
+    except OSError as e:
+        os.remove(path)
+        raise FileError(f"Error writing sort run: {e}")
+    return path
+
+
+def _read_run(path):
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+
+def external_sort(items, key=None, reverse=False, run_size=EXTERNAL_RUN_SIZE, directory=None):
+    """
+    Yield items in sorted order, spilling sorted runs to disk.
+
+    At most run_size items are held in memory while reading. Each
+    full run is sorted and written to a temporary file, and the runs
+    are then merged lazily, so the input may be larger than memory.
+    Keys are computed once per item and stored alongside it. Run
+    files are removed when the generator finishes or is closed.
+    """
+    if run_size < 1:
+        raise KaynatValueError("Run size must be at least 1")
+    key = key if key is not None else raw_key
+    runs = []
+    try:
+        pairs = []
+        for item in items:
+            pairs.append((key(item), item))
+            if len(pairs) >= run_size:
+                pairs.sort(key=itemgetter(0), reverse=reverse)
+                runs.append(_spill(pairs, directory))
+                pairs = []
+        pairs.sort(key=itemgetter(0), reverse=reverse)
+
+        if not runs:
+            for _, item in pairs:
+                yield item
+            return
+        # The final run never needs to touch the disk
+        sources = [_read_run(path) for path in runs]
+        sources.append(iter(pairs))
+        for _, item in heapq.merge(*sources, key=itemgetter(0), reverse=reverse):
+            yield item
+    except TypeError as e:
+        raise KaynatRuntimeError(f"Cannot sort items: {e}")
+    finally:
+        for path in runs:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
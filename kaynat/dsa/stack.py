@@ -1,6 +1,5 @@
 """Kaynat Stack - LIFO data structure."""
 
-from kaynat.interpreter.runtime_types import KaynatNumber, KaynatBoolean
 from kaynat.errors.error_types import RuntimeError as KaynatRuntimeError
 
 
@@ -33,12 +32,20 @@ class Stack:
     
     def size(self):
         """Get size of stack."""
+        from kaynat.interpreter.runtime_types import KaynatNumber
         return KaynatNumber(len(self.items))
     
     def clear(self):
         """Clear all items from stack."""
         self.items.clear()
     
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        """Iterate from the top of the stack down."""
+        return reversed(self.items)
+    
     def to_list(self):
         """Convert stack to list."""
         from kaynat.interpreter.runtime_types import KaynatList
@@ -0,0 +1,205 @@
+"""Kaynat Text Search - Substring search algorithms and a suffix array index."""
+
+from array import array
+
+from kaynat.errors.error_types import TypeError as KaynatTypeError, ValueError as KaynatValueError
+
+
+def _check(text, pattern):
+    if isinstance(text, str) != isinstance(pattern, str):
+        raise KaynatTypeError("Text and pattern must both be strings or both be bytes")
+    if len(pattern) == 0:
+        raise KaynatValueError("Pattern cannot be empty")
+
+
+def kmp_table(pattern):
+    """Length of the longest proper prefix of pattern[:i + 1] that is also its suffix, for each i."""
+    table = [0] * len(pattern)
+    k = 0
+    for i in range(1, len(pattern)):
+        while k and pattern[i] != pattern[k]:
+            k = table[k - 1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        table[i] = k
+    return table
+
+
+def kmp_search(text, pattern):
+    """Find every position of pattern in text, overlaps included, with Knuth-Morris-Pratt; O(n + m)."""
+    _check(text, pattern)
+    table = kmp_table(pattern)
+    m = len(pattern)
+    positions = []
+    k = 0
+    # Indexing, unlike iterating, gives ints for an mmap just as for bytes
+    for i in range(len(text)):
+        char = text[i]
+        while k and char != pattern[k]:
+            k = table[k - 1]
+        if char == pattern[k]:
+            k += 1
+            if k == m:
+                positions.append(i - m + 1)
+                k = table[k - 1]
+    return positions
+
+
+def horspool_search(text, pattern):
+    """
+    Find every position of pattern in text, overlaps included, with Boyer-Moore-Horspool.
+
+    Skips ahead by up to the pattern length on a mismatch, so it
+    reads a fraction of the text when the pattern is long.
+    """
+    _check(text, pattern)
+    m = len(pattern)
+    n = len(text)
+    last = m - 1
+    # How far to shift when the character under the window's end is c
+    shift = {}
+    for i in range(last):
+        shift[pattern[i]] = last - i
+    tail = pattern[last]
+    positions = []
+    i = 0
+    while i <= n - m:
+        char = text[i + last]
+        if char == tail and text[i:i + last] == pattern[:last]:
+            positions.append(i)
+        i += shift.get(char, m)
+    return positions
+
+
+def find_all(text, pattern, method='horspool'):
+    """Find every position of pattern in text with method 'kmp' or 'horspool'."""
+    if method == 'kmp':
+        return kmp_search(text, pattern)
+    if method == 'horspool':
+        return horspool_search(text, pattern)
+    raise KaynatValueError(f"Unknown search method: {method}")
+
+
+class SuffixArray:
+    """
+    Suffix array and LCP array over a string or bytes.
+
+    Built once in O(n log^2 n) by prefix doubling, which sorts the
+    suffixes O(log n) times, with the LCP array from Kasai's algorithm
+    in O(n). Each query then binary searches the sorted suffixes in
+    O(m log n) for a pattern of length m.
+    """
+
+    def __init__(self, text):
+        if not isinstance(text, (str, bytes, bytearray, memoryview)):
+            raise KaynatTypeError("Suffix array requires a string or bytes")
+        self.text = bytes(text) if isinstance(text, (bytearray, memoryview)) else text
+        self.suffixes = self._build()
+        self.lcp = self._build_lcp()
+
+    def _build(self):
+        text = self.text
+        n = len(text)
+        if n == 0:
+            return array('q')
+        rank = [ord(c) for c in text] if isinstance(text, str) else list(text)
+        order = list(range(n))
+        k = 1
+        while True:
+            # Order by (rank of the first k, rank of the next k); -1 sorts past the end first
+            stride = max(rank) + 2
+            keys = [rank[i] * stride + (rank[i + k] + 1 if i + k < n else 0) for i in range(n)]
+            order.sort(key=keys.__getitem__)
+            new_rank = [0] * n
+            current = 0
+            previous = keys[order[0]]
+            for i in order:
+                if keys[i] != previous:
+                    current += 1
+                    previous = keys[i]
+                new_rank[i] = current
+            rank = new_rank
+            if current == n - 1 or k >= n:
+                break
+            k *= 2
+        self._rank = rank
+        return array('q', order)
+
+    def _build_lcp(self):
+        text = self.text
+        n = len(text)
+        suffixes = self.suffixes
+        lcp = array('q', bytes(8 * n))
+        if n == 0:
+            return lcp
+        rank = self._rank
+        h = 0
+        for i in range(n):
+            r = rank[i]
+            if r == 0:
+                h = 0
+                continue
+            j = suffixes[r - 1]
+            while i + h < n and j + h < n and text[i + h] == text[j + h]:
+                h += 1
+            lcp[r] = h
+            if h:
+                h -= 1
+        del self._rank
+        return lcp
+
+    def _bounds(self, pattern):
+        """Range [lo, hi) of sorted suffixes that start with pattern."""
+        if isinstance(self.text, str) != isinstance(pattern, str):
+            raise KaynatTypeError("Pattern must match the indexed text's type")
+        text = self.text
+        suffixes = self.suffixes
+        m = len(pattern)
+        lo, hi = 0, len(suffixes)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = suffixes[mid]
+            if text[start:start + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+        hi = len(suffixes)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = suffixes[mid]
+            if text[start:start + m] <= pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def count(self, pattern):
+        """Count occurrences of pattern."""
+        lo, hi = self._bounds(pattern)
+        return hi - lo
+
+    def contains(self, pattern):
+        """Check if pattern occurs in the text."""
+        lo, hi = self._bounds(pattern)
+        return hi > lo
+
+    def positions(self, pattern):
+        """Get every position of pattern in the text, in increasing order."""
+        lo, hi = self._bounds(pattern)
+        return sorted(self.suffixes[lo:hi])
+
+    def longest_repeat(self):
+        """Get the longest substring that occurs at least twice, or an empty one."""
+        lcp = self.lcp
+        if not lcp:
+            return self.text[:0]
+        best = max(range(len(lcp)), key=lcp.__getitem__)
+        start = self.suffixes[best]
+        return self.text[start:start + lcp[best]]
+
+    def __len__(self):
+        return len(self.text)
+
+    def __contains__(self, pattern):
+        return self.contains(pattern)
@@ -1,64 +1,394 @@
-"""Kaynat Trie - Prefix tree."""
+"""Kaynat Trie - Compressed (radix) prefix tree."""
+
+import heapq
+import struct
+import sys
+from array import array
+
+from kaynat.errors.error_types import ValueError as KaynatValueError, FileError
+
+
+TRIE_MAGIC = b'KTRIE1\n'
+_TRIE_HEADER = struct.Struct('<QQ')
 
 
 class TrieNode:
-    def __init__(self):
-        self.children = {}
-        self.is_end_of_word = False
+    __slots__ = ('label', 'children', 'count', 'top')
+
+    def __init__(self, label, count=0):
+        # Characters on the edge leading into this node
+        self.label = label
+        # First character of each child's label -> child, or None for a leaf
+        self.children = None
+        # Frequency of the word ending here, 0 when no word ends here
+        self.count = count
+        # Highest frequency anywhere in this subtree
+        self.top = count
+
+
+def _common_length(a, b):
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def _refresh(node):
+    top = node.count
+    if node.children:
+        for child in node.children.values():
+            if child.top > top:
+                top = child.top
+    node.top = top
 
 
 class Trie:
-    """Trie data structure for string storage."""
-    
+    """
+    Radix trie for string storage.
+
+    Chains of single-child nodes are merged into one edge, so memory
+    grows with the number of words rather than the number of
+    characters. Each word keeps a frequency, which top_k uses to rank
+    completions.
+    """
+
     def __init__(self):
-        self.root = TrieNode()
-    
-    def insert(self, word):
-        """Insert word into trie."""
+        self.root = TrieNode('')
+        self.size = 0
+
+    def insert(self, word, frequency=1):
+        """Insert word into trie, adding frequency to its count."""
+        if frequency <= 0:
+            raise KaynatValueError("Frequency must be positive")
+        node = self.root
+        path = [node]
+        rest = word
+        while rest:
+            if node.children is None:
+                node.children = {}
+            child = node.children.get(rest[0])
+            if child is None:
+                child = TrieNode(rest)
+                node.children[rest[0]] = child
+                node = child
+                path.append(node)
+                rest = ''
+                break
+            label = child.label
+            common = _common_length(label, rest)
+            if common < len(label):
+                # Split the edge where word and label diverge
+                middle = TrieNode(label[:common])
+                child.label = label[common:]
+                middle.children = {child.label[0]: child}
+                middle.top = child.top
+                node.children[rest[0]] = middle
+                child = middle
+            node = child
+            path.append(node)
+            rest = rest[common:]
+
+        if node.count == 0:
+            self.size += 1
+        node.count += frequency
+        count = node.count
+        for item in path:
+            if item.top < count:
+                item.top = count
+
+    def _find(self, word):
+        node = self.root
+        rest = word
+        while rest:
+            if node.children is None:
+                return None
+            child = node.children.get(rest[0])
+            if child is None or not rest.startswith(child.label):
+                return None
+            rest = rest[len(child.label):]
+            node = child
+        return node
+
+    def _locate(self, prefix):
+        """Find the node covering prefix and the full text leading to it."""
         node = self.root
-        for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
-        node.is_end_of_word = True
-    
+        text = ''
+        rest = prefix
+        while rest:
+            if node.children is None:
+                return None, None
+            child = node.children.get(rest[0])
+            if child is None:
+                return None, None
+            label = child.label
+            if rest.startswith(label):
+                rest = rest[len(label):]
+            elif label.startswith(rest):
+                # Prefix ends part way along this edge
+                rest = ''
+            else:
+                return None, None
+            text += label
+            node = child
+        return node, text
+
     def search(self, word):
         """Search for word in trie."""
-        node = self.root
-        for char in word:
-            if char not in node.children:
-                return False
-            node = node.children[char]
-        return node.is_end_of_word
-    
+        node = self._find(word)
+        return node is not None and node.count > 0
+
+    def frequency(self, word):
+        """Get the stored frequency of word, 0 when absent."""
+        node = self._find(word)
+        return node.count if node is not None else 0
+
     def starts_with(self, prefix):
         """Check if any word starts with prefix."""
+        node, _ = self._locate(prefix)
+        return node is not None and node.top > 0
+
+    def delete(self, word):
+        """Delete word from trie; return whether it was found."""
         node = self.root
-        for char in prefix:
-            if char not in node.children:
+        path = [node]
+        rest = word
+        while rest:
+            if node.children is None:
                 return False
-            node = node.children[char]
-        return True
-    
-    def delete(self, word):
-        """Delete word from trie."""
-        def _delete_recursive(node, word, index):
-            if index == len(word):
-                if not node.is_end_of_word:
-                    return False
-                node.is_end_of_word = False
-                return len(node.children) == 0
-            
-            char = word[index]
-            if char not in node.children:
+            child = node.children.get(rest[0])
+            if child is None or not rest.startswith(child.label):
                 return False
-            
-            should_delete = _delete_recursive(node.children[char], word, index + 1)
-            
-            if should_delete:
-                del node.children[char]
-                return len(node.children) == 0
-            
+            rest = rest[len(child.label):]
+            node = child
+            path.append(node)
+        if node.count == 0:
             return False
-        
-        _delete_recursive(self.root, word, 0)
+
+        node.count = 0
+        self.size -= 1
+        if len(path) > 1:
+            parent = path[-2]
+            if not node.children:
+                del parent.children[node.label[0]]
+                if not parent.children:
+                    parent.children = None
+                path.pop()
+                node = parent
+            if node is not self.root and node.count == 0 and node.children and len(node.children) == 1:
+                # Merge a pass-through node into its only child
+                (child,) = node.children.values()
+                child.label = node.label + child.label
+                path[-2].children[child.label[0]] = child
+                path[-1] = child
+        for item in reversed(path):
+            _refresh(item)
+        return True
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, word):
+        return self.search(word)
+
+    def __iter__(self):
+        return self.words()
+
+    def words(self, prefix=''):
+        """Yield every word starting with prefix, in sorted order."""
+        for word, _ in self.items(prefix):
+            yield word
+
+    def items(self, prefix=''):
+        """Yield (word, frequency) for every word starting with prefix, in sorted order."""
+        node, text = self._locate(prefix)
+        if node is None:
+            return
+        stack = [(node, text)]
+        while stack:
+            node, text = stack.pop()
+            if node.count:
+                yield text, node.count
+            children = node.children
+            if children:
+                for key in sorted(children, reverse=True):
+                    child = children[key]
+                    stack.append((child, text + child.label))
+
+    def top_k(self, prefix, k):
+        """
+        Get the k most frequent words starting with prefix.
+
+        Returns (word, frequency) pairs, highest frequency first and
+        alphabetical among equal frequencies. Subtrees whose best word
+        cannot make the cut are never visited.
+        """
+        node, text = self._locate(prefix)
+        if node is None or k <= 0:
+            return []
+        result = []
+        # Entries are (-frequency, text, kind, node); kind 0 is a word, 1 a subtree
+        heap = [(-node.top, text, 1, node)]
+        while heap and len(result) < k:
+            neg, text, kind, node = heapq.heappop(heap)
+            if kind == 0:
+                result.append((text, -neg))
+                continue
+            if node.count:
+                heapq.heappush(heap, (-node.count, text, 0, None))
+            if node.children:
+                for child in node.children.values():
+                    if child.top:
+                        heapq.heappush(heap, (-child.top, text + child.label, 1, child))
+        return result
+
+    @classmethod
+    def from_sorted(cls, words, frequencies=None):
+        """
+        Build a trie from a sorted list of words in one pass.
+
+        Repeated words add up their frequencies. The longest common
+        prefix of a sorted run is the common prefix of its first and
+        last word, so each edge is found without any splitting.
+        """
+        words = list(words)
+        counts = [1] * len(words) if frequencies is None else list(frequencies)
+        if len(counts) != len(words):
+            raise KaynatValueError("Need one frequency per word")
+
+        unique = []
+        totals = []
+        for word, count in zip(words, counts):
+            if count <= 0:
+                raise KaynatValueError("Frequency must be positive")
+            if unique and word == unique[-1]:
+                totals[-1] += count
+                continue
+            if unique and word < unique[-1]:
+                raise KaynatValueError("Words must be in sorted order")
+            unique.append(word)
+            totals.append(count)
+
+        trie = cls()
+        trie.size = len(unique)
+        order = []
+        # Each task is a node and the run of words below it, sharing depth characters
+        tasks = [(trie.root, 0, len(unique), 0)]
+        while tasks:
+            node, lo, hi, depth = tasks.pop()
+            order.append(node)
+            if lo < hi and len(unique[lo]) == depth:
+                node.count = totals[lo]
+                lo += 1
+            if lo < hi:
+                node.children = {}
+            while lo < hi:
+                first = unique[lo][depth]
+                end = lo + 1
+                while end < hi and unique[end][depth] == first:
+                    end += 1
+                common = depth + 1 + _common_length(unique[lo][depth + 1:], unique[end - 1][depth + 1:])
+                child = TrieNode(unique[lo][depth:common])
+                node.children[first] = child
+                tasks.append((child, lo, end, common))
+                lo = end
+        # Parents come before children in order, so walk it backwards to fill in top
+        for node in reversed(order):
+            _refresh(node)
+        return trie
+
+    def save(self, filepath):
+        """Write the trie's nodes to a compact binary file."""
+        labels = []
+        counts = array('q')
+        tops = array('q')
+        branches = array('q')
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            labels.append(node.label)
+            counts.append(node.count)
+            tops.append(node.top)
+            children = node.children
+            branches.append(len(children) if children else 0)
+            if children:
+                stack.extend(children.values())
+
+        label_bytes = bytearray()
+        ends = array('q')
+        for label in labels:
+            label_bytes += label.encode('utf-8')
+            ends.append(len(label_bytes))
+
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(TRIE_MAGIC)
+                f.write(_TRIE_HEADER.pack(len(labels), len(label_bytes)))
+                f.write(label_bytes)
+                for data in (ends, counts, tops, branches):
+                    if sys.byteorder != 'little':
+                        data = array(data.typecode, data)
+                        data.byteswap()
+                    data.tofile(f)
+        except OSError as e:
+            raise FileError(f"Error writing trie: {e}")
+
+    @classmethod
+    def load(cls, filepath):
+        """Read a trie written by save."""
+        try:
+            f = open(filepath, 'rb')
+        except FileNotFoundError:
+            raise FileError(f"File not found: {filepath}")
+        except OSError as e:
+            raise FileError(f"Error reading trie: {e}")
+
+        with f:
+            if f.read(len(TRIE_MAGIC)) != TRIE_MAGIC:
+                raise KaynatValueError(f"Not a Kaynat trie file: {filepath}")
+            try:
+                n, label_size = _TRIE_HEADER.unpack(f.read(_TRIE_HEADER.size))
+                label_bytes = f.read(label_size)
+                if len(label_bytes) != label_size:
+                    raise EOFError("label data is truncated")
+                arrays = []
+                for _ in range(4):
+                    data = array('q')
+                    data.fromfile(f, n)
+                    if sys.byteorder != 'little':
+                        data.byteswap()
+                    arrays.append(data)
+            except (struct.error, EOFError, ValueError) as e:
+                raise KaynatValueError(f"Corrupt trie file {filepath}: {e}")
+
+        ends, counts, tops, branches = arrays
+        trie = cls()
+        if n == 0:
+            return trie
+        # Nodes were written parent first; pending holds parents still owed children
+        pending = []
+        start = 0
+        size = 0
+        try:
+            for i in range(n):
+                label = label_bytes[start:ends[i]].decode('utf-8')
+                start = ends[i]
+                node = TrieNode(label, counts[i])
+                node.top = tops[i]
+                if counts[i]:
+                    size += 1
+                if i == 0:
+                    trie.root = node
+                else:
+                    parent = pending[-1]
+                    parent[0].children[label[0]] = node
+                    parent[1] -= 1
+                    if parent[1] == 0:
+                        pending.pop()
+                if branches[i]:
+                    node.children = {}
+                    pending.append([node, branches[i]])
+        except (IndexError, UnicodeDecodeError) as e:
+            raise KaynatValueError(f"Corrupt trie file {filepath}: {e}")
+        trie.size = size
+        return trie
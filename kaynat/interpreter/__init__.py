@@ -2,6 +2,7 @@
 
 from kaynat.interpreter.interpreter import Interpreter
 from kaynat.interpreter.environment import Environment
+from kaynat.interpreter.metrics import Metrics
 from kaynat.interpreter.runtime_types import *
 
-__all__ = ['Interpreter', 'Environment']
+__all__ = ['Interpreter', 'Environment', 'Metrics']
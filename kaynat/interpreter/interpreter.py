@@ -4,19 +4,23 @@ Kaynat Interpreter - Executes the Abstract Syntax Tree.
 Tree-walking interpreter that evaluates each node.
 """
 
-from typing import Any
+from typing import Any, Optional
+from functools import partial
 from kaynat.lexer.lexer import Lexer
 from kaynat.parser.parser import Parser
 from kaynat.parser.nodes import *
 from kaynat.interpreter.environment import Environment
 from kaynat.interpreter.runtime_types import *
+from kaynat.interpreter.metrics import Metrics
 from kaynat.errors.error_types import RuntimeError as KaynatRuntimeError, TypeError as KaynatTypeError
 import math
 
 # Import all stdlib modules
 from kaynat.stdlib import math_tools
+from kaynat.stdlib import vector_tools
 from kaynat.stdlib import string_tools
 from kaynat.stdlib import list_tools
+from kaynat.stdlib import set_tools
 from kaynat.stdlib import file_tools
 from kaynat.stdlib import date_tools
 from kaynat.stdlib import random_tools
@@ -24,6 +28,8 @@ from kaynat.stdlib import network_tools
 from kaynat.stdlib import json_tools
 from kaynat.stdlib import crypto_tools
 from kaynat.stdlib import pattern_tools
+from kaynat.stdlib import sequence_tools
+from kaynat.stdlib import structure_tools
 
 
 class Interpreter:
@@ -34,10 +40,19 @@ class Interpreter:
     evaluates the node and returns a runtime value.
     """
     
-    def __init__(self):
-        """Initialize the interpreter with a global environment."""
+    def __init__(self, metrics: Optional[Metrics] = None):
+        """
+        Initialize the interpreter with a global environment.
+        
+        Args:
+            metrics: Optional metrics collector; when omitted no
+                instrumentation code runs at all
+        """
         self.global_env = Environment()
         self.current_env = self.global_env
+        self.metrics = metrics
+        if metrics is not None:
+            self.visit = self._visit_with_metrics
         self._setup_builtins()
     
     def _setup_builtins(self):
@@ -76,6 +91,22 @@ class Interpreter:
             'max_value': math_tools.max_value,
             'clamp': math_tools.clamp,
             
+            # Vector tools
+            'vector_add': vector_tools.vector_add,
+            'vector_subtract': vector_tools.vector_subtract,
+            'vector_multiply': vector_tools.vector_multiply,
+            'vector_divide': vector_tools.vector_divide,
+            'vector_greater': vector_tools.vector_greater,
+            'vector_less': vector_tools.vector_less,
+            'vector_equal': vector_tools.vector_equal,
+            'vector_mask': vector_tools.vector_mask,
+            'dot_product': vector_tools.dot_product,
+            'cumulative_sum': vector_tools.cumulative_sum,
+            'vector_mean': vector_tools.vector_mean,
+            'vector_median': vector_tools.vector_median,
+            'vector_variance': vector_tools.vector_variance,
+            'vector_percentile': vector_tools.vector_percentile,
+            
             # String tools
             'to_uppercase': string_tools.to_uppercase,
             'to_lowercase': string_tools.to_lowercase,
@@ -88,6 +119,11 @@ class Interpreter:
             'contains': string_tools.contains,
             'find_position': string_tools.find_position,
             'replace_text': string_tools.replace_text,
+            'find_all_positions': string_tools.find_all_positions,
+            'build_text_index': string_tools.build_text_index,
+            'index_positions': string_tools.index_positions,
+            'index_count': string_tools.index_count,
+            'longest_repeat': string_tools.longest_repeat,
             'split_string': string_tools.split_string,
             'join_strings': string_tools.join_strings,
             'substring': string_tools.substring,
@@ -116,6 +152,7 @@ class Interpreter:
             'list_index_of': list_tools.list_index_of,
             'list_count': list_tools.list_count,
             'list_sort': list_tools.list_sort,
+            'list_sort_by': partial(list_tools.list_sort_by, caller=self.call_function),
             'list_reverse': list_tools.list_reverse,
             'list_copy': list_tools.list_copy,
             'list_clear': list_tools.list_clear,
@@ -124,6 +161,18 @@ class Interpreter:
             'list_max': list_tools.list_max,
             'list_sum': list_tools.list_sum,
             'list_average': list_tools.list_average,
+            'index_list': list_tools.index_list,
+            
+            # Set tools
+            'create_set': set_tools.create_set,
+            'set_add': set_tools.set_add,
+            'set_remove': set_tools.set_remove,
+            'set_contains': set_tools.set_contains,
+            'set_size': set_tools.set_size,
+            'set_union': set_tools.set_union,
+            'set_intersection': set_tools.set_intersection,
+            'set_difference': set_tools.set_difference,
+            'set_to_list': set_tools.set_to_list,
             
             # File tools
             'read_file': file_tools.read_file,
@@ -134,10 +183,24 @@ class Interpreter:
             'delete_file': file_tools.delete_file,
             'copy_file': file_tools.copy_file,
             'move_file': file_tools.move_file,
+            'copy_files': file_tools.copy_files,
+            'move_files': file_tools.move_files,
             'create_directory': file_tools.create_directory,
             'delete_directory': file_tools.delete_directory,
             'directory_exists': file_tools.directory_exists,
             'list_directory': file_tools.list_directory,
+            'list_directory_details': file_tools.list_directory_details,
+            'walk_directory': file_tools.walk_directory,
+            'file_details': file_tools.file_details,
+            'open_reader': file_tools.open_reader,
+            'open_writer': file_tools.open_writer,
+            'open_appender': file_tools.open_appender,
+            'read_next_line': file_tools.read_next_line,
+            'read_chunk': file_tools.read_chunk,
+            'write_line': file_tools.write_line,
+            'flush_file': file_tools.flush_file,
+            'close_file': file_tools.close_file,
+            'map_file': file_tools.map_file,
             
             # Date tools
             'current_date': date_tools.current_date,
@@ -162,6 +225,10 @@ class Interpreter:
             'parse_json': json_tools.parse_json,
             'generate_json': json_tools.generate_json,
             'format_json': json_tools.format_json,
+            'read_json_lines': json_tools.read_json_lines,
+            'read_json_array': json_tools.read_json_array,
+            'write_json': json_tools.write_json,
+            'write_json_lines': json_tools.write_json_lines,
             
             # Crypto tools
             'hash_sha256': crypto_tools.hash_sha256,
@@ -175,8 +242,142 @@ class Interpreter:
             'matches_pattern': pattern_tools.matches_pattern,
             'replace_pattern': pattern_tools.replace_pattern,
             'split_by_pattern': pattern_tools.split_by_pattern,
+            'compile_pattern': pattern_tools.compile_pattern,
+            'find_matches_each': pattern_tools.find_matches_each,
+            'matches_pattern_each': pattern_tools.matches_pattern_each,
+            'replace_pattern_each': pattern_tools.replace_pattern_each,
+            'filter_by_pattern': pattern_tools.filter_by_pattern,
+            'pattern_set': pattern_tools.pattern_set,
+            'match_pattern_set': pattern_tools.match_pattern_set,
+            'match_pattern_set_each': pattern_tools.match_pattern_set_each,
+            'set_pattern_cache_size': pattern_tools.set_pattern_cache_size,
+            'pattern_cache_stats': pattern_tools.pattern_cache_stats,
+            'clear_pattern_cache': pattern_tools.clear_pattern_cache,
             'is_valid_email': pattern_tools.is_valid_email,
             'is_valid_url': pattern_tools.is_valid_url,
+            
+            # Sequence tools (map and filter call back into the interpreter)
+            'lazy_range': sequence_tools.lazy_range,
+            'lazy_map': partial(sequence_tools.lazy_map, caller=self.call_function),
+            'lazy_filter': partial(sequence_tools.lazy_filter, caller=self.call_function),
+            'lazy_take': sequence_tools.lazy_take,
+            'lazy_lines': sequence_tools.lazy_lines,
+            'lazy_split': sequence_tools.lazy_split,
+            'sort_sequence': partial(sequence_tools.sort_sequence, caller=self.call_function),
+            'sequence_to_list': sequence_tools.sequence_to_list,
+            
+            # Structure tools
+            'create_priority_queue': structure_tools.create_priority_queue,
+            'priority_queue_from': structure_tools.priority_queue_from,
+            'priority_push': structure_tools.priority_push,
+            'priority_push_all': structure_tools.priority_push_all,
+            'priority_pop': structure_tools.priority_pop,
+            'priority_pop_many': structure_tools.priority_pop_many,
+            'priority_peek': structure_tools.priority_peek,
+            'priority_change': structure_tools.priority_change,
+            'priority_decrease': structure_tools.priority_decrease,
+            'priority_increase': structure_tools.priority_increase,
+            'priority_remove': structure_tools.priority_remove,
+            'priority_size': structure_tools.priority_size,
+            'create_linked_list': structure_tools.create_linked_list,
+            'linked_append': structure_tools.linked_append,
+            'linked_prepend': structure_tools.linked_prepend,
+            'linked_insert_after': structure_tools.linked_insert_after,
+            'linked_remove': structure_tools.linked_remove,
+            'linked_move_to_end': structure_tools.linked_move_to_end,
+            'linked_move_to_front': structure_tools.linked_move_to_front,
+            'linked_pop': structure_tools.linked_pop,
+            'linked_pop_first': structure_tools.linked_pop_first,
+            'linked_first': structure_tools.linked_first,
+            'linked_last': structure_tools.linked_last,
+            'node_value': structure_tools.node_value,
+            'linked_size': structure_tools.linked_size,
+            'linked_to_list': structure_tools.linked_to_list,
+            'create_sorted_list': partial(structure_tools.create_sorted_list, caller=self.call_function),
+            'sorted_add': structure_tools.sorted_add,
+            'sorted_add_all': structure_tools.sorted_add_all,
+            'sorted_remove': structure_tools.sorted_remove,
+            'sorted_get': structure_tools.sorted_get,
+            'sorted_lower_bound': structure_tools.sorted_lower_bound,
+            'sorted_upper_bound': structure_tools.sorted_upper_bound,
+            'sorted_count_range': structure_tools.sorted_count_range,
+            'sorted_range': structure_tools.sorted_range,
+            'sorted_floor': structure_tools.sorted_floor,
+            'sorted_ceiling': structure_tools.sorted_ceiling,
+            'sorted_nearest': structure_tools.sorted_nearest,
+            'sorted_size': structure_tools.sorted_size,
+            'sorted_to_list': structure_tools.sorted_to_list,
+            'create_stack': structure_tools.create_stack,
+            'stack_push': structure_tools.stack_push,
+            'stack_pop': structure_tools.stack_pop,
+            'stack_peek': structure_tools.stack_peek,
+            'stack_size': structure_tools.stack_size,
+            'stack_to_list': structure_tools.stack_to_list,
+            'create_queue': structure_tools.create_queue,
+            'queue_enqueue': structure_tools.queue_enqueue,
+            'queue_dequeue': structure_tools.queue_dequeue,
+            'queue_peek': structure_tools.queue_peek,
+            'queue_size': structure_tools.queue_size,
+            'queue_to_list': structure_tools.queue_to_list,
+            'create_min_heap': partial(structure_tools.create_min_heap, caller=self.call_function),
+            'create_max_heap': partial(structure_tools.create_max_heap, caller=self.call_function),
+            'heap_insert': structure_tools.heap_insert,
+            'heap_extract': structure_tools.heap_extract,
+            'heap_peek': structure_tools.heap_peek,
+            'heap_size': structure_tools.heap_size,
+            'create_tree': partial(structure_tools.create_tree, caller=self.call_function),
+            'tree_insert': structure_tools.tree_insert,
+            'tree_delete': structure_tools.tree_delete,
+            'tree_contains': structure_tools.tree_contains,
+            'tree_min': structure_tools.tree_min,
+            'tree_max': structure_tools.tree_max,
+            'tree_kth': structure_tools.tree_kth,
+            'tree_rank': structure_tools.tree_rank,
+            'tree_range': structure_tools.tree_range,
+            'tree_size': structure_tools.tree_size,
+            'tree_height': structure_tools.tree_height,
+            'tree_to_list': structure_tools.tree_to_list,
+            'create_graph': structure_tools.create_graph,
+            'graph_add_node': structure_tools.graph_add_node,
+            'graph_add_edge': structure_tools.graph_add_edge,
+            'graph_neighbors': structure_tools.graph_neighbors,
+            'graph_bfs': structure_tools.graph_bfs,
+            'graph_dfs': structure_tools.graph_dfs,
+            'graph_shortest_path': structure_tools.graph_shortest_path,
+            'graph_distances': structure_tools.graph_distances,
+            'graph_bellman_ford': structure_tools.graph_bellman_ford,
+            'graph_topological_sort': structure_tools.graph_topological_sort,
+            'graph_components': structure_tools.graph_components,
+            'graph_strong_components': structure_tools.graph_strong_components,
+            'graph_has_cycle': structure_tools.graph_has_cycle,
+            'graph_spanning_tree': structure_tools.graph_spanning_tree,
+            'graph_prim': structure_tools.graph_prim,
+            'graph_node_count': structure_tools.graph_node_count,
+            'graph_edge_count': structure_tools.graph_edge_count,
+            'graph_load_edges': structure_tools.graph_load_edges,
+            'graph_save': structure_tools.graph_save,
+            'graph_load': structure_tools.graph_load,
+            'create_hash_map': structure_tools.create_hash_map,
+            'hash_put': structure_tools.hash_put,
+            'hash_put_all': structure_tools.hash_put_all,
+            'hash_get': structure_tools.hash_get,
+            'hash_remove': structure_tools.hash_remove,
+            'hash_contains': structure_tools.hash_contains,
+            'hash_size': structure_tools.hash_size,
+            'hash_keys': structure_tools.hash_keys,
+            'hash_values': structure_tools.hash_values,
+            'hash_load_factor': structure_tools.hash_load_factor,
+            'hash_stats': structure_tools.hash_stats,
+            'create_trie': structure_tools.create_trie,
+            'trie_insert': structure_tools.trie_insert,
+            'trie_contains': structure_tools.trie_contains,
+            'trie_delete': structure_tools.trie_delete,
+            'trie_frequency': structure_tools.trie_frequency,
+            'trie_starts_with': structure_tools.trie_starts_with,
+            'trie_words': structure_tools.trie_words,
+            'trie_top': structure_tools.trie_top,
+            'trie_save': structure_tools.trie_save,
+            'trie_load': structure_tools.trie_load,
         }
         
         # Wrap Python functions as Kaynat built-in functions
@@ -203,7 +404,18 @@ class Interpreter:
         ast = parser.parse()
         
         # Execution
-        return self.visit(ast)
+        if self.metrics is None:
+            return self.visit(ast)
+        
+        self.metrics.install()
+        try:
+            return self.visit(ast)
+        finally:
+            self.metrics.uninstall()
+    
+    def close(self):
+        """Release resources the program left open, such as file handles."""
+        file_tools.close_all_files()
     
     def visit(self, node: ASTNode) -> Any:
         """
@@ -219,6 +431,13 @@ class Interpreter:
         method = getattr(self, method_name, self.generic_visit)
         return method(node)
     
+    def _visit_with_metrics(self, node: ASTNode) -> Any:
+        """Visit a node and count it (installed as visit when metrics are on)."""
+        node_type = node.__class__.__name__
+        self.metrics.record_node(node_type)
+        method = getattr(self, f'visit_{node_type}', self.generic_visit)
+        return method(node)
+    
     def generic_visit(self, node: ASTNode):
         """Fallback for unimplemented node types."""
         raise KaynatRuntimeError(
@@ -307,8 +526,10 @@ class Interpreter:
         if node.operator in ('+', 'add', 'plus'):
             if isinstance(left, KaynatNumber) and isinstance(right, KaynatNumber):
                 return KaynatNumber(left.value + right.value)
-            elif isinstance(left, KaynatString) or isinstance(right, KaynatString):
-                return KaynatString(left.to_string() + right.to_string())
+            elif isinstance(left, KaynatString):
+                return left.concat(right.to_string())
+            elif isinstance(right, KaynatString):
+                return KaynatString(left.to_string() + right.value)
             else:
                 raise KaynatTypeError(
                     f"Cannot add {type(left).__name__} and {type(right).__name__}",
@@ -506,9 +727,20 @@ class Interpreter:
         """Execute for each loop."""
         iterable = self.visit(node.iterable)
         
-        if not isinstance(iterable, KaynatList):
+        if isinstance(iterable, KaynatList):
+            elements = iterable.value
+        elif isinstance(iterable, KaynatSequence):
+            # Lazy sequences produce one element at a time
+            elements = iter(iterable)
+        elif isinstance(iterable, KaynatSet):
+            # Snapshot so the loop body may change the set
+            elements = list(iterable.value)
+        elif isinstance(iterable, KaynatStructure):
+            # Walks the structure in place instead of copying it out
+            elements = iterable.iterate()
+        else:
             raise KaynatTypeError(
-                f"Can only iterate over lists, got {type(iterable).__name__}",
+                f"Can only iterate over lists, sets, data structures and sequences, got {type(iterable).__name__}",
                 node.line,
                 node.column
             )
@@ -519,7 +751,7 @@ class Interpreter:
         self.current_env = loop_env
         
         try:
-            for element in iterable.value:
+            for element in elements:
                 loop_env.define(node.variable, element)
                 try:
                     for stmt in node.body:
@@ -530,6 +762,10 @@ class Interpreter:
             pass
         finally:
             self.current_env = prev_env
+            # Release files held by lazy sequences even on early exit
+            close = getattr(elements, 'close', None)
+            if close is not None:
+                close()
         
         return None
     
@@ -564,16 +800,20 @@ class Interpreter:
         prev_env = self.current_env
         self.current_env = loop_env
         
+        # Iterate a C-level range and bind the loop variable directly in
+        # the loop scope instead of going through define() each time
+        variables = loop_env.variables
+        name = node.variable
+        body = node.body
+        
         try:
-            current = start
-            while (step > 0 and current <= end) or (step < 0 and current >= end):
-                loop_env.define(node.variable, KaynatNumber(current))
+            for current in KaynatRange(start, end, step).to_range():
+                variables[name] = KaynatNumber(current)
                 try:
-                    for stmt in node.body:
+                    for stmt in body:
                         self.visit(stmt)
                 except ContinueException:
                     pass
-                current += step
         except BreakException:
             pass
         finally:
@@ -595,23 +835,12 @@ class Interpreter:
         if isinstance(func, KaynatBuiltinFunction):
             # Evaluate arguments
             args = [self.visit(arg) for arg in node.arguments]
+            if self.metrics is not None:
+                self.metrics.record_call(node.name, builtin=True)
             
             try:
                 # Call the Python function
-                result = func.call(*args)
-                # Ensure result is a Kaynat value
-                if not isinstance(result, KaynatValue):
-                    if isinstance(result, bool):
-                        result = KaynatBoolean(result)
-                    elif isinstance(result, (int, float)):
-                        result = KaynatNumber(result)
-                    elif isinstance(result, str):
-                        result = KaynatString(result)
-                    elif isinstance(result, list):
-                        result = KaynatList(result)
-                    elif result is None:
-                        result = KaynatNull()
-                return result
+                return self._box_result(func.call(*args))
             except Exception as e:
                 raise KaynatRuntimeError(
                     f"Error calling built-in function '{node.name}': {str(e)}",
@@ -638,6 +867,28 @@ class Interpreter:
                 node.column
             )
         
+        return self._invoke_user_function(func, args)
+    
+    def _box_result(self, result: Any) -> KaynatValue:
+        """Ensure a built-in function result is a Kaynat value."""
+        if not isinstance(result, KaynatValue):
+            if isinstance(result, bool):
+                result = KaynatBoolean(result)
+            elif isinstance(result, (int, float)):
+                result = KaynatNumber(result)
+            elif isinstance(result, str):
+                result = KaynatString(result)
+            elif isinstance(result, list):
+                result = KaynatList(result)
+            elif result is None:
+                result = KaynatNull()
+        return result
+    
+    def _invoke_user_function(self, func: KaynatFunction, args: list) -> KaynatValue:
+        """Run a user-defined function body with evaluated arguments."""
+        if self.metrics is not None:
+            self.metrics.record_call(func.name)
+        
         # Create new environment for function
         func_env = Environment(func.env)
         for param, arg in zip(func.parameters, args):
@@ -658,6 +909,35 @@ class Interpreter:
         
         return result
     
+    def call_function(self, func: KaynatValue, args: list) -> KaynatValue:
+        """
+        Call a Kaynat function value from Python code.
+        
+        Used by built-ins that take a function argument, such as
+        lazy_map, so they can run user-defined functions.
+        
+        Args:
+            func: KaynatFunction or KaynatBuiltinFunction
+            args: Already evaluated arguments
+            
+        Returns:
+            Result of the call
+        """
+        if isinstance(func, KaynatBuiltinFunction):
+            if self.metrics is not None:
+                self.metrics.record_call(func.name, builtin=True)
+            return self._box_result(func.call(*args))
+        
+        if not isinstance(func, KaynatFunction):
+            raise KaynatTypeError(f"'{func.to_string()}' is not a function")
+        
+        if len(args) != len(func.parameters):
+            raise KaynatRuntimeError(
+                f"Function '{func.name}' expects {len(func.parameters)} arguments, got {len(args)}"
+            )
+        
+        return self._invoke_user_function(func, args)
+    
     def visit_ReturnNode(self, node: ReturnNode) -> None:
         """Execute return statement."""
         value = self.visit(node.value) if node.value else KaynatNull()
@@ -689,6 +969,97 @@ class Interpreter:
         print(output)
         return None
     
+    def visit_CreateStructureNode(self, node: CreateStructureNode) -> None:
+        """Execute create statement for a data structure."""
+        constructors = {
+            'stack': structure_tools.create_stack,
+            'queue': structure_tools.create_queue,
+            'priority queue': structure_tools.create_priority_queue,
+            'min heap': structure_tools.create_min_heap,
+            'max heap': structure_tools.create_max_heap,
+            'binary search tree': structure_tools.create_tree,
+            'tree': structure_tools.create_tree,
+            'graph': structure_tools.create_graph,
+            'hash map': structure_tools.create_hash_map,
+            'trie': structure_tools.create_trie,
+            'linked list': structure_tools.create_linked_list,
+        }
+        self.current_env.define(node.name, constructors[node.kind]())
+        return None
+    
+    def visit_PushNode(self, node: PushNode) -> None:
+        """Execute push or enqueue statement."""
+        target = self.current_env.get(node.target)
+        item = self.visit(node.item)
+        
+        if isinstance(target, KaynatPriorityQueue) and node.operation == 'push':
+            if node.priority is None:
+                raise KaynatTypeError("Pushing onto a priority queue needs a priority", node.line, node.column)
+            structure_tools.priority_push(target, item, self.visit(node.priority))
+            return None
+        
+        if node.priority is not None:
+            raise KaynatTypeError(
+                f"Only priority queues take a priority, got {type(target).__name__}",
+                node.line,
+                node.column
+            )
+        
+        if node.operation == 'enqueue':
+            operations = {
+                KaynatQueue: structure_tools.queue_enqueue,
+                KaynatLinkedList: structure_tools.linked_append,
+            }
+        else:
+            operations = {
+                KaynatStack: structure_tools.stack_push,
+                KaynatQueue: structure_tools.queue_enqueue,
+                KaynatHeap: structure_tools.heap_insert,
+                KaynatLinkedList: structure_tools.linked_append,
+                KaynatSortedList: structure_tools.sorted_add,
+            }
+        operation = operations.get(type(target))
+        if operation is None:
+            raise KaynatTypeError(
+                f"Cannot {node.operation} onto {type(target).__name__}",
+                node.line,
+                node.column
+            )
+        operation(target, item)
+        return None
+    
+    def visit_ExtractNode(self, node: ExtractNode) -> None:
+        """Execute extract, pop or dequeue statement."""
+        target = self.current_env.get(node.target)
+        operations = {
+            'extract': {
+                KaynatPriorityQueue: structure_tools.priority_pop,
+                KaynatHeap: structure_tools.heap_extract,
+            },
+            'pop': {
+                KaynatStack: structure_tools.stack_pop,
+                KaynatPriorityQueue: structure_tools.priority_pop,
+                KaynatHeap: structure_tools.heap_extract,
+                KaynatLinkedList: structure_tools.linked_pop,
+            },
+            'dequeue': {
+                KaynatQueue: structure_tools.queue_dequeue,
+                KaynatLinkedList: structure_tools.linked_pop_first,
+            },
+        }[node.operation]
+        operation = operations.get(type(target))
+        if operation is None:
+            raise KaynatTypeError(
+                f"Cannot {node.operation} from {type(target).__name__}",
+                node.line,
+                node.column
+            )
+        
+        item = operation(target)
+        if node.variable is not None:
+            self.current_env.define(node.variable, item)
+        return None
+    
     def visit_InputNode(self, node: InputNode) -> None:
         """Execute input statement."""
         prompt = f"Enter {node.variable}: "
@@ -840,6 +1211,9 @@ class Interpreter:
                 node.column
             )
         
+        if self.metrics is not None:
+            self.metrics.record_call(f'{obj.blueprint.name}.{node.method_name}')
+        
         # Create environment for method
         method_env = Environment(self.current_env)
         method_env.define('my', obj)  # 'my' refers to current instance
@@ -0,0 +1,196 @@
+"""
+Kaynat Metrics - Optional runtime instrumentation.
+
+Counts node evaluations, function calls, value allocations and
+environment creations while a program runs, and exports them as
+JSON or in the Prometheus text exposition format.
+"""
+
+import gc
+import json
+import time
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from kaynat.interpreter.environment import Environment
+from kaynat.interpreter.runtime_types import KaynatValue
+from kaynat.errors.error_types import FileError, ValueError as KaynatValueError
+
+
+def _plain_new(cls, *args, **kwargs):
+    """Allocate without counting; stands in for a __new__ the class never had."""
+    return object.__new__(cls)
+
+
+class Metrics:
+    """
+    Collects runtime counters for a Kaynat interpreter.
+
+    Metrics are only gathered when an instance is passed to the
+    interpreter, so a plain ``Interpreter()`` pays no cost at all.
+    Allocation and environment counting hook the runtime classes
+    for the duration of ``install()``/``uninstall()``.
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.node_evaluations: Counter = Counter()
+        self.user_calls: Counter = Counter()
+        self.builtin_calls: Counter = Counter()
+        self.allocations: Counter = Counter()
+        self.environments = 0
+        self.elapsed = 0.0
+        self._started: Optional[float] = None
+        self._installed = False
+        self._original_new: Dict[type, Any] = {}
+
+    def record_node(self, node_type: str):
+        """Count one evaluation of an AST node type."""
+        self.node_evaluations[node_type] += 1
+
+    def record_call(self, name: str, builtin: bool = False):
+        """Count one call of a user-defined or built-in function."""
+        if builtin:
+            self.builtin_calls[name] += 1
+        else:
+            self.user_calls[name] += 1
+
+    def install(self):
+        """Start counting value allocations and environment creations."""
+        if self._installed:
+            return
+
+        allocations = self.allocations
+        metrics = self
+
+        def counting_value_new(cls, *args, **kwargs):
+            allocations[cls.__name__] += 1
+            return object.__new__(cls)
+
+        def counting_env_new(cls, *args, **kwargs):
+            metrics.environments += 1
+            return object.__new__(cls)
+
+        # Once a class has had __new__ assigned, deleting it again leaves
+        # object.__new__ rejecting constructor arguments, so remember what
+        # to put back instead
+        for cls in (KaynatValue, Environment):
+            self._original_new[cls] = cls.__dict__.get('__new__')
+        KaynatValue.__new__ = counting_value_new
+        Environment.__new__ = counting_env_new
+        self._installed = True
+        self._started = time.perf_counter()
+
+    def uninstall(self):
+        """Stop counting allocations and restore the runtime classes."""
+        if not self._installed:
+            return
+
+        for cls, original in self._original_new.items():
+            cls.__new__ = original if original is not None else _plain_new
+        self._original_new.clear()
+        self._installed = False
+        if self._started is not None:
+            self.elapsed += time.perf_counter() - self._started
+            self._started = None
+
+    def reset(self):
+        """Clear all counters."""
+        self.node_evaluations.clear()
+        self.user_calls.clear()
+        self.builtin_calls.clear()
+        self.allocations.clear()
+        self.environments = 0
+        self.elapsed = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Build a plain dictionary of all counters.
+
+        Returns:
+            Dictionary suitable for JSON serialization
+        """
+        return {
+            'elapsed_seconds': self.elapsed,
+            'node_evaluations': dict(self.node_evaluations),
+            'node_evaluations_total': sum(self.node_evaluations.values()),
+            'user_calls': dict(self.user_calls),
+            'builtin_calls': dict(self.builtin_calls),
+            'allocations': dict(self.allocations),
+            'allocations_total': sum(self.allocations.values()),
+            'environments_created': self.environments,
+            'gc': {
+                'counts': list(gc.get_count()),
+                'generations': gc.get_stats(),
+            },
+        }
+
+    def to_json(self, indent: int = 2) -> str:
+        """Export counters as a JSON document."""
+        return json.dumps(self.snapshot(), indent=indent, sort_keys=True)
+
+    def to_prometheus(self) -> str:
+        """Export counters in the Prometheus text exposition format."""
+        lines = []
+
+        def counter(name, help_text, samples):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} counter')
+            for label, value in samples:
+                lines.append(f'{name}{label} {value}')
+
+        counter(
+            'kaynat_node_evaluations_total',
+            'AST node evaluations by node type.',
+            [(f'{{node="{k}"}}', v) for k, v in sorted(self.node_evaluations.items())]
+        )
+        counter(
+            'kaynat_function_calls_total',
+            'Function calls by kind and name.',
+            [(f'{{kind="user",name="{k}"}}', v) for k, v in sorted(self.user_calls.items())] +
+            [(f'{{kind="builtin",name="{k}"}}', v) for k, v in sorted(self.builtin_calls.items())]
+        )
+        counter(
+            'kaynat_allocations_total',
+            'Runtime value allocations by type.',
+            [(f'{{type="{k}"}}', v) for k, v in sorted(self.allocations.items())]
+        )
+        counter(
+            'kaynat_environments_created_total',
+            'Variable scopes created.',
+            [('', self.environments)]
+        )
+        counter(
+            'kaynat_gc_collections_total',
+            'Python garbage collections by generation.',
+            [(f'{{generation="{i}"}}', stats['collections']) for i, stats in enumerate(gc.get_stats())]
+        )
+        lines.append('# HELP kaynat_execution_seconds Wall time spent executing programs.')
+        lines.append('# TYPE kaynat_execution_seconds gauge')
+        lines.append(f'kaynat_execution_seconds {self.elapsed}')
+        return '\n'.join(lines) + '\n'
+
+    def export(self, filepath: str, format: str = 'json'):
+        """
+        Write counters to a file.
+
+        Args:
+            filepath: Destination path
+            format: 'json' or 'prometheus'
+
+        Raises:
+            KaynatValueError: If the format is unknown
+            FileError: If the file cannot be written
+        """
+        if format == 'json':
+            content = self.to_json()
+        elif format == 'prometheus':
+            content = self.to_prometheus()
+        else:
+            raise KaynatValueError(f"Unknown metrics format: {format}")
+
+        try:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(content)
+        except OSError as e:
+            raise FileError(f"Error writing metrics: {e}")
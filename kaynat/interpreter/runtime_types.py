@@ -4,8 +4,16 @@ Kaynat Runtime Types - Value representations at runtime.
 Every value in Kaynat has a type and behavior.
 """
 
-from typing import Any, List, Dict, Callable
+import os
+import re
+import json
+from abc import ABCMeta, abstractmethod
+from fnmatch import fnmatch
+from typing import Any, List, Dict, Callable, Optional
 from dataclasses import dataclass
+from array import array
+from collections.abc import MutableSequence, MutableMapping
+from kaynat.errors.error_types import FileError, ValueError as KaynatValueError
 
 
 @dataclass
@@ -40,6 +48,12 @@ class KaynatValue:
 class KaynatNumber(KaynatValue):
     """Numeric value (int or float)."""
     
+    def __eq__(self, other):
+        return other.__class__ is self.__class__ and self.value == other.value
+    
+    def __hash__(self):
+        return hash(self.value)
+    
     def to_string(self) -> str:
         if isinstance(self.value, float) and self.value.is_integer():
             return str(int(self.value))
@@ -48,14 +62,62 @@ class KaynatNumber(KaynatValue):
 
 @dataclass
 class KaynatString(KaynatValue):
-    """String value."""
-    pass
+    """
+    String value.
+    
+    A string built by concatenation keeps its pieces in a buffer shared
+    with the string it was built from, and joins them only when read.
+    Appending to the newest string in a loop is amortized O(1).
+    """
+    
+    def __init__(self, value: str = ''):
+        self._text = value
+        self._parts = None
+        self._count = 0
+    
+    @property
+    def value(self) -> str:
+        if self._text is None:
+            parts = self._parts
+            self._text = ''.join(parts if len(parts) == self._count else parts[:self._count])
+            self._parts = None
+        return self._text
+    
+    @value.setter
+    def value(self, text: str):
+        self._text = text
+        self._parts = None
+    
+    def concat(self, text: str) -> 'KaynatString':
+        """Return this string followed by text."""
+        parts = self._parts
+        if parts is None or len(parts) != self._count:
+            # Not the newest string built on this buffer, so start a new one
+            parts = [self.value]
+        parts.append(text)
+        
+        result = KaynatString(None)
+        result._parts = parts
+        result._count = len(parts)
+        return result
+    
+    def __eq__(self, other):
+        return other.__class__ is self.__class__ and self.value == other.value
+    
+    def __hash__(self):
+        return hash(self.value)
 
 
 @dataclass
 class KaynatBoolean(KaynatValue):
     """Boolean value."""
     
+    def __eq__(self, other):
+        return other.__class__ is self.__class__ and self.value == other.value
+    
+    def __hash__(self):
+        return hash(self.value)
+    
     def to_string(self) -> str:
         return 'true' if self.value else 'false'
 
@@ -67,22 +129,1056 @@ class KaynatNull(KaynatValue):
     def __init__(self):
         super().__init__(None)
     
+    def __eq__(self, other):
+        return other.__class__ is KaynatNull
+    
+    def __hash__(self):
+        return hash(None)
+    
     def to_string(self) -> str:
         return 'nothing'
 
 
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+
+def _numeric_typecode(elements) -> Optional[str]:
+    """
+    Pick an array typecode for a homogeneous list of numbers.
+    
+    Returns 'q' when every element is a 64-bit int, 'd' when every
+    element is a float, and None when the list is empty or mixed.
+    """
+    if not elements:
+        return None
+    
+    first = elements[0]
+    if not isinstance(first, KaynatNumber):
+        return None
+    
+    if type(first.value) is int:
+        for elem in elements:
+            if not isinstance(elem, KaynatNumber) or type(elem.value) is not int:
+                return None
+            if not _INT64_MIN <= elem.value <= _INT64_MAX:
+                return None
+        return 'q'
+    
+    if type(first.value) is float:
+        for elem in elements:
+            if not isinstance(elem, KaynatNumber) or type(elem.value) is not float:
+                return None
+        return 'd'
+    
+    return None
+
+
+class NumericArray(MutableSequence):
+    """
+    Compact storage for a list that holds only numbers.
+    
+    Values live unboxed in an array.array and are wrapped in
+    KaynatNumber only when read. Storing anything that does not fit
+    the array's typecode switches the owning KaynatList back to a
+    plain Python list, so callers never see the difference.
+    """
+    
+    __slots__ = ('owner', 'data')
+    
+    def __init__(self, owner: 'KaynatList', data: array):
+        self.owner = owner
+        self.data = data
+    
+    def _fits(self, item) -> bool:
+        """Check if item can be stored without changing representation."""
+        if not isinstance(item, KaynatNumber):
+            return False
+        if self.data.typecode == 'q':
+            return type(item.value) is int and _INT64_MIN <= item.value <= _INT64_MAX
+        return type(item.value) is float
+    
+    def _generalize(self) -> list:
+        """
+        Switch the owner to a generic list and return it.
+        
+        This wrapper then forwards to the owner's storage, so anything
+        still holding it keeps seeing the same list.
+        """
+        items = [KaynatNumber(x) for x in self.data]
+        self.owner.value = items
+        self.__class__ = _GeneralizedArray
+        return items
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def __iter__(self):
+        return map(KaynatNumber, self.data)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [KaynatNumber(x) for x in self.data[index]]
+        return KaynatNumber(self.data[index])
+    
+    def __setitem__(self, index, item):
+        if isinstance(index, int) and self._fits(item):
+            self.data[index] = item.value
+        else:
+            self._generalize()[index] = item
+    
+    def __delitem__(self, index):
+        del self.data[index]
+    
+    def __contains__(self, item):
+        return isinstance(item, KaynatNumber) and item.value in self.data
+    
+    def __eq__(self, other):
+        if isinstance(other, NumericArray):
+            return self.data == other.data
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return repr(list(self))
+    
+    def insert(self, index, item):
+        if self._fits(item):
+            self.data.insert(index, item.value)
+        else:
+            self._generalize().insert(index, item)
+    
+    def append(self, item):
+        if self._fits(item):
+            self.data.append(item.value)
+        else:
+            self._generalize().append(item)
+    
+    def extend(self, items):
+        if isinstance(items, NumericArray) and items.data.typecode == self.data.typecode:
+            self.data.extend(items.data)
+            return
+        items = list(items)
+        if all(self._fits(item) for item in items):
+            self.data.extend(item.value for item in items)
+        else:
+            self._generalize().extend(items)
+    
+    def pop(self, index=-1):
+        return KaynatNumber(self.data.pop(index))
+    
+    def remove(self, item):
+        if not isinstance(item, KaynatNumber):
+            raise ValueError('item not in list')
+        self.data.remove(item.value)
+    
+    def index(self, item, *args):
+        if not isinstance(item, KaynatNumber):
+            raise ValueError('item not in list')
+        return self.data.index(item.value, *args)
+    
+    def count(self, item):
+        if not isinstance(item, KaynatNumber):
+            return 0
+        return self.data.count(item.value)
+    
+    def clear(self):
+        del self.data[:]
+    
+    def reverse(self):
+        self.data.reverse()
+    
+    def copy(self) -> list:
+        return list(self)
+    
+    def sort(self, key=None, reverse=False):
+        if key is None:
+            self.data[:] = array(self.data.typecode, sorted(self.data, reverse=reverse))
+        else:
+            boxed = sorted(self, key=key, reverse=reverse)
+            self.data[:] = array(self.data.typecode, (item.value for item in boxed))
+
+
+class _ForwardingList(MutableSequence):
+    """
+    Mixin for list storage whose owner has moved to other storage.
+    
+    A storage class that switches its owner to a plain list becomes a
+    subclass mixing this in, so anything still holding it reads and
+    writes the owner's current storage.
+    """
+    
+    __slots__ = ()
+    
+    def __len__(self):
+        return len(self.owner.value)
+    
+    def __iter__(self):
+        return iter(self.owner.value)
+    
+    def __getitem__(self, index):
+        return self.owner.value[index]
+    
+    def __setitem__(self, index, item):
+        self.owner.value[index] = item
+    
+    def __delitem__(self, index):
+        del self.owner.value[index]
+    
+    def __contains__(self, item):
+        return item in self.owner.value
+    
+    def __eq__(self, other):
+        return self.owner.value == other
+    
+    def __repr__(self):
+        return repr(self.owner.value)
+    
+    def insert(self, index, item):
+        self.owner.value.insert(index, item)
+    
+    def append(self, item):
+        self.owner.value.append(item)
+    
+    def extend(self, items):
+        self.owner.value.extend(items)
+    
+    def pop(self, index=-1):
+        return self.owner.value.pop(index)
+    
+    def remove(self, item):
+        self.owner.value.remove(item)
+    
+    def index(self, item, *args):
+        return self.owner.value.index(item, *args)
+    
+    def count(self, item):
+        return self.owner.value.count(item)
+    
+    def clear(self):
+        self.owner.value.clear()
+    
+    def reverse(self):
+        self.owner.value.reverse()
+    
+    def copy(self) -> list:
+        return list(self.owner.value)
+    
+    def sort(self, key=None, reverse=False):
+        self.owner.value.sort(key=key, reverse=reverse)
+
+
+class _GeneralizedArray(_ForwardingList, NumericArray):
+    """A NumericArray whose owner has moved to a plain list."""
+    
+    __slots__ = ()
+
+
 @dataclass
 class KaynatList(KaynatValue):
-    """List value."""
+    """
+    List value.
+    
+    Lists made up only of ints or only of floats are stored in a
+    NumericArray; everything else uses a plain Python list.
+    """
     
     def __init__(self, elements: List[KaynatValue] = None):
-        super().__init__(elements if elements is not None else [])
+        if elements is None:
+            elements = []
+        typecode = _numeric_typecode(elements) if isinstance(elements, list) else None
+        if typecode is not None:
+            elements = NumericArray(self, array(typecode, (elem.value for elem in elements)))
+        super().__init__(elements)
+    
+    @classmethod
+    def from_numbers(cls, values) -> 'KaynatList':
+        """
+        Build a list from raw Python numbers.
+        
+        Uses NumericArray storage when the values are all 64-bit ints
+        or all floats, and boxed KaynatNumbers otherwise.
+        """
+        result = cls()
+        if isinstance(values, array):
+            result.value = NumericArray(result, values)
+            return result
+        
+        values = list(values)
+        kinds = {type(v) for v in values}
+        try:
+            if kinds == {int}:
+                result.value = NumericArray(result, array('q', values))
+                return result
+            if kinds == {float}:
+                result.value = NumericArray(result, array('d', values))
+                return result
+        except OverflowError:
+            pass
+        result.value = [KaynatNumber(v) for v in values]
+        return result
+    
+    @classmethod
+    def from_json(cls, raw: list) -> 'KaynatList':
+        """Wrap a parsed JSON array, boxing elements only when read."""
+        result = cls()
+        result.value = JsonListView(result, raw)
+        return result
+    
+    def append(self, item: KaynatValue):
+        """
+        Add item to the end.
+        
+        A generic list that is empty or holds only numbers of the same
+        kind as item moves to NumericArray storage, so lists built up
+        one append at a time still get unboxed storage.
+        """
+        if type(self.value) is list and isinstance(item, KaynatNumber):
+            typecode = _numeric_typecode([item])
+            if typecode is not None and (not self.value or _numeric_typecode(self.value) == typecode):
+                data = array(typecode, (elem.value for elem in self.value))
+                data.append(item.value)
+                self.value = NumericArray(self, data)
+                return
+        self.value.append(item)
+    
+    @property
+    def numbers(self) -> Optional[array]:
+        """Unboxed number storage, or None for a generic list."""
+        if isinstance(self.value, NumericArray):
+            return self.value.data
+        return None
+    
+    def build_index(self):
+        """Count each element so membership checks and counts are O(1)."""
+        if not isinstance(self.value, IndexedList):
+            self.value = IndexedList(self, list(self.value))
+    
+    @property
+    def indexed(self) -> bool:
+        """Whether membership checks use an index."""
+        return isinstance(self.value, IndexedList)
+    
+    def slice(self, start: int, end: int = None) -> 'KaynatList':
+        """Return a new list with elements from start up to end."""
+        data = self.numbers
+        if data is None:
+            return KaynatList(self.value[start:end])
+        return KaynatList.from_numbers(data[start:end])
+    
+    def copy(self) -> 'KaynatList':
+        """Return a shallow copy of this list."""
+        return self.slice(0)
+    
+    def is_truthy(self) -> bool:
+        return len(self.value) > 0
     
     def to_string(self) -> str:
         elements_str = ', '.join(elem.to_string() for elem in self.value)
         return f'[{elements_str}]'
 
 
+class IndexedList(MutableSequence):
+    """
+    List storage that keeps a count of each element.
+    
+    Membership tests, counts, and misses in index and remove are O(1)
+    for numbers, strings, booleans and nothing. Unhashable elements
+    such as nested lists are only counted in total and fall back to
+    a linear scan.
+    """
+    
+    __slots__ = ('owner', 'items', 'counts', 'unhashable')
+    
+    def __init__(self, owner: KaynatList, items: list):
+        self.owner = owner
+        self.items = items
+        self.counts = {}
+        self.unhashable = 0
+        for item in items:
+            self._add(item)
+    
+    def _add(self, item):
+        try:
+            self.counts[item] = self.counts.get(item, 0) + 1
+        except TypeError:
+            self.unhashable += 1
+    
+    def _discard(self, item):
+        try:
+            remaining = self.counts[item] - 1
+        except TypeError:
+            self.unhashable -= 1
+            return
+        if remaining:
+            self.counts[item] = remaining
+        else:
+            del self.counts[item]
+    
+    def _missing(self, item) -> bool:
+        """Check if item is certainly not in the list."""
+        try:
+            return item not in self.counts
+        except TypeError:
+            return self.unhashable == 0
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        return iter(self.items)
+    
+    def __getitem__(self, index):
+        return self.items[index]
+    
+    def __setitem__(self, index, item):
+        if isinstance(index, slice):
+            item = list(item)
+            for old in self.items[index]:
+                self._discard(old)
+            for new in item:
+                self._add(new)
+        else:
+            self._discard(self.items[index])
+            self._add(item)
+        self.items[index] = item
+    
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            for old in self.items[index]:
+                self._discard(old)
+        else:
+            self._discard(self.items[index])
+        del self.items[index]
+    
+    def __contains__(self, item):
+        if self._missing(item):
+            return False
+        try:
+            hash(item)
+            return True
+        except TypeError:
+            return item in self.items
+    
+    def __eq__(self, other):
+        if isinstance(other, (list, MutableSequence)):
+            return self.items == list(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return repr(self.items)
+    
+    def insert(self, index, item):
+        self.items.insert(index, item)
+        self._add(item)
+    
+    def append(self, item):
+        self.items.append(item)
+        self._add(item)
+    
+    def extend(self, items):
+        items = list(items)
+        self.items.extend(items)
+        for item in items:
+            self._add(item)
+    
+    def pop(self, index=-1):
+        item = self.items.pop(index)
+        self._discard(item)
+        return item
+    
+    def remove(self, item):
+        if self._missing(item):
+            raise ValueError('item not in list')
+        self.items.remove(item)
+        self._discard(item)
+    
+    def index(self, item, *args):
+        if self._missing(item):
+            raise ValueError('item not in list')
+        return self.items.index(item, *args)
+    
+    def count(self, item):
+        try:
+            return self.counts.get(item, 0)
+        except TypeError:
+            return self.items.count(item)
+    
+    def clear(self):
+        self.items.clear()
+        self.counts.clear()
+        self.unhashable = 0
+    
+    def reverse(self):
+        self.items.reverse()
+    
+    def copy(self) -> list:
+        return list(self.items)
+    
+    def sort(self, key=None, reverse=False):
+        self.items.sort(key=key, reverse=reverse)
+
+
+@dataclass
+class KaynatSequence(KaynatValue, metaclass=ABCMeta):
+    """
+    Lazy sequence of values.
+    
+    Elements are produced one at a time when the sequence is iterated,
+    so a for each loop over a sequence runs in constant memory.
+    Subclasses implement __iter__.
+    """
+    
+    def __init__(self):
+        super().__init__(self)
+    
+    @abstractmethod
+    def __iter__(self):
+        """Yield the elements one at a time."""
+    
+    def __eq__(self, other):
+        return self is other
+    
+    __hash__ = object.__hash__
+    
+    def materialize(self) -> 'KaynatList':
+        """Evaluate every element into a list."""
+        return KaynatList(list(self))
+    
+    def to_string(self) -> str:
+        return '<sequence>'
+
+
+def iterate_values(value: KaynatValue):
+    """
+    Iterate the elements of a list or lazy sequence.
+    
+    Raises:
+        TypeError: If value is neither a list nor a sequence
+    """
+    if isinstance(value, KaynatList):
+        return iter(value.value)
+    if isinstance(value, KaynatSequence):
+        return iter(value)
+    raise TypeError(f"Expected a list or sequence, got {type(value).__name__}")
+
+
+def _close_iterator(iterator):
+    """Close a generator so any file it holds is released now."""
+    close = getattr(iterator, 'close', None)
+    if close is not None:
+        close()
+
+
+@dataclass(eq=False)
+class KaynatRange(KaynatSequence):
+    """Inclusive range of integers, like loop from X to Y stepping by Z."""
+    
+    def __init__(self, start: int, end: int, step: int = 1):
+        self.start = start
+        self.end = end
+        self.step = step
+        super().__init__()
+    
+    def to_range(self) -> range:
+        if self.step > 0:
+            return range(self.start, self.end + 1, self.step)
+        if self.step < 0:
+            return range(self.start, self.end - 1, self.step)
+        return range(0)
+    
+    def __iter__(self):
+        return map(KaynatNumber, self.to_range())
+    
+    def __len__(self):
+        return len(self.to_range())
+    
+    def materialize(self) -> 'KaynatList':
+        return KaynatList.from_numbers(self.to_range())
+    
+    def to_string(self) -> str:
+        if self.step == 1:
+            return f'<range {self.start} to {self.end}>'
+        return f'<range {self.start} to {self.end} stepping by {self.step}>'
+
+
+@dataclass(eq=False)
+class KaynatMappedSequence(KaynatSequence):
+    """Sequence that applies a function to each source element on demand."""
+    
+    def __init__(self, source: KaynatValue, func: KaynatValue, caller: Callable):
+        self.source = source
+        self.func = func
+        self.caller = caller
+        super().__init__()
+    
+    def __iter__(self):
+        iterator = iterate_values(self.source)
+        try:
+            for item in iterator:
+                yield self.caller(self.func, [item])
+        finally:
+            _close_iterator(iterator)
+    
+    def to_string(self) -> str:
+        return '<mapped sequence>'
+
+
+@dataclass(eq=False)
+class KaynatFilteredSequence(KaynatSequence):
+    """Sequence of the source elements for which a function is truthy."""
+    
+    def __init__(self, source: KaynatValue, func: KaynatValue, caller: Callable):
+        self.source = source
+        self.func = func
+        self.caller = caller
+        super().__init__()
+    
+    def __iter__(self):
+        iterator = iterate_values(self.source)
+        try:
+            for item in iterator:
+                if self.caller(self.func, [item]).is_truthy():
+                    yield item
+        finally:
+            _close_iterator(iterator)
+    
+    def to_string(self) -> str:
+        return '<filtered sequence>'
+
+
+@dataclass(eq=False)
+class KaynatTakeSequence(KaynatSequence):
+    """Sequence of at most count elements from the start of a source."""
+    
+    def __init__(self, source: KaynatValue, count: int):
+        self.source = source
+        self.count = count
+        super().__init__()
+    
+    def __iter__(self):
+        iterator = iterate_values(self.source)
+        try:
+            for _, item in zip(range(self.count), iterator):
+                yield item
+        finally:
+            _close_iterator(iterator)
+    
+    def to_string(self) -> str:
+        return f'<first {self.count} of sequence>'
+
+
+@dataclass(eq=False)
+class KaynatSortedSequence(KaynatSequence):
+    """
+    Elements of a source in sorted order.
+    
+    sorter turns an iterator of the source elements into an iterator
+    of them in order; the sort runs again each time iteration starts.
+    """
+    
+    def __init__(self, source: KaynatValue, sorter: Callable):
+        self.source = source
+        self.sorter = sorter
+        super().__init__()
+    
+    def __iter__(self):
+        iterator = iterate_values(self.source)
+        try:
+            yield from self.sorter(iterator)
+        finally:
+            _close_iterator(iterator)
+    
+    def to_string(self) -> str:
+        return '<sorted sequence>'
+
+
+@dataclass(eq=False)
+class KaynatLineSequence(KaynatSequence):
+    """
+    Lines of a text file, read one at a time.
+    
+    The file is opened when iteration starts and closed as soon as it
+    finishes or the loop stops early.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        super().__init__()
+    
+    def __iter__(self):
+        try:
+            f = open(self.path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            raise FileError(f"File not found: {self.path}")
+        except OSError as e:
+            raise FileError(f"Error reading file: {e}")
+        
+        with f:
+            for line in f:
+                yield KaynatString(line.rstrip('\n'))
+    
+    def to_string(self) -> str:
+        return f'<lines of {self.path}>'
+
+
+@dataclass(eq=False)
+class KaynatFileHandle(KaynatSequence):
+    """
+    Open file.
+    
+    Iterating a handle opened for reading yields its remaining lines.
+    The file stays open until it is closed explicitly or the program
+    finishes.
+    """
+    
+    def __init__(self, path: str, mode: str, file):
+        self.path = path
+        self.mode = mode
+        self.file = file
+        super().__init__()
+    
+    @property
+    def closed(self) -> bool:
+        return self.file.closed
+    
+    def __iter__(self):
+        if self.closed:
+            raise FileError(f"File is closed: {self.path}")
+        for line in self.file:
+            yield KaynatString(line.rstrip('\n'))
+    
+    def close(self):
+        """Close the underlying file, flushing buffered writes."""
+        if not self.file.closed:
+            self.file.close()
+    
+    def is_truthy(self) -> bool:
+        return not self.closed
+    
+    def to_string(self) -> str:
+        state = 'closed' if self.closed else self.mode
+        return f'<file {self.path} ({state})>'
+
+
+@dataclass
+class KaynatMappedFile(KaynatValue):
+    """
+    Read-only memory-mapped file.
+    
+    Supports length, slicing and searching directly over the mapped
+    bytes, so scanning a large file never copies it into a string.
+    Positions and lengths are byte offsets, which match character
+    positions for ASCII text.
+    """
+    
+    def __init__(self, path: str, file, data):
+        self.path = path
+        self.file = file
+        self.data = data
+        self.closed = False
+        super().__init__(self)
+    
+    def __eq__(self, other):
+        return self is other
+    
+    __hash__ = object.__hash__
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def find(self, text: str, start: int = 0) -> int:
+        """Byte offset of the first occurrence of text, or -1."""
+        return self.data.find(text.encode('utf-8'), start)
+    
+    def rfind(self, text: str) -> int:
+        """Byte offset of the last occurrence of text, or -1."""
+        return self.data.rfind(text.encode('utf-8'))
+    
+    def slice(self, start: int, end: int = None) -> str:
+        """Decode the bytes from start up to end."""
+        return self.data[start:end].decode('utf-8', errors='replace')
+    
+    def close(self):
+        """Unmap and close the file."""
+        if not self.closed:
+            if hasattr(self.data, 'close'):
+                self.data.close()
+            self.file.close()
+            self.closed = True
+    
+    def is_truthy(self) -> bool:
+        return len(self.data) > 0
+    
+    def to_string(self) -> str:
+        if self.closed:
+            return f'<mapped file {self.path} (closed)>'
+        return f'<mapped file {self.path} ({len(self.data)} bytes)>'
+
+
+@dataclass(eq=False)
+class KaynatSplitSequence(KaynatSequence):
+    """Parts of a string split on a separator, found one at a time."""
+    
+    def __init__(self, text: str, separator: str):
+        self.text = text
+        self.separator = separator
+        super().__init__()
+    
+    def __iter__(self):
+        text = self.text
+        sep = self.separator
+        start = 0
+        while True:
+            end = text.find(sep, start)
+            if end == -1:
+                yield KaynatString(text[start:])
+                return
+            yield KaynatString(text[start:end])
+            start = end + len(sep)
+    
+    def to_string(self) -> str:
+        return '<split sequence>'
+
+
+def entry_type(entry) -> str:
+    """Classify an os.DirEntry without following symlinks."""
+    if entry.is_symlink():
+        return 'link'
+    if entry.is_dir(follow_symlinks=False):
+        return 'directory'
+    if entry.is_file(follow_symlinks=False):
+        return 'file'
+    return 'other'
+
+
+def entry_details(path: str, name: str, kind: str, stat_result) -> 'KaynatMap':
+    """Build the map describing one directory entry."""
+    return KaynatMap({
+        'path': KaynatString(path),
+        'name': KaynatString(name),
+        'type': KaynatString(kind),
+        'size': KaynatNumber(stat_result.st_size),
+        'modified': KaynatNumber(stat_result.st_mtime),
+    })
+
+
+@dataclass(eq=False)
+class KaynatDirectoryWalk(KaynatSequence):
+    """
+    Entries under a directory, found with os.scandir.
+    
+    Each entry is a map of path, name, type, size and modified time,
+    taken from a single scan so no extra calls per entry are needed.
+    Only one directory is open at a time; subdirectories are queued
+    by path, so very large trees are walked in constant file handles.
+    Symlinked directories are reported but not followed.
+    """
+    
+    def __init__(self, path: str, pattern: Optional[str] = None, recursive: bool = True):
+        self.path = path
+        self.pattern = pattern
+        self.recursive = recursive
+        super().__init__()
+    
+    def _matches(self, name: str, relative: str) -> bool:
+        if self.pattern is None:
+            return True
+        if '/' in self.pattern:
+            return fnmatch(relative, self.pattern)
+        return fnmatch(name, self.pattern)
+    
+    def __iter__(self):
+        try:
+            root = os.scandir(self.path)
+        except FileNotFoundError:
+            raise FileError(f"Directory not found: {self.path}")
+        except OSError as e:
+            raise FileError(f"Error listing directory: {e}")
+        
+        pending = []
+        scanner, prefix = root, ''
+        while True:
+            subdirs = []
+            with scanner:
+                for entry in scanner:
+                    relative = prefix + entry.name
+                    kind = entry_type(entry)
+                    if kind == 'directory' and self.recursive:
+                        subdirs.append((entry.path, relative + '/'))
+                    if not self._matches(entry.name, relative):
+                        continue
+                    try:
+                        info = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    yield entry_details(entry.path, entry.name, kind, info)
+            
+            pending.extend(reversed(subdirs))
+            scanner = None
+            while pending and scanner is None:
+                dirpath, prefix = pending.pop()
+                try:
+                    scanner = os.scandir(dirpath)
+                except OSError:
+                    continue
+            if scanner is None:
+                return
+    
+    def to_string(self) -> str:
+        return f'<entries of {self.path}>'
+
+
+
+# Characters read at a time by the incremental JSON array reader
+JSON_CHUNK_SIZE = 1 << 16
+# Characters that can follow a complete value inside an array
+_JSON_DELIMITERS = ' \t\r\n,]'
+
+
+@dataclass(eq=False)
+class KaynatJsonLines(KaynatSequence):
+    """
+    Records of a JSON-lines file, parsed one line at a time.
+    
+    Blank lines are skipped. convert turns each parsed Python object
+    into a Kaynat value.
+    """
+    
+    def __init__(self, path: str, convert: Callable):
+        self.path = path
+        self.convert = convert
+        super().__init__()
+    
+    def __iter__(self):
+        try:
+            f = open(self.path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            raise FileError(f"File not found: {self.path}")
+        except OSError as e:
+            raise FileError(f"Error reading file: {e}")
+        
+        decode = json.loads
+        with f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = decode(line)
+                except json.JSONDecodeError as e:
+                    raise KaynatValueError(f"Invalid JSON on line {number} of {self.path}: {e}")
+                yield self.convert(record)
+    
+    def to_string(self) -> str:
+        return f'<json lines of {self.path}>'
+
+
+@dataclass(eq=False)
+class KaynatJsonArray(KaynatSequence):
+    """
+    Elements of a file holding one top-level JSON array.
+    
+    The file is read in chunks and each element is decoded as soon as
+    it is complete, so only one element is held in memory at a time.
+    """
+    
+    def __init__(self, path: str, convert: Callable):
+        self.path = path
+        self.convert = convert
+        super().__init__()
+    
+    def _invalid(self, message: str):
+        return KaynatValueError(f"Invalid JSON array in {self.path}: {message}")
+    
+    def __iter__(self):
+        try:
+            f = open(self.path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            raise FileError(f"File not found: {self.path}")
+        except OSError as e:
+            raise FileError(f"Error reading file: {e}")
+        
+        decode = json.JSONDecoder().raw_decode
+        with f:
+            buf = ''
+            pos = 0
+            eof = False
+            
+            def fill(pos, buf, size=JSON_CHUNK_SIZE):
+                """Drop consumed text and read more."""
+                chunk = f.read(size)
+                return 0, buf[pos:] + chunk, not chunk
+            
+            def skip_space(pos, buf, eof):
+                while True:
+                    while pos < len(buf) and buf[pos] in ' \t\r\n':
+                        pos += 1
+                    if pos < len(buf) or eof:
+                        return pos, buf, eof
+                    pos, buf, eof = fill(pos, buf)
+            
+            pos, buf, eof = skip_space(pos, buf, eof)
+            if pos >= len(buf) or buf[pos] != '[':
+                raise self._invalid("expected '['")
+            pos += 1
+            
+            expect_value = True
+            first = True
+            while True:
+                pos, buf, eof = skip_space(pos, buf, eof)
+                if pos >= len(buf):
+                    raise self._invalid("unexpected end of file")
+                
+                char = buf[pos]
+                if char == ']' and (first or not expect_value):
+                    pos += 1
+                    break
+                if not expect_value:
+                    if char != ',':
+                        raise self._invalid(f"expected ',' or ']' at offset {pos}")
+                    pos += 1
+                    expect_value = True
+                    continue
+                
+                # A value cut at the end of the buffer may still decode
+                # (a number split after '.' or 'e' reads as a shorter one),
+                # so a scalar only counts once a delimiter follows it
+                while True:
+                    try:
+                        value, end = decode(buf, pos)
+                    except json.JSONDecodeError as e:
+                        if eof:
+                            raise self._invalid(str(e))
+                        pos, buf, eof = fill(pos, buf, max(JSON_CHUNK_SIZE, len(buf)))
+                        continue
+                    if not eof and (end == len(buf) or (
+                            buf[end - 1] not in '"]}' and buf[end] not in _JSON_DELIMITERS)):
+                        pos, buf, eof = fill(pos, buf, max(JSON_CHUNK_SIZE, len(buf)))
+                        continue
+                    break
+                
+                pos = end
+                expect_value = False
+                first = False
+                yield self.convert(value)
+                
+                if pos > JSON_CHUNK_SIZE:
+                    buf = buf[pos:]
+                    pos = 0
+            
+            pos, buf, eof = skip_space(pos, buf, eof)
+            if pos < len(buf):
+                raise self._invalid(f"unexpected data after array at offset {pos}")
+    
+    def to_string(self) -> str:
+        return f'<json array of {self.path}>'
+
+
 @dataclass
 class KaynatMap(KaynatValue):
     """Dictionary/map value."""
@@ -90,11 +1186,529 @@ class KaynatMap(KaynatValue):
     def __init__(self, pairs: Dict[str, KaynatValue] = None):
         super().__init__(pairs if pairs is not None else {})
     
+    @classmethod
+    def from_json(cls, raw: dict) -> 'KaynatMap':
+        """Wrap a parsed JSON object, boxing values only when read."""
+        result = cls()
+        result.value = JsonMapView(result, raw)
+        return result
+    
     def to_string(self) -> str:
         pairs_str = ', '.join(f'{k}: {v.to_string()}' for k, v in self.value.items())
         return f'{{{pairs_str}}}'
 
 
+@dataclass
+class KaynatSet(KaynatValue):
+    """
+    Set of numbers, strings, booleans and nothing.
+    
+    Stored as a dict so items keep the order they were added in.
+    """
+    
+    def __init__(self, items=None):
+        super().__init__(dict.fromkeys(items) if items is not None else {})
+    
+    def is_truthy(self) -> bool:
+        return len(self.value) > 0
+    
+    def to_string(self) -> str:
+        items_str = ', '.join(item.to_string() for item in self.value)
+        return f'{{{items_str}}}'
+
+
+def box_json(obj: Any) -> KaynatValue:
+    """
+    Wrap one parsed JSON value.
+    
+    Scalars are boxed directly; arrays and objects become lazy views
+    so their contents are only boxed when a program reads them.
+    """
+    if obj is None:
+        return KaynatNull()
+    if isinstance(obj, bool):
+        return KaynatBoolean(obj)
+    if isinstance(obj, (int, float)):
+        return KaynatNumber(obj)
+    if isinstance(obj, str):
+        return KaynatString(obj)
+    if isinstance(obj, list):
+        return KaynatList.from_json(obj)
+    if isinstance(obj, dict):
+        return KaynatMap.from_json(obj)
+    return KaynatString(str(obj))
+
+
+class JsonListView(MutableSequence):
+    """
+    List storage backed by a parsed JSON array.
+    
+    Elements are boxed on first read and cached so repeated reads give
+    the same value. Any change to the list switches the owning
+    KaynatList to a plain Python list first, and the view then
+    forwards to that list, as NumericArray does.
+    """
+    
+    __slots__ = ('owner', 'raw', 'boxed')
+    
+    def __init__(self, owner: KaynatList, raw: list):
+        self.owner = owner
+        self.raw = raw
+        self.boxed = {}
+    
+    def _box(self, index: int) -> KaynatValue:
+        if index < 0:
+            index += len(self.raw)
+        item = self.boxed.get(index)
+        if item is None:
+            item = box_json(self.raw[index])
+            self.boxed[index] = item
+        return item
+    
+    def _generalize(self) -> list:
+        """Switch the owner to a generic list and return it."""
+        return self._detach([self._box(i) for i in range(len(self.raw))])
+    
+    def _detach(self, items: list) -> list:
+        """Give the owner items as its storage and forward to it from now on."""
+        self.owner.value = items
+        self.__class__ = _GeneralizedJsonList
+        return items
+    
+    def unwrap(self, convert: Callable) -> list:
+        """
+        Get the plain Python list, using convert for elements read so far.
+        
+        When nothing has been read the original parsed list is returned
+        without walking it.
+        """
+        if not self.boxed:
+            return self.raw
+        boxed = self.boxed
+        return [convert(boxed[i]) if i in boxed else item for i, item in enumerate(self.raw)]
+    
+    def __len__(self):
+        return len(self.raw)
+    
+    def __iter__(self):
+        return map(self._box, range(len(self.raw)))
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._box(i) for i in range(*index.indices(len(self.raw)))]
+        return self._box(index)
+    
+    def __setitem__(self, index, item):
+        self._generalize()[index] = item
+    
+    def __delitem__(self, index):
+        del self._generalize()[index]
+    
+    def __eq__(self, other):
+        if isinstance(other, (list, MutableSequence)):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return repr(list(self))
+    
+    def insert(self, index, item):
+        self._generalize().insert(index, item)
+    
+    def append(self, item):
+        self._generalize().append(item)
+    
+    def extend(self, items):
+        self._generalize().extend(items)
+    
+    def pop(self, index=-1):
+        return self._generalize().pop(index)
+    
+    def remove(self, item):
+        self._generalize().remove(item)
+    
+    def clear(self):
+        self._detach([])
+    
+    def reverse(self):
+        self._generalize().reverse()
+    
+    def copy(self) -> list:
+        return list(self)
+    
+    def sort(self, key=None, reverse=False):
+        self._generalize().sort(key=key, reverse=reverse)
+
+
+class _GeneralizedJsonList(_ForwardingList, JsonListView):
+    """A JsonListView whose owner has moved to a plain list."""
+    
+    __slots__ = ()
+    
+    def unwrap(self, convert: Callable) -> list:
+        return [convert(item) for item in self.owner.value]
+
+
+class JsonMapView(MutableMapping):
+    """
+    Map storage backed by a parsed JSON object.
+    
+    Values are boxed on first read and cached. Any change to the map
+    switches the owning KaynatMap to a plain dict first, and the view
+    then forwards to that dict.
+    """
+    
+    __slots__ = ('owner', 'raw', 'boxed')
+    
+    def __init__(self, owner: KaynatMap, raw: dict):
+        self.owner = owner
+        self.raw = raw
+        self.boxed = {}
+    
+    def _generalize(self) -> dict:
+        """Switch the owner to a generic dict and forward to it from now on."""
+        pairs = {key: self[key] for key in self.raw}
+        self.owner.value = pairs
+        self.__class__ = _GeneralizedJsonMap
+        return pairs
+    
+    def unwrap(self, convert: Callable) -> dict:
+        """
+        Get the plain Python dict, using convert for values read so far.
+        
+        When nothing has been read the original parsed dict is returned
+        without walking it.
+        """
+        if not self.boxed:
+            return self.raw
+        boxed = self.boxed
+        return {k: convert(boxed[k]) if k in boxed else v for k, v in self.raw.items()}
+    
+    def __len__(self):
+        return len(self.raw)
+    
+    def __iter__(self):
+        return iter(self.raw)
+    
+    def __contains__(self, key):
+        return key in self.raw
+    
+    def __getitem__(self, key):
+        item = self.boxed.get(key)
+        if item is None:
+            item = box_json(self.raw[key])
+            self.boxed[key] = item
+        return item
+    
+    def __setitem__(self, key, item):
+        self._generalize()[key] = item
+    
+    def __delitem__(self, key):
+        del self._generalize()[key]
+    
+    def __repr__(self):
+        return repr(dict(self.items()))
+    
+    def copy(self) -> dict:
+        return dict(self.items())
+
+
+class _GeneralizedJsonMap(JsonMapView):
+    """A JsonMapView whose owner has moved to a plain dict; forwards to it."""
+    
+    __slots__ = ()
+    
+    def unwrap(self, convert: Callable) -> dict:
+        return {key: convert(item) for key, item in self.owner.value.items()}
+    
+    def __len__(self):
+        return len(self.owner.value)
+    
+    def __iter__(self):
+        return iter(self.owner.value)
+    
+    def __contains__(self, key):
+        return key in self.owner.value
+    
+    def __getitem__(self, key):
+        return self.owner.value[key]
+    
+    def __setitem__(self, key, item):
+        self.owner.value[key] = item
+    
+    def __delitem__(self, key):
+        del self.owner.value[key]
+    
+    def __repr__(self):
+        return repr(self.owner.value)
+    
+    def copy(self) -> dict:
+        return dict(self.owner.value)
+
+
+@dataclass
+class KaynatPattern(KaynatValue):
+    """
+    Compiled regular expression.
+    
+    The value is the pattern source, so a compiled pattern can be
+    passed anywhere a pattern string is accepted. The bytes form used
+    for mapped files is compiled on first use.
+    """
+    
+    def __init__(self, source: str, regex):
+        self.regex = regex
+        self._bytes_regex = None
+        super().__init__(source)
+    
+    @property
+    def bytes_regex(self):
+        """The pattern compiled for matching bytes."""
+        if self._bytes_regex is None:
+            self._bytes_regex = re.compile(self.value.encode('utf-8'), self.regex.flags & ~re.UNICODE)
+        return self._bytes_regex
+    
+    def to_string(self) -> str:
+        return f'<pattern {self.value}>'
+
+
+@dataclass
+class KaynatPatternSet(KaynatValue):
+    """
+    Many patterns compiled into one matcher.
+    
+    Literal patterns go into a LiteralMatcher and regexes into one
+    alternation with a named group per pattern, so a line is checked
+    against every pattern in a single pass.
+    """
+    
+    def __init__(self, keys: List[KaynatValue], literals, combined, groups: Dict[str, int],
+                 regexes: List[tuple], separate: List[tuple]):
+        self.keys = keys
+        self.literals = literals
+        self.combined = combined
+        self.groups = groups
+        self.regexes = regexes
+        self.separate = separate
+        super().__init__(self)
+    
+    def __eq__(self, other):
+        return self is other
+    
+    __hash__ = object.__hash__
+    
+    def match_indexes(self, text: str) -> List[int]:
+        """Positions in keys of every pattern found in text, in order."""
+        found = self.literals.find_keys(text) if self.literals is not None else set()
+        
+        if self.combined is not None:
+            reported = set()
+            for match in self.combined.finditer(text):
+                reported.add(self.groups[match.lastgroup])
+            # An unreported regex can only match where another one already
+            # did, so the others need checking only when something matched
+            if reported:
+                found |= reported
+                for index, regex in self.regexes:
+                    if index not in found and regex.search(text) is not None:
+                        found.add(index)
+        
+        for index, regex in self.separate:
+            if index not in found and regex.search(text) is not None:
+                found.add(index)
+        return sorted(found)
+    
+    def to_string(self) -> str:
+        return f'<pattern set of {len(self.keys)}>'
+
+
+@dataclass
+class KaynatStructure(KaynatValue):
+    """
+    Data structure from kaynat.dsa used as a runtime value.
+    
+    Structures are mutable, so they compare by identity. for each
+    walks them in place through iterate().
+    """
+    
+    kind = 'structure'
+    
+    def __init__(self, structure):
+        super().__init__(structure)
+    
+    def __eq__(self, other):
+        return self is other
+    
+    __hash__ = object.__hash__
+    
+    def iterate(self):
+        """Iterate the elements without copying them out."""
+        return iter(self.value)
+    
+    def is_truthy(self) -> bool:
+        return len(self.value) > 0
+    
+    def to_string(self) -> str:
+        return f'<{self.kind} of {len(self.value)}>'
+
+
+@dataclass(eq=False)
+class KaynatStack(KaynatStructure):
+    """Stack (wraps dsa.stack.Stack); iterates from the top down."""
+    
+    kind = 'stack'
+
+
+@dataclass(eq=False)
+class KaynatQueue(KaynatStructure):
+    """Queue (wraps dsa.queue.Queue); iterates from the front."""
+    
+    kind = 'queue'
+
+
+@dataclass(eq=False)
+class KaynatHeap(KaynatStructure):
+    """Min or max heap (wraps dsa.heap.MinHeap or MaxHeap)."""
+    
+    kind = 'heap'
+    
+    def __init__(self, heap, highest_first: bool = False):
+        self.highest_first = highest_first
+        super().__init__(heap)
+    
+    def to_string(self) -> str:
+        return f"<{'max' if self.highest_first else 'min'} heap of {len(self.value)}>"
+
+
+@dataclass(eq=False)
+class KaynatTree(KaynatStructure):
+    """Balanced binary search tree (wraps dsa.binary_search_tree.BinarySearchTree); iterates in order."""
+    
+    kind = 'tree'
+
+
+@dataclass(eq=False)
+class KaynatGraph(KaynatStructure):
+    """Graph (wraps dsa.graph.Graph); iterates its nodes."""
+    
+    kind = 'graph'
+    
+    def to_string(self) -> str:
+        return f'<graph of {self.value.node_count()} nodes and {self.value.edge_count()} edges>'
+
+
+@dataclass(eq=False)
+class KaynatHashMap(KaynatStructure):
+    """Open addressing hash map (wraps dsa.hash_map.HashMap); iterates its keys."""
+    
+    kind = 'hash map'
+
+
+@dataclass(eq=False)
+class KaynatTrie(KaynatStructure):
+    """Radix trie of words (wraps dsa.trie.Trie); iterates words in sorted order."""
+    
+    kind = 'trie'
+    
+    def iterate(self):
+        return map(KaynatString, self.value)
+
+
+@dataclass(eq=False)
+class KaynatPriorityQueue(KaynatStructure):
+    """Priority queue (wraps dsa.heap.PriorityQueue)."""
+    
+    kind = 'priority queue'
+
+
+@dataclass
+class KaynatPriorityHandle(KaynatValue):
+    """Handle to one entry of a priority queue."""
+    
+    def __init__(self, handle):
+        super().__init__(handle)
+    
+    def __eq__(self, other):
+        return isinstance(other, KaynatPriorityHandle) and self.value is other.value
+    
+    def __hash__(self):
+        return id(self.value)
+    
+    def to_string(self) -> str:
+        return f'<priority entry {self.value.item.to_string()}>'
+
+
+@dataclass(eq=False)
+class KaynatLinkedList(KaynatStructure):
+    """Doubly linked list (wraps dsa.linked_list.LinkedList); the current node may be removed while iterating."""
+    
+    kind = 'linked list'
+    
+    def to_string(self) -> str:
+        return '[' + ' <-> '.join(item.to_string() for item in self.value) + ']'
+
+
+@dataclass
+class KaynatListNode(KaynatValue):
+    """Handle to one node of a linked list."""
+    
+    def __init__(self, node):
+        super().__init__(node)
+    
+    def __eq__(self, other):
+        return isinstance(other, KaynatListNode) and self.value is other.value
+    
+    def __hash__(self):
+        return id(self.value)
+    
+    def to_string(self) -> str:
+        return f'<list node {self.value.value.to_string()}>'
+
+
+@dataclass(eq=False)
+class KaynatSortedList(KaynatStructure):
+    """List kept in sorted order (wraps dsa.sorted_list.SortedList)."""
+    
+    kind = 'sorted list'
+    
+    def to_string(self) -> str:
+        return '<sorted [' + ', '.join(item.to_string() for item in self.value) + ']>'
+
+
+@dataclass
+class KaynatTextIndex(KaynatValue):
+    """Suffix array index over a text (wraps dsa.text_search.SuffixArray)."""
+    
+    def __init__(self, index):
+        super().__init__(index)
+    
+    def __eq__(self, other):
+        return self is other
+    
+    __hash__ = object.__hash__
+    
+    def to_string(self) -> str:
+        return f'<text index of {len(self.value)}>'
+
+
+@dataclass(eq=False)
+class KaynatWordSequence(KaynatSequence):
+    """Words of a trie that start with a prefix, found one at a time in sorted order."""
+    
+    def __init__(self, trie, prefix: str):
+        self.trie = trie
+        self.prefix = prefix
+        super().__init__()
+    
+    def __iter__(self):
+        return map(KaynatString, self.trie.words(self.prefix))
+    
+    def to_string(self) -> str:
+        return f'<words starting with {self.prefix}>'
+
+
 @dataclass
 class KaynatFunction(KaynatValue):
     """Function value."""
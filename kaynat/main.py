@@ -13,15 +13,36 @@ import argparse
 from pathlib import Path
 from kaynat.repl import start_repl
 from kaynat.interpreter.interpreter import Interpreter
+from kaynat.interpreter.metrics import Metrics
 from kaynat.errors.error_types import KaynatError
 
 
-def run_file(filepath: str) -> int:
+def _export_metrics(metrics: Metrics, metrics_path: str, metrics_format: str) -> bool:
+    """
+    Write metrics, reporting a failure without raising it.
+    
+    Export runs after the program, possibly while its error is still
+    propagating, so a failed export must not replace that error.
+    
+    Returns:
+        True if the metrics were written
+    """
+    try:
+        metrics.export(metrics_path, metrics_format)
+        return True
+    except Exception as e:
+        print(f"Metrics Error: {e}")
+        return False
+
+
+def run_file(filepath: str, metrics_path: str = None, metrics_format: str = 'json') -> int:
     """
     Execute a Kaynat source file.
     
     Args:
         filepath: Path to the .kaynat source file
+        metrics_path: Optional file to write runtime metrics to
+        metrics_format: Metrics export format ('json' or 'prometheus')
         
     Returns:
         Exit code (0 for success, 1 for error)
@@ -36,9 +57,16 @@ def run_file(filepath: str) -> int:
             print(f"Warning: File '{filepath}' does not have .kaynat extension.")
             
         source_code = path.read_text(encoding='utf-8')
-        interpreter = Interpreter()
-        interpreter.execute(source_code)
-        return 0
+        metrics = Metrics() if metrics_path else None
+        interpreter = Interpreter(metrics=metrics)
+        exported = True
+        try:
+            interpreter.execute(source_code)
+        finally:
+            interpreter.close()
+            if metrics is not None:
+                exported = _export_metrics(metrics, metrics_path, metrics_format)
+        return 0 if exported else 1
         
     except KaynatError as e:
         print(f"Kaynat Error: {e}")
@@ -59,6 +87,17 @@ def main() -> int:
         nargs='?',
         help='Path to .kaynat source file to execute'
     )
+    parser.add_argument(
+        '--metrics',
+        metavar='PATH',
+        help='Write runtime metrics to PATH after execution'
+    )
+    parser.add_argument(
+        '--metrics-format',
+        choices=['json', 'prometheus'],
+        default='json',
+        help='Format for --metrics output (default: json)'
+    )
     parser.add_argument(
         '--version',
         action='version',
@@ -68,7 +107,7 @@ def main() -> int:
     args = parser.parse_args()
     
     if args.file:
-        return run_file(args.file)
+        return run_file(args.file, args.metrics, args.metrics_format)
     else:
         return start_repl()
 
@@ -254,6 +254,36 @@ class ListOperationNode(ASTNode):
     column: int = 0
 
 
+@dataclass
+class PushNode(ASTNode):
+    """Push statement: push item onto target [with priority p], or enqueue item into target."""
+    item: ASTNode
+    target: str
+    priority: Optional[ASTNode] = None
+    operation: str = 'push'
+    line: int = 0
+    column: int = 0
+
+
+@dataclass
+class ExtractNode(ASTNode):
+    """Extract, pop or dequeue statement: extract from target [and store as variable]."""
+    target: str
+    variable: Optional[str] = None
+    operation: str = 'extract'
+    line: int = 0
+    column: int = 0
+
+
+@dataclass
+class CreateStructureNode(ASTNode):
+    """Create a data structure: create a stack called items."""
+    kind: str
+    name: str
+    line: int = 0
+    column: int = 0
+
+
 @dataclass
 class StringOperationNode(ASTNode):
     """String operation: join, split, uppercase, etc."""
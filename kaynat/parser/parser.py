@@ -186,6 +186,14 @@ class Parser:
             self.expect(TokenType.PERIOD)
             return ContinueNode(line=token.line, column=token.column)
         
+        # Push: push task onto jobs with priority 3. / enqueue task into jobs.
+        if self.match(TokenType.PUSH, TokenType.ENQUEUE):
+            return self.parse_push()
+        
+        # Extract: extract from jobs and store as task. / pop from ... / dequeue from ...
+        if self.match(TokenType.EXTRACT, TokenType.POP, TokenType.DEQUEUE):
+            return self.parse_extract()
+        
         # Arithmetic operations: add 5 to x.
         if self.match(TokenType.ADD, TokenType.SUBTRACT, TokenType.MULTIPLY, TokenType.DIVIDE):
             return self.parse_arithmetic_statement()
@@ -572,6 +580,56 @@ class Parser:
         self.expect(TokenType.PERIOD)
         return ReturnNode(value=value, line=token.line, column=token.column)
     
+    def parse_push(self) -> PushNode:
+        """Parse: push/enqueue item onto/into target [with priority p]."""
+        token = self.advance()
+        operation = 'enqueue' if token.type == TokenType.ENQUEUE else 'push'
+        item = self.parse_expression()
+        if self.match(TokenType.INTO):
+            self.advance()
+        else:
+            self.expect(TokenType.ONTO)
+        target = self.expect(TokenType.IDENTIFIER).value
+        
+        priority = None
+        if self.match(TokenType.WITH):
+            self.advance()
+            self.expect(TokenType.PRIORITY)
+            priority = self.parse_expression()
+        
+        self.expect(TokenType.PERIOD)
+        return PushNode(
+            item=item,
+            target=target,
+            priority=priority,
+            operation=operation,
+            line=token.line,
+            column=token.column
+        )
+    
+    def parse_extract(self) -> ExtractNode:
+        """Parse: extract/pop/dequeue from target [and store as variable]."""
+        token = self.advance()
+        operation = {TokenType.POP: 'pop', TokenType.DEQUEUE: 'dequeue'}.get(token.type, 'extract')
+        self.expect(TokenType.FROM)
+        target = self.expect(TokenType.IDENTIFIER).value
+        
+        variable = None
+        if self.match(TokenType.AND):
+            self.advance()
+            self.expect(TokenType.STORE)
+            self.expect(TokenType.AS)
+            variable = self.expect(TokenType.IDENTIFIER).value
+        
+        self.expect(TokenType.PERIOD)
+        return ExtractNode(
+            target=target,
+            variable=variable,
+            operation=operation,
+            line=token.line,
+            column=token.column
+        )
+    
     def parse_function_call_statement(self) -> ASTNode:
         """Parse: call function with arg1, arg2 [and store as result]."""
         token = self.advance()
@@ -747,12 +805,43 @@ class Parser:
                 column=token.column
             )
         
+        # Data structures: create a min heap called jobs.
+        kind = self.parse_structure_kind()
+        if kind is not None:
+            self.expect(TokenType.CALLED)
+            name = self.expect(TokenType.IDENTIFIER).value
+            self.expect(TokenType.PERIOD)
+            return CreateStructureNode(kind=kind, name=name, line=token.line, column=token.column)
+        
         raise ParserError(
             f"Unknown create statement",
             token.line,
             token.column
         )
     
+    def parse_structure_kind(self) -> Optional[str]:
+        """Parse the name of a data structure, like stack or binary search tree."""
+        # Each name is a sequence of words, matched in full or not at all
+        names = [
+            ('binary search tree', (TokenType.BINARY, TokenType.SEARCH, TokenType.TREE)),
+            ('priority queue', (TokenType.PRIORITY, TokenType.QUEUE)),
+            ('linked list', (TokenType.LINKED, TokenType.LIST)),
+            ('min heap', (TokenType.MIN, TokenType.HEAP)),
+            ('max heap', (TokenType.MAX, TokenType.HEAP)),
+            ('hash map', (TokenType.HASH, TokenType.MAP)),
+            ('stack', (TokenType.STACK,)),
+            ('queue', (TokenType.QUEUE,)),
+            ('tree', (TokenType.TREE,)),
+            ('graph', (TokenType.GRAPH,)),
+            ('trie', (TokenType.TRIE,)),
+        ]
+        for kind, words in names:
+            if all(self.peek_token(i).type == word for i, word in enumerate(words)):
+                for _ in words:
+                    self.advance()
+                return kind
+        return None
+    
     def is_list_operation(self) -> bool:
         """Check if this is a list operation."""
         # Look ahead to see if pattern matches list operation
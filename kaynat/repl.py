@@ -70,6 +70,7 @@ def start_repl() -> int:
             try:
                 line = input(prompt)
             except EOFError:
+                interpreter.close()
                 print("\nGoodbye!")
                 return 0
             
@@ -79,6 +80,7 @@ def start_repl() -> int:
             
             # Check for exit
             if line.strip().lower() in ('exit.', 'quit.', 'bye.'):
+                interpreter.close()
                 print("Goodbye!")
                 return 0
             
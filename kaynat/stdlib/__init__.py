@@ -6,13 +6,17 @@ from kaynat.stdlib.list_tools import *
 
 __all__ = [
     'math_tools',
+    'vector_tools',
     'string_tools', 
     'list_tools',
+    'set_tools',
     'file_tools',
     'date_tools',
     'random_tools',
     'network_tools',
     'json_tools',
     'crypto_tools',
-    'pattern_tools'
+    'pattern_tools',
+    'sequence_tools',
+    'structure_tools'
 ]
@@ -5,10 +5,27 @@ Provides file I/O functionality for Kaynat programs.
 """
 
 import os
+import mmap
 import shutil
+import stat
+import time
+import errno
+import tempfile
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from kaynat.interpreter.runtime_types import KaynatString, KaynatList, KaynatBoolean
-from kaynat.errors.error_types import FileError
+from kaynat.interpreter.runtime_types import (
+    KaynatString, KaynatList, KaynatMap, KaynatBoolean, KaynatNumber, KaynatNull, KaynatFileHandle, KaynatMappedFile,
+    KaynatDirectoryWalk, entry_details
+)
+from kaynat.errors.error_types import FileError, TypeError as KaynatTypeError, ValueError as KaynatValueError
+
+
+# Buffer size for streaming writers; writes are flushed in blocks this large
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Handles opened by the program, closed by close_all_files at shutdown
+_open_handles = weakref.WeakSet()
 
 
 def read_file(filepath):
@@ -40,7 +57,10 @@ def read_lines(filepath):
 
 
 def write_file(filepath, content):
-    """Write content to file (overwrites existing)."""
+    """Write content to file (overwrites existing), or to an open writer."""
+    if isinstance(filepath, KaynatFileHandle):
+        return _write_to_handle(filepath, content)
+    
     path = filepath.value if isinstance(filepath, KaynatString) else str(filepath)
     text = content.value if isinstance(content, KaynatString) else str(content)
     
@@ -53,7 +73,10 @@ def write_file(filepath, content):
 
 
 def append_file(filepath, content):
-    """Append content to file."""
+    """Append content to file, or to an open writer."""
+    if isinstance(filepath, KaynatFileHandle):
+        return _write_to_handle(filepath, content)
+    
     path = filepath.value if isinstance(filepath, KaynatString) else str(filepath)
     text = content.value if isinstance(content, KaynatString) else str(content)
     
@@ -145,3 +168,298 @@ def list_directory(dirpath):
         return KaynatList([KaynatString(f) for f in files])
     except Exception as e:
         raise FileError(f"Error listing directory: {e}")
+
+
+def _pattern(pattern):
+    if pattern is None or isinstance(pattern, KaynatNull):
+        return None
+    return pattern.value if isinstance(pattern, KaynatString) else str(pattern)
+
+
+def walk_directory(dirpath, pattern=None):
+    """Walk a directory tree lazily, giving a map of details per entry."""
+    path = dirpath.value if isinstance(dirpath, KaynatString) else str(dirpath)
+    if not os.path.isdir(path):
+        raise FileError(f"Directory not found: {path}")
+    return KaynatDirectoryWalk(path, _pattern(pattern))
+
+
+def list_directory_details(dirpath, pattern=None):
+    """List the entries of one directory with their type, size and modified time."""
+    path = dirpath.value if isinstance(dirpath, KaynatString) else str(dirpath)
+    if not os.path.isdir(path):
+        raise FileError(f"Directory not found: {path}")
+    return KaynatDirectoryWalk(path, _pattern(pattern), recursive=False).materialize()
+
+
+def file_details(filepath):
+    """Get the type, size and modified time of a file or directory."""
+    path = filepath.value if isinstance(filepath, KaynatString) else str(filepath)
+    
+    try:
+        info = os.lstat(path)
+    except FileNotFoundError:
+        raise FileError(f"File not found: {path}")
+    except OSError as e:
+        raise FileError(f"Error reading file details: {e}")
+    
+    if stat.S_ISLNK(info.st_mode):
+        kind = 'link'
+    elif stat.S_ISDIR(info.st_mode):
+        kind = 'directory'
+    elif stat.S_ISREG(info.st_mode):
+        kind = 'file'
+    else:
+        kind = 'other'
+    return entry_details(path, os.path.basename(path.rstrip(os.sep)) or path, kind, info)
+
+
+def _open_handle(filepath, mode, label):
+    path = filepath.value if isinstance(filepath, KaynatString) else str(filepath)
+    buffering = WRITE_BUFFER_SIZE if mode != 'r' else -1
+    
+    try:
+        f = open(path, mode, encoding='utf-8', buffering=buffering)
+    except FileNotFoundError:
+        raise FileError(f"File not found: {path}")
+    except Exception as e:
+        raise FileError(f"Error opening file: {e}")
+    
+    handle = KaynatFileHandle(path, label, f)
+    _open_handles.add(handle)
+    return handle
+
+
+def _check_handle(handle, mode=None):
+    if not isinstance(handle, KaynatFileHandle):
+        raise KaynatTypeError("Expected a file handle")
+    if handle.closed:
+        raise FileError(f"File is closed: {handle.path}")
+    if mode is not None and (handle.mode == 'reading') != (mode == 'reading'):
+        raise FileError(f"File {handle.path} is not open for {mode}")
+
+
+def _text(content):
+    if isinstance(content, KaynatString):
+        return content.value
+    if hasattr(content, 'to_string'):
+        return content.to_string()
+    return str(content)
+
+
+def _write_to_handle(handle, content, suffix=''):
+    _check_handle(handle, 'writing')
+    text = _text(content) + suffix
+    
+    try:
+        handle.file.write(text)
+        return KaynatBoolean(True)
+    except Exception as e:
+        raise FileError(f"Error writing file: {e}")
+
+
+def open_reader(filepath):
+    """Open a file for streaming reads."""
+    return _open_handle(filepath, 'r', 'reading')
+
+
+def open_writer(filepath):
+    """Open a file for buffered writing (overwrites existing)."""
+    return _open_handle(filepath, 'w', 'writing')
+
+
+def open_appender(filepath):
+    """Open a file for buffered appending."""
+    return _open_handle(filepath, 'a', 'appending')
+
+
+def read_next_line(handle):
+    """Read the next line from a reader, or nothing at end of file."""
+    _check_handle(handle, 'reading')
+    
+    try:
+        line = handle.file.readline()
+    except Exception as e:
+        raise FileError(f"Error reading file: {e}")
+    
+    if not line:
+        return KaynatNull()
+    return KaynatString(line.rstrip('\n'))
+
+
+def read_chunk(handle, size):
+    """Read up to size characters from a reader, or nothing at end of file."""
+    _check_handle(handle, 'reading')
+    count = int(size.value if isinstance(size, KaynatNumber) else size)
+    
+    try:
+        chunk = handle.file.read(count)
+    except Exception as e:
+        raise FileError(f"Error reading file: {e}")
+    
+    if not chunk:
+        return KaynatNull()
+    return KaynatString(chunk)
+
+
+def write_line(handle, content):
+    """Write content followed by a newline to an open writer."""
+    return _write_to_handle(handle, content, '\n')
+
+
+def flush_file(handle):
+    """Push buffered writes of an open writer to disk."""
+    _check_handle(handle, 'writing')
+    handle.file.flush()
+    return KaynatBoolean(True)
+
+
+def map_file(filepath):
+    """Memory-map a file for read-only length, slicing and searching."""
+    path = filepath.value if isinstance(filepath, KaynatString) else str(filepath)
+    
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        raise FileError(f"File not found: {path}")
+    except Exception as e:
+        raise FileError(f"Error opening file: {e}")
+    
+    try:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            data = b''
+        else:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except Exception as e:
+        f.close()
+        raise FileError(f"Error mapping file: {e}")
+    
+    handle = KaynatMappedFile(path, f, data)
+    _open_handles.add(handle)
+    return handle
+
+
+def close_file(handle):
+    """Close a file handle or mapped file."""
+    if not isinstance(handle, (KaynatFileHandle, KaynatMappedFile)):
+        raise KaynatTypeError("Expected a file handle")
+    
+    handle.close()
+    _open_handles.discard(handle)
+    return KaynatBoolean(True)
+
+
+def close_all_files():
+    """Close every handle the program left open."""
+    for handle in list(_open_handles):
+        handle.close()
+    _open_handles.clear()
+
+
+def _transfer_pairs(pairs, name):
+    """Get (source, destination) path pairs from a list of pairs or a map."""
+    if isinstance(pairs, KaynatMap):
+        items = [(KaynatString(k), v) for k, v in pairs.value.items()]
+    elif isinstance(pairs, KaynatList):
+        items = []
+        for pair in pairs.value:
+            if not isinstance(pair, KaynatList) or len(pair.value) != 2:
+                raise KaynatTypeError(f"{name} requires a list of [source, destination] pairs")
+            items.append((pair.value[0], pair.value[1]))
+    else:
+        raise KaynatTypeError(f"{name} requires a list of pairs or a map")
+    
+    return [
+        (src.value if isinstance(src, KaynatString) else str(src),
+         dst.value if isinstance(dst, KaynatString) else str(dst))
+        for src, dst in items
+    ]
+
+
+def _destination(src, dst):
+    """Resolve a destination directory to a file path inside it."""
+    if os.path.isdir(dst):
+        return os.path.join(dst, os.path.basename(src))
+    return dst
+
+
+def _atomic_copy(src, dst):
+    """
+    Copy src to dst so dst never appears half-written.
+    
+    Data goes to a temporary file next to dst, which is renamed over
+    dst once complete. shutil.copyfile uses os.sendfile (or the
+    platform's equivalent) when available.
+    """
+    dst = _destination(src, dst)
+    fd, tmp = tempfile.mkstemp(prefix='.' + os.path.basename(dst) + '.', suffix='.part',
+                               dir=os.path.dirname(dst) or '.')
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp)
+        shutil.copystat(src, tmp)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return os.path.getsize(dst)
+
+
+def _atomic_move(src, dst):
+    """Rename src to dst, falling back to an atomic copy across filesystems."""
+    dst = _destination(src, dst)
+    size = os.path.getsize(src)
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _atomic_copy(src, dst)
+        os.unlink(src)
+    return size
+
+
+def _run_transfers(pairs, concurrency, operation, name):
+    jobs = _transfer_pairs(pairs, name)
+    workers = None
+    if concurrency is not None and not isinstance(concurrency, KaynatNull):
+        workers = int(concurrency.value if isinstance(concurrency, KaynatNumber) else concurrency)
+        if workers < 1:
+            raise KaynatValueError(f"{name} concurrency must be at least 1")
+    
+    def run(job):
+        src, dst = job
+        try:
+            return operation(src, dst), None
+        except Exception as e:
+            return 0, f"{src}: {e}"
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(run, jobs))
+    elapsed = time.perf_counter() - started
+    
+    total = sum(size for size, _ in results)
+    errors = [error for _, error in results if error is not None]
+    return KaynatMap({
+        'files': KaynatNumber(len(jobs) - len(errors)),
+        'failed': KaynatNumber(len(errors)),
+        'errors': KaynatList([KaynatString(e) for e in errors]),
+        'bytes': KaynatNumber(total),
+        'seconds': KaynatNumber(elapsed),
+        'bytes_per_second': KaynatNumber(total / elapsed if elapsed > 0 else 0),
+    })
+
+
+def copy_files(pairs, concurrency=None):
+    """Copy many files in parallel, each atomically, and report throughput."""
+    return _run_transfers(pairs, concurrency, _atomic_copy, "Copy files")
+
+
+def move_files(pairs, concurrency=None):
+    """Move many files in parallel, each atomically, and report throughput."""
+    return _run_transfers(pairs, concurrency, _atomic_move, "Move files")
@@ -1,8 +1,16 @@
 """Kaynat JSON Tools - JSON parsing and generation."""
 
 import json
-from kaynat.interpreter.runtime_types import KaynatString, KaynatMap, KaynatList, KaynatNumber, KaynatBoolean, KaynatNull
-from kaynat.errors.error_types import ValueError as KaynatValueError
+from contextlib import contextmanager
+from kaynat.interpreter.runtime_types import (
+    KaynatString, KaynatMap, KaynatList, KaynatNumber, KaynatBoolean, KaynatNull,
+    KaynatSequence, KaynatFileHandle, KaynatJsonLines, KaynatJsonArray, JsonListView, JsonMapView,
+    box_json, iterate_values
+)
+from kaynat.errors.error_types import ValueError as KaynatValueError, TypeError as KaynatTypeError, FileError
+
+# Buffer size for streaming JSON writers
+WRITE_BUFFER_SIZE = 1 << 20
 
 
 def parse_json(json_string):
@@ -11,7 +19,7 @@ def parse_json(json_string):
     
     try:
         data = json.loads(json_str)
-        return _python_to_kaynat(data)
+        return box_json(data)
     except json.JSONDecodeError as e:
         raise KaynatValueError(f"Invalid JSON: {e}")
 
@@ -29,6 +37,73 @@ def format_json(data, indent=2):
     return KaynatString(json.dumps(python_data, indent=indent_val))
 
 
+
+def read_json_lines(filepath):
+    """Iterate the records of a JSON-lines file one at a time."""
+    path = filepath.value if hasattr(filepath, 'value') else str(filepath)
+    return KaynatJsonLines(path, box_json)
+
+
+def read_json_array(filepath):
+    """Iterate the elements of a large top-level JSON array one at a time."""
+    path = filepath.value if hasattr(filepath, 'value') else str(filepath)
+    return KaynatJsonArray(path, box_json)
+
+
+@contextmanager
+def _json_output(target):
+    """Open a path for writing, or reuse an open writer handle."""
+    if isinstance(target, KaynatFileHandle):
+        if target.closed or target.mode == 'reading':
+            raise KaynatTypeError("JSON output requires an open writer")
+        yield target.file
+        return
+    
+    path = target.value if isinstance(target, KaynatString) else str(target)
+    try:
+        f = open(path, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE)
+    except OSError as e:
+        raise FileError(f"Error writing file: {e}")
+    with f:
+        yield f
+
+
+def write_json(target, data):
+    """Write data as JSON to a file or writer without building the whole text."""
+    encoder = json.JSONEncoder()
+    
+    with _json_output(target) as f:
+        write = f.write
+        if isinstance(data, KaynatSequence):
+            # Sequences become arrays, encoded one element at a time
+            write('[')
+            for index, item in enumerate(iterate_values(data)):
+                if index:
+                    write(', ')
+                for chunk in encoder.iterencode(_kaynat_to_python(item)):
+                    write(chunk)
+            write(']')
+        else:
+            for chunk in encoder.iterencode(_kaynat_to_python(data)):
+                write(chunk)
+    return KaynatBoolean(True)
+
+
+def write_json_lines(target, records):
+    """Write each record of a list or sequence as one line of JSON."""
+    if not isinstance(records, (KaynatList, KaynatSequence)):
+        raise KaynatTypeError("JSON lines require a list or sequence of records")
+    
+    encode = json.JSONEncoder().encode
+    count = 0
+    with _json_output(target) as f:
+        write = f.write
+        for record in iterate_values(records):
+            write(encode(_kaynat_to_python(record)))
+            write('\n')
+            count += 1
+    return KaynatNumber(count)
+
 def _python_to_kaynat(obj):
     """Convert Python object to Kaynat type."""
     if obj is None:
@@ -59,8 +134,15 @@ def _kaynat_to_python(obj):
     elif isinstance(obj, KaynatString):
         return obj.value
     elif isinstance(obj, KaynatList):
+        if isinstance(obj.value, JsonListView):
+            return obj.value.unwrap(_kaynat_to_python)
+        data = obj.numbers
+        if data is not None:
+            return data.tolist()
         return [_kaynat_to_python(item) for item in obj.value]
     elif isinstance(obj, KaynatMap):
+        if isinstance(obj.value, JsonMapView):
+            return obj.value.unwrap(_kaynat_to_python)
         return {k: _kaynat_to_python(v) for k, v in obj.value.items()}
     else:
         return str(obj)
@@ -4,8 +4,11 @@ Kaynat List Tools - List manipulation operations.
 Provides comprehensive list functionality for Kaynat programs.
 """
 
-from kaynat.interpreter.runtime_types import KaynatList, KaynatNumber, KaynatBoolean
+from kaynat.interpreter.runtime_types import (
+    KaynatList, KaynatNumber, KaynatBoolean, KaynatString, KaynatMap, KaynatFunction, KaynatBuiltinFunction
+)
 from kaynat.errors.error_types import TypeError as KaynatTypeError, ValueError as KaynatValueError, RuntimeError as KaynatRuntimeError
+from kaynat.dsa.sorting import raw_key, sort_list, sort_list_by
 
 
 def list_append(lst, item):
@@ -13,7 +16,7 @@ def list_append(lst, item):
     if not isinstance(lst, KaynatList):
         raise KaynatTypeError("Append requires a list")
     
-    lst.value.append(item)
+    lst.append(item)
     return lst
 
 
@@ -111,19 +114,66 @@ def list_index_of(lst, item):
         return KaynatNumber(-1)
 
 
+def index_list(lst):
+    """Index a list so contains, index of, count and remove are fast."""
+    if not isinstance(lst, KaynatList):
+        raise KaynatTypeError("Index list requires a list")
+    
+    lst.build_index()
+    return lst
+
+
 def list_sort(lst, reverse=False):
     """Sort list in place."""
     if not isinstance(lst, KaynatList):
         raise KaynatTypeError(f"Sort requires a list, got {type(lst)}")
     
     rev = reverse.value if isinstance(reverse, KaynatBoolean) else reverse
+    return sort_list(lst, reverse=rev)
+
+
+def make_sort_key(spec, caller, name):
+    """
+    Turn a sort key given in Kaynat into a Python key function.
+    
+    spec is a function applied to each element, or a field name
+    looked up in each element's map.
+    """
+    if isinstance(spec, (KaynatFunction, KaynatBuiltinFunction)):
+        if caller is None:
+            raise KaynatTypeError(f"{name} cannot call functions here")
+        return lambda item: raw_key(caller(spec, [item]))
+    if isinstance(spec, KaynatString):
+        field = spec.value
+        
+        def field_key(item):
+            if not isinstance(item, KaynatMap) or field not in item.value:
+                raise KaynatValueError(f"{name}: element has no field '{field}'")
+            return raw_key(item.value[field])
+        return field_key
+    raise KaynatTypeError(f"{name} key must be a function or a field name")
+
+
+def list_sort_by(lst, keys, descending=False, caller=None):
+    """
+    Sort list in place by one or more keys, most significant first.
+    
+    Each key is a function or a field name; descending is one boolean
+    for every key or a list with one boolean per key.
+    """
+    if not isinstance(lst, KaynatList):
+        raise KaynatTypeError("Sort by requires a list")
     
-    try:
-        lst.value.sort(key=lambda x: x.value if hasattr(x, 'value') else x, reverse=rev)
-    except Exception as e:
-        raise KaynatRuntimeError(f"Cannot sort list: {e}")
+    specs = list(keys.value) if isinstance(keys, KaynatList) else [keys]
+    if isinstance(descending, KaynatList):
+        flags = [flag.is_truthy() for flag in descending.value]
+        if len(flags) != len(specs):
+            raise KaynatValueError("Sort by needs one descending flag per key")
+    else:
+        flag = descending.is_truthy() if isinstance(descending, KaynatBoolean) else bool(descending)
+        flags = [flag] * len(specs)
     
-    return lst
+    return sort_list_by(lst, [(make_sort_key(spec, caller, "Sort by"), flag) for spec, flag in zip(specs, flags)])
 
 
 def list_reverse(lst):
@@ -140,7 +190,7 @@ def list_copy(lst):
     if not isinstance(lst, KaynatList):
         raise KaynatTypeError("Copy requires a list")
     
-    return KaynatList(lst.value.copy())
+    return lst.copy()
 
 
 def list_clear(lst):
@@ -171,10 +221,10 @@ def list_slice(lst, start, end=None):
     start_idx = int(start.value if isinstance(start, KaynatNumber) else start)
     
     if end is None:
-        return KaynatList(lst.value[start_idx:])
+        return lst.slice(start_idx)
     
     end_idx = int(end.value if isinstance(end, KaynatNumber) else end)
-    return KaynatList(lst.value[start_idx:end_idx])
+    return lst.slice(start_idx, end_idx)
 
 
 def list_count(lst, item):
@@ -193,6 +243,9 @@ def list_min(lst):
     if len(lst.value) == 0:
         raise KaynatValueError("Cannot find min of empty list")
     
+    if lst.numbers is not None:
+        return KaynatNumber(min(lst.numbers))
+    
     return min(lst.value, key=lambda x: x.value if hasattr(x, 'value') else x)
 
 
@@ -204,6 +257,9 @@ def list_max(lst):
     if len(lst.value) == 0:
         raise KaynatValueError("Cannot find max of empty list")
     
+    if lst.numbers is not None:
+        return KaynatNumber(max(lst.numbers))
+    
     return max(lst.value, key=lambda x: x.value if hasattr(x, 'value') else x)
 
 
@@ -212,6 +268,9 @@ def list_sum(lst):
     if not isinstance(lst, KaynatList):
         raise KaynatTypeError("Sum requires a list")
     
+    if lst.numbers is not None:
+        return KaynatNumber(sum(lst.numbers))
+    
     total = 0
     for item in lst.value:
         val = item.value if hasattr(item, 'value') else item
@@ -1,56 +1,360 @@
 """Kaynat Pattern Tools - Regular expressions and pattern matching."""
 
 import re
-from kaynat.interpreter.runtime_types import KaynatString, KaynatList, KaynatBoolean
-from kaynat.errors.error_types import ValueError as KaynatValueError
+from collections import OrderedDict
+from kaynat.interpreter.runtime_types import (
+    KaynatString, KaynatList, KaynatBoolean, KaynatNumber, KaynatMap, KaynatMappedFile,
+    KaynatPattern, KaynatPatternSet, KaynatSequence, iterate_values
+)
+from kaynat.errors.error_types import ValueError as KaynatValueError, TypeError as KaynatTypeError
 
 
-def find_matches(pattern, text):
-    """Find all matches of pattern in text."""
+class PatternCache:
+    """Least-recently-used cache of compiled patterns."""
+    
+    def __init__(self, capacity=256):
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, pattern):
+        """Get the compiled form of a pattern string or bytes."""
+        regex = self.entries.get(pattern)
+        if regex is not None:
+            self.hits += 1
+            self.entries.move_to_end(pattern)
+            return regex
+        
+        self.misses += 1
+        try:
+            regex = re.compile(pattern)
+        except re.error as e:
+            raise KaynatValueError(f"Invalid pattern: {e}")
+        
+        if self.capacity > 0:
+            self.entries[pattern] = regex
+            if len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+        return regex
+    
+    def resize(self, capacity):
+        """Change the capacity, dropping the oldest entries if needed."""
+        self.capacity = capacity
+        while len(self.entries) > max(capacity, 0):
+            self.entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all entries and reset the statistics."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_cache = PatternCache()
+
+# Characters that make a pattern a regex rather than a literal
+_REGEX_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+# Backreferences and leading inline flags cannot be moved into an alternation
+_NOT_COMBINABLE = re.compile(r'\\\d|\(\?P=|^\(\?[aiLmsux]+\)')
+
+# Up to this many literals, one substring check each beats a combined regex
+_LITERAL_SCAN_LIMIT = 96
+
+
+def _literal_alternation(words):
+    """
+    Build one regex alternation matching any of words, longest first.
+    
+    Words sharing a prefix share a branch, so the regex engine tries
+    a handful of characters at each position instead of every word.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[None] = True
+    
+    def emit(node):
+        branches = []
+        for char, child in node.items():
+            if char is None:
+                continue
+            chars = [char]
+            # Collapse a chain of single children into one literal run
+            while None not in child and len(child) == 1:
+                char, child = next(iter(child.items()))
+                chars.append(char)
+            branches.append(re.escape(''.join(chars)) + emit(child))
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if None in node:
+            # Greedy, so the longest word wins over its own prefix
+            return f'(?:{body})?'
+        return body
+    
+    return emit(trie)
+
+
+class LiteralMatcher:
+    """
+    Finds which of many literal strings occur in a text.
+    
+    Small sets are checked with one substring search per literal. Larger
+    ones are compiled into a single regex that looks ahead at every
+    position for the longest literal starting there; any shorter literal
+    starting at the same place is one of its prefixes, so each reported
+    literal also reports the literals that prefix it.
+    """
+    
+    def __init__(self, literals):
+        self.keys = {}
+        for word, key in literals:
+            self.keys.setdefault(word, []).append(key)
+        self.regex = None
+        if len(self.keys) > _LITERAL_SCAN_LIMIT:
+            try:
+                self.regex = re.compile(f'(?=({_literal_alternation(self.keys)}))')
+            except (re.error, RecursionError):
+                self.regex = None
+        if self.regex is not None:
+            self.reports = {
+                word: [key for i in range(len(word) + 1) for key in self.keys.get(word[:i], ())]
+                for word in self.keys
+            }
+    
+    def find_keys(self, text):
+        """Return the set of keys whose literal occurs in text."""
+        if self.regex is None:
+            return {key for word, keys in self.keys.items() if word in text for key in keys}
+        reports = self.reports
+        found = set()
+        seen = set()
+        for match in self.regex.finditer(text):
+            word = match.group(1)
+            if word not in seen:
+                seen.add(word)
+                found.update(reports[word])
+        return found
+
+
+def _decode(value):
+    """Decode a bytes match from a mapped file."""
+    if isinstance(value, bytes):
+        return value.decode('utf-8', errors='replace')
+    if isinstance(value, tuple):
+        return tuple(_decode(v) for v in value)
+    return value
+
+
+def _compile(pattern, as_bytes=False):
+    """Get a compiled regex from a compiled pattern or a pattern string."""
+    if isinstance(pattern, KaynatPattern):
+        return pattern.bytes_regex if as_bytes else pattern.regex
     pattern_str = pattern.value if hasattr(pattern, 'value') else str(pattern)
-    text_str = text.value if hasattr(text, 'value') else str(text)
+    return _cache.get(pattern_str.encode('utf-8') if as_bytes else pattern_str)
+
+
+def _subject(pattern, text):
+    """
+    Get the compiled regex and text to run it on.
     
+    Mapped files are searched in place, so the pattern is compiled as
+    bytes to match the mapped data.
+    """
+    if isinstance(text, KaynatMappedFile):
+        return _compile(pattern, as_bytes=True), text.data
+    text_str = text.value if hasattr(text, 'value') else str(text)
+    return _compile(pattern), text_str
+
+
+def _texts(texts, name):
+    """Get the raw strings of a list or sequence."""
+    if not isinstance(texts, (KaynatList, KaynatSequence)):
+        raise KaynatTypeError(f"{name} requires a list of strings")
+    return [t.value if isinstance(t, KaynatString) else t.to_string() for t in iterate_values(texts)]
+
+
+def compile_pattern(pattern):
+    """Compile a pattern once so it can be reused without lookups."""
+    if isinstance(pattern, KaynatPattern):
+        return pattern
+    pattern_str = pattern.value if hasattr(pattern, 'value') else str(pattern)
     try:
-        matches = re.findall(pattern_str, text_str)
-        return KaynatList([KaynatString(m) for m in matches])
+        return KaynatPattern(pattern_str, re.compile(pattern_str))
     except re.error as e:
         raise KaynatValueError(f"Invalid pattern: {e}")
 
 
+def find_matches(pattern, text):
+    """Find all matches of pattern in text."""
+    regex, text_str = _subject(pattern, text)
+    matches = regex.findall(text_str)
+    return KaynatList([KaynatString(_decode(m)) for m in matches])
+
+
 def matches_pattern(text, pattern):
     """Check if text matches pattern."""
-    pattern_str = pattern.value if hasattr(pattern, 'value') else str(pattern)
-    text_str = text.value if hasattr(text, 'value') else str(text)
-    
-    try:
-        return KaynatBoolean(bool(re.match(pattern_str, text_str)))
-    except re.error as e:
-        raise KaynatValueError(f"Invalid pattern: {e}")
+    regex, text_str = _subject(pattern, text)
+    return KaynatBoolean(regex.match(text_str) is not None)
 
 
 def replace_pattern(text, pattern, replacement):
     """Replace pattern with replacement in text."""
-    pattern_str = pattern.value if hasattr(pattern, 'value') else str(pattern)
-    text_str = text.value if hasattr(text, 'value') else str(text)
+    regex, text_str = _subject(pattern, text)
     repl_str = replacement.value if hasattr(replacement, 'value') else str(replacement)
+    if isinstance(text, KaynatMappedFile):
+        repl_str = repl_str.encode('utf-8')
     
     try:
-        result = re.sub(pattern_str, repl_str, text_str)
-        return KaynatString(result)
+        return KaynatString(_decode(regex.sub(repl_str, text_str)))
     except re.error as e:
-        raise KaynatValueError(f"Invalid pattern: {e}")
+        raise KaynatValueError(f"Invalid replacement: {e}")
 
 
 def split_by_pattern(text, pattern):
     """Split text by pattern."""
-    pattern_str = pattern.value if hasattr(pattern, 'value') else str(pattern)
-    text_str = text.value if hasattr(text, 'value') else str(text)
-    
+    regex, text_str = _subject(pattern, text)
+    parts = regex.split(text_str)
+    return KaynatList([KaynatString(_decode(p)) for p in parts])
+
+
+def find_matches_each(texts, pattern):
+    """Find all matches of pattern in each string of a list."""
+    findall = _compile(pattern).findall
+    return KaynatList([
+        KaynatList([KaynatString(m) for m in findall(t)])
+        for t in _texts(texts, "Find matches each")
+    ])
+
+
+def matches_pattern_each(texts, pattern):
+    """Check each string of a list against pattern."""
+    match = _compile(pattern).match
+    return KaynatList([KaynatBoolean(match(t) is not None) for t in _texts(texts, "Matches pattern each")])
+
+
+def replace_pattern_each(texts, pattern, replacement):
+    """Replace pattern with replacement in each string of a list."""
+    sub = _compile(pattern).sub
+    repl_str = replacement.value if hasattr(replacement, 'value') else str(replacement)
     try:
-        parts = re.split(pattern_str, text_str)
-        return KaynatList([KaynatString(p) for p in parts])
+        return KaynatList([KaynatString(sub(repl_str, t)) for t in _texts(texts, "Replace pattern each")])
     except re.error as e:
-        raise KaynatValueError(f"Invalid pattern: {e}")
+        raise KaynatValueError(f"Invalid replacement: {e}")
+
+
+def filter_by_pattern(texts, pattern):
+    """Keep the strings of a list that contain a match for pattern."""
+    search = _compile(pattern).search
+    return KaynatList([KaynatString(t) for t in _texts(texts, "Filter by pattern") if search(t) is not None])
+
+
+def pattern_set(patterns):
+    """
+    Compile many patterns into one matcher.
+    
+    Takes a map of id to pattern, or a list of patterns whose ids are
+    their positions. Patterns without regex characters are matched as
+    literals.
+    """
+    if isinstance(patterns, KaynatMap):
+        entries = [(KaynatString(k), v) for k, v in patterns.value.items()]
+    elif isinstance(patterns, KaynatList):
+        entries = [(KaynatNumber(i), v) for i, v in enumerate(patterns.value)]
+    else:
+        raise KaynatTypeError("Pattern set requires a list or map of patterns")
+    
+    keys = []
+    literals = []
+    alternatives = []
+    groups = {}
+    regexes = []
+    separate = []
+    for index, (key, pattern) in enumerate(entries):
+        keys.append(key)
+        if isinstance(pattern, KaynatPattern):
+            source = pattern.value
+        else:
+            source = pattern.value if isinstance(pattern, KaynatString) else pattern.to_string()
+        
+        if _REGEX_CHARS.isdisjoint(source):
+            literals.append((source, index))
+            continue
+        
+        regex = _compile(pattern)
+        if _NOT_COMBINABLE.search(source):
+            separate.append((index, regex))
+            continue
+        name = f'p{index}'
+        groups[name] = index
+        alternatives.append(f'(?P<{name}>{source})')
+        regexes.append((index, regex))
+    
+    combined = None
+    if alternatives:
+        try:
+            combined = re.compile('|'.join(alternatives))
+        except re.error:
+            separate.extend(regexes)
+            regexes = []
+    
+    matcher = LiteralMatcher(literals) if literals else None
+    return KaynatPatternSet(keys, matcher, combined, groups, regexes, separate)
+
+
+def _check_pattern_set(patterns, name):
+    if not isinstance(patterns, KaynatPatternSet):
+        raise KaynatTypeError(f"{name} requires a pattern set")
+
+
+def match_pattern_set(patterns, text):
+    """Get the ids of every pattern in a set found in text."""
+    _check_pattern_set(patterns, "Match pattern set")
+    text_str = text.value if isinstance(text, KaynatString) else text.to_string()
+    keys = patterns.keys
+    return KaynatList([keys[i] for i in patterns.match_indexes(text_str)])
+
+
+def match_pattern_set_each(patterns, texts):
+    """Get the ids of the patterns found in each string of a list."""
+    _check_pattern_set(patterns, "Match pattern set each")
+    keys = patterns.keys
+    match_indexes = patterns.match_indexes
+    return KaynatList([
+        KaynatList([keys[i] for i in match_indexes(t)])
+        for t in _texts(texts, "Match pattern set each")
+    ])
+
+
+def set_pattern_cache_size(size):
+    """Set how many compiled patterns are kept."""
+    capacity = int(size.value if isinstance(size, KaynatNumber) else size)
+    if capacity < 0:
+        raise KaynatValueError("Pattern cache size cannot be negative")
+    _cache.resize(capacity)
+    return KaynatBoolean(True)
+
+
+def pattern_cache_stats():
+    """Get the size, capacity, hits, misses and hit rate of the pattern cache."""
+    lookups = _cache.hits + _cache.misses
+    return KaynatMap({
+        'size': KaynatNumber(len(_cache.entries)),
+        'capacity': KaynatNumber(_cache.capacity),
+        'hits': KaynatNumber(_cache.hits),
+        'misses': KaynatNumber(_cache.misses),
+        'hit_rate': KaynatNumber(_cache.hits / lookups if lookups else 0.0),
+    })
+
+
+def clear_pattern_cache():
+    """Drop all cached patterns and reset the statistics."""
+    _cache.clear()
+    return KaynatBoolean(True)
 
 
 def is_valid_email(email):
@@ -0,0 +1,106 @@
+"""
+Kaynat Sequence Tools - Lazy ranges and pipelines.
+
+Builds sequences whose elements are produced only while a for each
+loop walks them, so pipelines over large data run in constant memory.
+"""
+
+from kaynat.interpreter.runtime_types import (
+    KaynatNumber, KaynatString, KaynatList, KaynatSequence, KaynatRange,
+    KaynatMappedSequence, KaynatFilteredSequence, KaynatTakeSequence,
+    KaynatLineSequence, KaynatSplitSequence, KaynatSortedSequence, KaynatFunction, KaynatBuiltinFunction,
+    KaynatBoolean
+)
+from kaynat.errors.error_types import TypeError as KaynatTypeError, ValueError as KaynatValueError
+from kaynat.dsa.sorting import external_sort, EXTERNAL_RUN_SIZE
+from kaynat.stdlib.list_tools import make_sort_key
+
+
+def _check_source(source, name):
+    if not isinstance(source, (KaynatList, KaynatSequence)):
+        raise KaynatTypeError(f"{name} requires a list or sequence")
+
+
+def _check_function(func, name):
+    if not isinstance(func, (KaynatFunction, KaynatBuiltinFunction)):
+        raise KaynatTypeError(f"{name} requires a function")
+
+
+def lazy_range(start, end, step=1):
+    """Create an inclusive range of integers without building a list."""
+    if not isinstance(start, KaynatNumber) or not isinstance(end, KaynatNumber):
+        raise KaynatTypeError("Range bounds must be numbers")
+
+    step_val = int(step.value if isinstance(step, KaynatNumber) else step)
+    if step_val == 0:
+        raise KaynatValueError("Range step cannot be zero")
+
+    return KaynatRange(int(start.value), int(end.value), step_val)
+
+
+def lazy_map(source, func, caller=None):
+    """Apply func to each element of source as it is iterated."""
+    _check_source(source, "Map")
+    _check_function(func, "Map")
+    return KaynatMappedSequence(source, func, caller)
+
+
+def lazy_filter(source, func, caller=None):
+    """Keep the elements of source for which func gives a truthy value."""
+    _check_source(source, "Filter")
+    _check_function(func, "Filter")
+    return KaynatFilteredSequence(source, func, caller)
+
+
+def lazy_take(source, count):
+    """Take at most count elements from the start of source."""
+    _check_source(source, "Take")
+    n = int(count.value if isinstance(count, KaynatNumber) else count)
+    if n < 0:
+        raise KaynatValueError("Take count cannot be negative")
+    return KaynatTakeSequence(source, n)
+
+
+def lazy_lines(filepath):
+    """Iterate the lines of a file without reading it all into memory."""
+    path = filepath.value if isinstance(filepath, KaynatString) else str(filepath)
+    return KaynatLineSequence(path)
+
+
+def lazy_split(text, delimiter=' '):
+    """Iterate the parts of a string split by delimiter."""
+    if not isinstance(text, (str, KaynatString)):
+        raise KaynatTypeError("Split requires a string")
+
+    s = text.value if isinstance(text, KaynatString) else text
+    delim = delimiter.value if isinstance(delimiter, KaynatString) else str(delimiter)
+    if not delim:
+        raise KaynatValueError("Split delimiter cannot be empty")
+
+    return KaynatSplitSequence(s, delim)
+
+
+def sort_sequence(source, key=None, descending=False, run_size=None, caller=None):
+    """
+    Sort a list or sequence that may not fit in memory.
+    
+    Sorted runs of run_size elements are spilled to temporary files
+    and merged as the result is iterated.
+    """
+    _check_source(source, "Sort sequence")
+    key_func = make_sort_key(key, caller, "Sort sequence") if key is not None else None
+    reverse = descending.is_truthy() if isinstance(descending, KaynatBoolean) else bool(descending)
+    size = EXTERNAL_RUN_SIZE if run_size is None else int(run_size.value if isinstance(run_size, KaynatNumber) else run_size)
+    if size < 1:
+        raise KaynatValueError("Run size must be at least 1")
+    return KaynatSortedSequence(
+        source, lambda items: external_sort(items, key=key_func, reverse=reverse, run_size=size)
+    )
+
+
+def sequence_to_list(source):
+    """Evaluate every element of a sequence into a list."""
+    if isinstance(source, KaynatList):
+        return source
+    _check_source(source, "To list")
+    return source.materialize()
@@ -0,0 +1,103 @@
+"""
+Kaynat Set Tools - Sets of unique values.
+
+Sets hold numbers, strings, booleans and nothing, with O(1) add,
+remove and membership checks.
+"""
+
+from kaynat.interpreter.runtime_types import (
+    KaynatSet, KaynatList, KaynatNumber, KaynatString, KaynatBoolean, KaynatNull, KaynatSequence, iterate_values
+)
+from kaynat.errors.error_types import TypeError as KaynatTypeError, ValueError as KaynatValueError
+
+
+def _check_set(s, name):
+    if not isinstance(s, KaynatSet):
+        raise KaynatTypeError(f"{name} requires a set")
+
+
+# Only these compare by value; lists, maps and data structures are mutable
+# or compare by identity, so equal-looking ones would be separate members
+_ITEM_TYPES = (KaynatNumber, KaynatString, KaynatBoolean, KaynatNull)
+
+
+def _check_item(item):
+    if not isinstance(item, _ITEM_TYPES):
+        raise KaynatTypeError(
+            f"Set items must be numbers, strings, booleans or nothing, got {type(item).__name__}"
+        )
+    return item
+
+
+def create_set(items=None):
+    """Create a set, optionally from the items of a list or sequence."""
+    if items is None:
+        return KaynatSet()
+    if isinstance(items, KaynatSet):
+        return KaynatSet(items.value)
+    if not isinstance(items, (KaynatList, KaynatSequence)):
+        raise KaynatTypeError("Create set requires a list")
+    return KaynatSet(_check_item(item) for item in iterate_values(items))
+
+
+def set_add(s, item):
+    """Add item to set."""
+    _check_set(s, "Set add")
+    s.value[_check_item(item)] = None
+    return s
+
+
+def set_remove(s, item):
+    """Remove item from set."""
+    _check_set(s, "Set remove")
+    try:
+        del s.value[_check_item(item)]
+    except KeyError:
+        raise KaynatValueError("Item not found in set")
+    return s
+
+
+def set_contains(s, item):
+    """Check if set contains item."""
+    _check_set(s, "Set contains")
+    try:
+        return KaynatBoolean(item in s.value)
+    except TypeError:
+        return KaynatBoolean(False)
+
+
+def set_size(s):
+    """Get number of items in set."""
+    _check_set(s, "Set size")
+    return KaynatNumber(len(s.value))
+
+
+def set_union(a, b):
+    """Items in either set."""
+    _check_set(a, "Set union")
+    _check_set(b, "Set union")
+    result = KaynatSet(a.value)
+    result.value.update(b.value)
+    return result
+
+
+def set_intersection(a, b):
+    """Items in both sets."""
+    _check_set(a, "Set intersection")
+    _check_set(b, "Set intersection")
+    other = b.value
+    return KaynatSet(item for item in a.value if item in other)
+
+
+def set_difference(a, b):
+    """Items in the first set but not the second."""
+    _check_set(a, "Set difference")
+    _check_set(b, "Set difference")
+    other = b.value
+    return KaynatSet(item for item in a.value if item not in other)
+
+
+def set_to_list(s):
+    """Get the items of a set as a list, in the order they were added."""
+    _check_set(s, "Set to list")
+    return KaynatList(list(s.value))
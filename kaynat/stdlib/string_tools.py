@@ -4,8 +4,11 @@ Kaynat String Tools - String manipulation operations.
 Provides comprehensive string functionality for Kaynat programs.
 """
 
-from kaynat.interpreter.runtime_types import KaynatString, KaynatNumber, KaynatBoolean, KaynatList
+from kaynat.interpreter.runtime_types import (
+    KaynatString, KaynatNumber, KaynatBoolean, KaynatList, KaynatMappedFile, KaynatTextIndex
+)
 from kaynat.errors.error_types import TypeError as KaynatTypeError, ValueError as KaynatValueError
+from kaynat.dsa.text_search import find_all, SuffixArray
 
 
 def to_uppercase(text):
@@ -63,7 +66,12 @@ def trim_right(text):
 
 
 def starts_with(text, prefix):
-    """Check if string starts with prefix."""
+    """Check if string (or mapped file) starts with prefix."""
+    if isinstance(text, KaynatMappedFile):
+        p = prefix.value if isinstance(prefix, KaynatString) else str(prefix)
+        encoded = p.encode('utf-8')
+        return KaynatBoolean(text.data[:len(encoded)] == encoded)
+    
     if not isinstance(text, (str, KaynatString)):
         raise KaynatTypeError("Starts with requires a string")
     
@@ -74,7 +82,12 @@ def starts_with(text, prefix):
 
 
 def ends_with(text, suffix):
-    """Check if string ends with suffix."""
+    """Check if string (or mapped file) ends with suffix."""
+    if isinstance(text, KaynatMappedFile):
+        suf = suffix.value if isinstance(suffix, KaynatString) else str(suffix)
+        encoded = suf.encode('utf-8')
+        return KaynatBoolean(len(text) >= len(encoded) and text.data[len(text) - len(encoded):] == encoded)
+    
     if not isinstance(text, (str, KaynatString)):
         raise KaynatTypeError("Ends with requires a string")
     
@@ -85,7 +98,11 @@ def ends_with(text, suffix):
 
 
 def contains(text, substring):
-    """Check if string contains substring."""
+    """Check if string (or mapped file) contains substring."""
+    if isinstance(text, KaynatMappedFile):
+        sub = substring.value if isinstance(substring, KaynatString) else str(substring)
+        return KaynatBoolean(text.find(sub) != -1)
+    
     if not isinstance(text, (str, KaynatString)):
         raise KaynatTypeError("Contains requires a string")
     
@@ -96,7 +113,11 @@ def contains(text, substring):
 
 
 def find_position(text, substring):
-    """Find position of substring (-1 if not found)."""
+    """Find position of substring (-1 if not found); byte offset for mapped files."""
+    if isinstance(text, KaynatMappedFile):
+        sub = substring.value if isinstance(substring, KaynatString) else str(substring)
+        return KaynatNumber(text.find(sub))
+    
     if not isinstance(text, (str, KaynatString)):
         raise KaynatTypeError("Find position requires a string")
     
@@ -106,6 +127,59 @@ def find_position(text, substring):
     return KaynatNumber(s.find(sub))
 
 
+def _search_operands(text, pattern, name):
+    """Get raw text and pattern; bytes for mapped files."""
+    sub = pattern.value if isinstance(pattern, KaynatString) else str(pattern)
+    if isinstance(text, KaynatMappedFile):
+        return text.data, sub.encode('utf-8')
+    if not isinstance(text, (str, KaynatString)):
+        raise KaynatTypeError(f"{name} requires a string")
+    return (text.value if isinstance(text, KaynatString) else text), sub
+
+
+def find_all_positions(text, pattern, method='horspool'):
+    """Find every position of pattern, overlaps included, using horspool or kmp."""
+    s, sub = _search_operands(text, pattern, "Find all positions")
+    method = method.value if isinstance(method, KaynatString) else method
+    return KaynatList.from_numbers(find_all(s, sub, method))
+
+
+def build_text_index(text):
+    """Index a text once so later searches take O(m log n)."""
+    if isinstance(text, KaynatMappedFile):
+        return KaynatTextIndex(SuffixArray(text.data[:]))
+    if not isinstance(text, (str, KaynatString)):
+        raise KaynatTypeError("Build text index requires a string")
+    return KaynatTextIndex(SuffixArray(text.value if isinstance(text, KaynatString) else text))
+
+
+def _index_pattern(index, pattern, name):
+    if not isinstance(index, KaynatTextIndex):
+        raise KaynatTypeError(f"{name} requires a text index")
+    sub = pattern.value if isinstance(pattern, KaynatString) else str(pattern)
+    if not sub:
+        raise KaynatValueError("Pattern cannot be empty")
+    return sub if isinstance(index.value.text, str) else sub.encode('utf-8')
+
+
+def index_positions(index, pattern):
+    """Find every position of pattern in an indexed text, in order."""
+    return KaynatList.from_numbers(index.value.positions(_index_pattern(index, pattern, "Index positions")))
+
+
+def index_count(index, pattern):
+    """Count occurrences of pattern in an indexed text."""
+    return KaynatNumber(index.value.count(_index_pattern(index, pattern, "Index count")))
+
+
+def longest_repeat(index):
+    """Find the longest substring that occurs at least twice in an indexed text."""
+    if not isinstance(index, KaynatTextIndex):
+        raise KaynatTypeError("Longest repeat requires a text index")
+    repeat = index.value.longest_repeat()
+    return KaynatString(repeat if isinstance(repeat, str) else repeat.decode('utf-8', errors='replace'))
+
+
 def replace_text(text, old, new):
     """Replace all occurrences of old with new."""
     if not isinstance(text, (str, KaynatString)):
@@ -143,17 +217,20 @@ def join_strings(strings, separator=''):
 
 
 def substring(text, start, end=None):
-    """Extract substring from start to end."""
-    if not isinstance(text, (str, KaynatString)):
+    """Extract substring from start to end (byte offsets for mapped files)."""
+    if isinstance(text, KaynatMappedFile):
+        s = text
+    elif isinstance(text, (str, KaynatString)):
+        s = text.value if isinstance(text, KaynatString) else text
+    else:
         raise KaynatTypeError("Substring requires a string")
     
-    s = text.value if isinstance(text, KaynatString) else text
     start_idx = int(start.value if isinstance(start, KaynatNumber) else start)
     
-    if end is None:
-        return KaynatString(s[start_idx:])
+    end_idx = None if end is None else int(end.value if isinstance(end, KaynatNumber) else end)
     
-    end_idx = int(end.value if isinstance(end, KaynatNumber) else end)
+    if isinstance(s, KaynatMappedFile):
+        return KaynatString(s.slice(start_idx, end_idx))
     return KaynatString(s[start_idx:end_idx])
 
 
@@ -180,7 +257,10 @@ def repeat_string(text, count):
 
 
 def string_length(text):
-    """Get length of string."""
+    """Get length of string (in bytes for mapped files)."""
+    if isinstance(text, KaynatMappedFile):
+        return KaynatNumber(len(text))
+    
     if not isinstance(text, (str, KaynatString)):
         raise KaynatTypeError("Length requires a string")
     
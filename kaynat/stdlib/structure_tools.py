@@ -0,0 +1,874 @@
+"""
+Kaynat Structure Tools - Data structures from kaynat.dsa as runtime values.
+
+Wraps the dsa classes so Kaynat programs can create and use them
+directly, with the same operations their statements use.
+"""
+
+from kaynat.interpreter.runtime_types import (
+    KaynatPriorityQueue, KaynatPriorityHandle, KaynatLinkedList, KaynatListNode, KaynatSortedList,
+    KaynatStack, KaynatQueue, KaynatHeap, KaynatTree, KaynatGraph, KaynatHashMap, KaynatTrie,
+    KaynatWordSequence, KaynatList, KaynatMap, KaynatNumber, KaynatString, KaynatBoolean, KaynatNull,
+    KaynatSequence, iterate_values, box_json
+)
+from kaynat.dsa.stack import Stack
+from kaynat.dsa.queue import Queue
+from kaynat.dsa.heap import MinHeap, MaxHeap, PriorityQueue
+from kaynat.dsa.binary_search_tree import BinarySearchTree
+from kaynat.dsa.graph import Graph
+from kaynat.dsa.hash_map import HashMap
+from kaynat.dsa.trie import Trie
+from kaynat.dsa.linked_list import LinkedList
+from kaynat.dsa.sorted_list import SortedList
+from kaynat.dsa.sorting import raw_key
+from kaynat.stdlib.list_tools import make_sort_key
+from kaynat.errors.error_types import TypeError as KaynatTypeError, ValueError as KaynatValueError
+
+
+def _flag(value):
+    if isinstance(value, KaynatBoolean):
+        return value.is_truthy()
+    return bool(value)
+
+
+def _text(value):
+    return value.value if isinstance(value, KaynatString) else str(raw_key(value))
+
+
+def _count(value):
+    return int(value.value if isinstance(value, KaynatNumber) else value)
+
+
+def _items(items, name):
+    if not isinstance(items, (KaynatList, KaynatSequence)):
+        raise KaynatTypeError(f"{name} requires a list")
+    return iterate_values(items)
+
+
+def _check(structure, kind, name):
+    if not isinstance(structure, kind):
+        raise KaynatTypeError(f"{name} requires a {kind.kind}")
+
+
+def _priority(value):
+    """Get a raw, comparable priority from a number or string."""
+    if isinstance(value, (KaynatNumber, KaynatString)):
+        return value.value
+    if isinstance(value, (int, float, str)) and not isinstance(value, bool):
+        return value
+    raise KaynatTypeError("Priority must be a number or a string")
+
+
+def _check_queue(pq, name):
+    if not isinstance(pq, KaynatPriorityQueue):
+        raise KaynatTypeError(f"{name} requires a priority queue")
+
+
+def _check_handle(handle, name):
+    if not isinstance(handle, KaynatPriorityHandle):
+        raise KaynatTypeError(f"{name} requires a priority queue entry")
+
+
+def _pairs(items, name):
+    """Get (item, priority) pairs from a list of [item, priority] lists."""
+    if not isinstance(items, (KaynatList, KaynatSequence)):
+        raise KaynatTypeError(f"{name} requires a list of [item, priority] pairs")
+    pairs = []
+    for pair in iterate_values(items):
+        if not isinstance(pair, KaynatList) or len(pair.value) != 2:
+            raise KaynatTypeError(f"{name} requires a list of [item, priority] pairs")
+        pairs.append((pair.value[0], _priority(pair.value[1])))
+    return pairs
+
+
+def create_priority_queue(highest_first=False):
+    """Create an empty priority queue; lowest priority comes out first unless highest_first."""
+    return KaynatPriorityQueue(PriorityQueue(_flag(highest_first)))
+
+
+def priority_queue_from(items, highest_first=False):
+    """Build a priority queue from [item, priority] pairs in linear time."""
+    pairs = _pairs(items, "Priority queue from")
+    return KaynatPriorityQueue(PriorityQueue.from_pairs(pairs, _flag(highest_first)))
+
+
+def priority_push(pq, item, priority):
+    """Add item with priority and return a handle to its entry."""
+    _check_queue(pq, "Priority push")
+    return KaynatPriorityHandle(pq.value.push(item, _priority(priority)))
+
+
+def priority_push_all(pq, items):
+    """Add many [item, priority] pairs and return their handles."""
+    _check_queue(pq, "Priority push all")
+    handles = pq.value.push_all(_pairs(items, "Priority push all"))
+    return KaynatList([KaynatPriorityHandle(h) for h in handles])
+
+
+def priority_pop(pq):
+    """Remove and return the item that comes out next."""
+    _check_queue(pq, "Priority pop")
+    item, _ = pq.value.pop()
+    return item
+
+
+def priority_pop_many(pq, k):
+    """Remove and return up to k items in order."""
+    _check_queue(pq, "Priority pop many")
+    n = int(k.value if isinstance(k, KaynatNumber) else k)
+    return KaynatList([item for item, _ in pq.value.pop_many(n)])
+
+
+def priority_peek(pq):
+    """Get the item that comes out next without removing it."""
+    _check_queue(pq, "Priority peek")
+    item, _ = pq.value.peek()
+    return item
+
+
+def priority_change(pq, handle, priority):
+    """Give an entry a new priority."""
+    _check_queue(pq, "Priority change")
+    _check_handle(handle, "Priority change")
+    pq.value.change_priority(handle.value, _priority(priority))
+    return KaynatBoolean(True)
+
+
+def priority_decrease(pq, handle, priority):
+    """Lower an entry's priority."""
+    _check_queue(pq, "Priority decrease")
+    _check_handle(handle, "Priority decrease")
+    pq.value.decrease_key(handle.value, _priority(priority))
+    return KaynatBoolean(True)
+
+
+def priority_increase(pq, handle, priority):
+    """Raise an entry's priority."""
+    _check_queue(pq, "Priority increase")
+    _check_handle(handle, "Priority increase")
+    pq.value.increase_key(handle.value, _priority(priority))
+    return KaynatBoolean(True)
+
+
+def priority_remove(pq, handle):
+    """Remove an entry by its handle and return its item."""
+    _check_queue(pq, "Priority remove")
+    _check_handle(handle, "Priority remove")
+    item, _ = pq.value.remove(handle.value)
+    return item
+
+
+def priority_size(pq):
+    """Get number of entries in a priority queue."""
+    _check_queue(pq, "Priority size")
+    return KaynatNumber(len(pq.value))
+
+
+def _check_linked(ll, name):
+    if not isinstance(ll, KaynatLinkedList):
+        raise KaynatTypeError(f"{name} requires a linked list")
+
+
+def _check_node(node, name):
+    if not isinstance(node, KaynatListNode):
+        raise KaynatTypeError(f"{name} requires a linked list node")
+
+
+def create_linked_list(items=None):
+    """Create a linked list, optionally from the items of a list or sequence."""
+    if items is None:
+        return KaynatLinkedList(LinkedList())
+    if not isinstance(items, (KaynatList, KaynatSequence)):
+        raise KaynatTypeError("Create linked list requires a list")
+    return KaynatLinkedList(LinkedList(iterate_values(items)))
+
+
+def linked_append(ll, item):
+    """Add item at the end and return its node."""
+    _check_linked(ll, "Linked append")
+    return KaynatListNode(ll.value.append(item))
+
+
+def linked_prepend(ll, item):
+    """Add item at the beginning and return its node."""
+    _check_linked(ll, "Linked prepend")
+    return KaynatListNode(ll.value.prepend(item))
+
+
+def linked_insert_after(ll, node, item):
+    """Add item after node and return the new node."""
+    _check_linked(ll, "Linked insert after")
+    _check_node(node, "Linked insert after")
+    return KaynatListNode(ll.value.insert_after(node.value, item))
+
+
+def linked_remove(ll, node):
+    """Remove node and return its item."""
+    _check_linked(ll, "Linked remove")
+    _check_node(node, "Linked remove")
+    return ll.value.remove(node.value)
+
+
+def linked_move_to_end(ll, node):
+    """Move node to the end."""
+    _check_linked(ll, "Linked move to end")
+    _check_node(node, "Linked move to end")
+    ll.value.move_to_end(node.value)
+    return KaynatBoolean(True)
+
+
+def linked_move_to_front(ll, node):
+    """Move node to the beginning."""
+    _check_linked(ll, "Linked move to front")
+    _check_node(node, "Linked move to front")
+    ll.value.move_to_front(node.value)
+    return KaynatBoolean(True)
+
+
+def linked_pop(ll):
+    """Remove and return the last item."""
+    _check_linked(ll, "Linked pop")
+    return ll.value.pop()
+
+
+def linked_pop_first(ll):
+    """Remove and return the first item."""
+    _check_linked(ll, "Linked pop first")
+    return ll.value.pop_first()
+
+
+def linked_first(ll):
+    """Get the first item."""
+    _check_linked(ll, "Linked first")
+    return ll.value.first()
+
+
+def linked_last(ll):
+    """Get the last item."""
+    _check_linked(ll, "Linked last")
+    return ll.value.last()
+
+
+def node_value(node):
+    """Get the item stored in a linked list node."""
+    _check_node(node, "Node value")
+    return node.value.value
+
+
+def linked_size(ll):
+    """Get number of items in a linked list."""
+    _check_linked(ll, "Linked size")
+    return ll.value.size()
+
+
+def linked_to_list(ll):
+    """Get the items of a linked list as a list."""
+    _check_linked(ll, "Linked to list")
+    return ll.value.to_list()
+
+
+def _check_sorted(sl, name):
+    if not isinstance(sl, KaynatSortedList):
+        raise KaynatTypeError(f"{name} requires a sorted list")
+
+
+def _or_nothing(value):
+    return value if value is not None else KaynatNull()
+
+
+def create_sorted_list(items=None, key=None, caller=None):
+    """Create a sorted list, optionally from items and ordered by a key function or field name."""
+    key_func = make_sort_key(key, caller, "Create sorted list") if key is not None else None
+    if items is None:
+        return KaynatSortedList(SortedList(key=key_func))
+    if not isinstance(items, (KaynatList, KaynatSequence)):
+        raise KaynatTypeError("Create sorted list requires a list")
+    return KaynatSortedList(SortedList(iterate_values(items), key_func))
+
+
+def sorted_add(sl, item):
+    """Insert item in order and return its position."""
+    _check_sorted(sl, "Sorted add")
+    return KaynatNumber(sl.value.add(item))
+
+
+def sorted_add_all(sl, items):
+    """Insert every item of a list or sequence."""
+    _check_sorted(sl, "Sorted add all")
+    if not isinstance(items, (KaynatList, KaynatSequence)):
+        raise KaynatTypeError("Sorted add all requires a list")
+    sl.value.add_all(iterate_values(items))
+    return sl
+
+
+def sorted_remove(sl, item):
+    """Remove one occurrence of item; give whether it was found."""
+    _check_sorted(sl, "Sorted remove")
+    return KaynatBoolean(sl.value.remove(item))
+
+
+def sorted_get(sl, index):
+    """Get the item at a position."""
+    _check_sorted(sl, "Sorted get")
+    i = int(index.value if isinstance(index, KaynatNumber) else index)
+    if i < 0 or i >= len(sl.value):
+        raise KaynatValueError(f"Position {i} out of range")
+    return sl.value[i]
+
+
+def sorted_lower_bound(sl, key):
+    """Position of the first item whose key is at least key."""
+    _check_sorted(sl, "Sorted lower bound")
+    return KaynatNumber(sl.value.lower_bound(raw_key(key)))
+
+
+def sorted_upper_bound(sl, key):
+    """Position of the first item whose key is greater than key."""
+    _check_sorted(sl, "Sorted upper bound")
+    return KaynatNumber(sl.value.upper_bound(raw_key(key)))
+
+
+def sorted_count_range(sl, low, high):
+    """Count items with keys from low to high inclusive."""
+    _check_sorted(sl, "Sorted count range")
+    return KaynatNumber(sl.value.count_range(raw_key(low), raw_key(high)))
+
+
+def sorted_range(sl, low, high):
+    """Get items with keys from low to high inclusive, in order."""
+    _check_sorted(sl, "Sorted range")
+    return KaynatList(sl.value.range(raw_key(low), raw_key(high)))
+
+
+def sorted_floor(sl, key):
+    """Get the last item whose key is at most key, or nothing."""
+    _check_sorted(sl, "Sorted floor")
+    return _or_nothing(sl.value.floor(raw_key(key)))
+
+
+def sorted_ceiling(sl, key):
+    """Get the first item whose key is at least key, or nothing."""
+    _check_sorted(sl, "Sorted ceiling")
+    return _or_nothing(sl.value.ceiling(raw_key(key)))
+
+
+def sorted_nearest(sl, key):
+    """Get the item whose numeric key is closest to key, or nothing when empty."""
+    _check_sorted(sl, "Sorted nearest")
+    return _or_nothing(sl.value.nearest(raw_key(key)))
+
+
+def sorted_size(sl):
+    """Get number of items in a sorted list."""
+    _check_sorted(sl, "Sorted size")
+    return KaynatNumber(len(sl.value))
+
+
+def sorted_to_list(sl):
+    """Get the items of a sorted list as a list."""
+    _check_sorted(sl, "Sorted to list")
+    return KaynatList(list(sl.value.values))
+
+
+def create_stack(items=None):
+    """Create a stack, optionally pushing the items of a list in order."""
+    stack = Stack()
+    if items is not None:
+        stack.items.extend(_items(items, "Create stack"))
+    return KaynatStack(stack)
+
+
+def stack_push(stack, item):
+    """Push item onto the top of a stack."""
+    _check(stack, KaynatStack, "Stack push")
+    stack.value.push(item)
+    return stack
+
+
+def stack_pop(stack):
+    """Remove and return the top item."""
+    _check(stack, KaynatStack, "Stack pop")
+    return stack.value.pop()
+
+
+def stack_peek(stack):
+    """Get the top item without removing it."""
+    _check(stack, KaynatStack, "Stack peek")
+    return stack.value.peek()
+
+
+def stack_size(stack):
+    """Get number of items in a stack."""
+    _check(stack, KaynatStack, "Stack size")
+    return stack.value.size()
+
+
+def stack_to_list(stack):
+    """Get the items of a stack as a list, bottom first."""
+    _check(stack, KaynatStack, "Stack to list")
+    return stack.value.to_list()
+
+
+def create_queue(items=None):
+    """Create a queue, optionally enqueuing the items of a list in order."""
+    queue = Queue()
+    if items is not None:
+        queue.items.extend(_items(items, "Create queue"))
+    return KaynatQueue(queue)
+
+
+def queue_enqueue(queue, item):
+    """Add item at the rear of a queue."""
+    _check(queue, KaynatQueue, "Queue enqueue")
+    queue.value.enqueue(item)
+    return queue
+
+
+def queue_dequeue(queue):
+    """Remove and return the front item."""
+    _check(queue, KaynatQueue, "Queue dequeue")
+    return queue.value.dequeue()
+
+
+def queue_peek(queue):
+    """Get the front item without removing it."""
+    _check(queue, KaynatQueue, "Queue peek")
+    return queue.value.peek()
+
+
+def queue_size(queue):
+    """Get number of items in a queue."""
+    _check(queue, KaynatQueue, "Queue size")
+    return queue.value.size()
+
+
+def queue_to_list(queue):
+    """Get the items of a queue as a list, front first."""
+    _check(queue, KaynatQueue, "Queue to list")
+    return queue.value.to_list()
+
+
+def _create_heap(items, key, caller, highest_first, name):
+    key_func = make_sort_key(key, caller, name) if key is not None else raw_key
+    heap = (MaxHeap if highest_first else MinHeap)(key=key_func)
+    if items is not None:
+        for item in _items(items, name):
+            heap.insert(item)
+    return KaynatHeap(heap, highest_first)
+
+
+def create_min_heap(items=None, key=None, caller=None):
+    """Create a heap that gives back its smallest item first."""
+    return _create_heap(items, key, caller, False, "Create min heap")
+
+
+def create_max_heap(items=None, key=None, caller=None):
+    """Create a heap that gives back its largest item first."""
+    return _create_heap(items, key, caller, True, "Create max heap")
+
+
+def heap_insert(heap, item):
+    """Add item to a heap."""
+    _check(heap, KaynatHeap, "Heap insert")
+    try:
+        heap.value.insert(item)
+    except TypeError:
+        raise KaynatTypeError("Heap items must be comparable with each other")
+    return heap
+
+
+def heap_extract(heap):
+    """Remove and return the smallest item of a min heap or the largest of a max heap."""
+    _check(heap, KaynatHeap, "Heap extract")
+    if heap.highest_first:
+        return heap.value.extract_max()
+    return heap.value.extract_min()
+
+
+def heap_peek(heap):
+    """Get the item that comes out next without removing it."""
+    _check(heap, KaynatHeap, "Heap peek")
+    return heap.value.peek()
+
+
+def heap_size(heap):
+    """Get number of items in a heap."""
+    _check(heap, KaynatHeap, "Heap size")
+    return KaynatNumber(len(heap.value))
+
+
+def create_tree(items=None, key=None, caller=None):
+    """Create a balanced search tree, optionally from items and ordered by a key."""
+    key_func = make_sort_key(key, caller, "Create tree") if key is not None else raw_key
+    tree = BinarySearchTree(key=key_func)
+    if items is not None:
+        for item in _items(items, "Create tree"):
+            tree.insert(item)
+    return KaynatTree(tree)
+
+
+def _tree_call(method, *args):
+    try:
+        return method(*args)
+    except TypeError:
+        raise KaynatTypeError("Tree items must be comparable with each other")
+
+
+def tree_insert(tree, item):
+    """Add item to a tree."""
+    _check(tree, KaynatTree, "Tree insert")
+    _tree_call(tree.value.insert, item)
+    return tree
+
+
+def tree_delete(tree, item):
+    """Remove one copy of item; give whether it was found."""
+    _check(tree, KaynatTree, "Tree delete")
+    return KaynatBoolean(_tree_call(tree.value.delete, item))
+
+
+def tree_contains(tree, item):
+    """Check if a tree holds item."""
+    _check(tree, KaynatTree, "Tree contains")
+    return KaynatBoolean(_tree_call(tree.value.search, item))
+
+
+def tree_min(tree):
+    """Get the smallest item."""
+    _check(tree, KaynatTree, "Tree min")
+    return tree.value.min()
+
+
+def tree_max(tree):
+    """Get the largest item."""
+    _check(tree, KaynatTree, "Tree max")
+    return tree.value.max()
+
+
+def tree_kth(tree, k):
+    """Get the kth smallest item, counting from 1."""
+    _check(tree, KaynatTree, "Tree kth")
+    return tree.value.kth_smallest(_count(k))
+
+
+def tree_rank(tree, item):
+    """Count the items smaller than item."""
+    _check(tree, KaynatTree, "Tree rank")
+    return KaynatNumber(_tree_call(tree.value.rank, item))
+
+
+def tree_range(tree, low, high):
+    """Get the items from low to high inclusive, in order."""
+    _check(tree, KaynatTree, "Tree range")
+    return KaynatList(_tree_call(lambda: list(tree.value.range(low, high))))
+
+
+def tree_size(tree):
+    """Get number of items in a tree."""
+    _check(tree, KaynatTree, "Tree size")
+    return KaynatNumber(len(tree.value))
+
+
+def tree_height(tree):
+    """Get the height of a tree."""
+    _check(tree, KaynatTree, "Tree height")
+    return KaynatNumber(tree.value.height())
+
+
+def tree_to_list(tree):
+    """Get the items of a tree as a list, in order."""
+    _check(tree, KaynatTree, "Tree to list")
+    return KaynatList(list(tree.value.inorder()))
+
+
+def _node(node):
+    try:
+        hash(node)
+    except TypeError:
+        raise KaynatTypeError("Graph nodes must be numbers, strings or booleans")
+    return node
+
+
+def _weight(weight):
+    if isinstance(weight, KaynatNumber):
+        return weight.value
+    if isinstance(weight, (int, float)) and not isinstance(weight, bool):
+        return weight
+    raise KaynatTypeError("Edge weight must be a number")
+
+
+def create_graph(directed=True):
+    """Create an empty graph; edges go both ways unless directed."""
+    return KaynatGraph(Graph(directed=_flag(directed)))
+
+
+def graph_add_node(graph, node):
+    """Add a node to a graph."""
+    _check(graph, KaynatGraph, "Graph add node")
+    graph.value.add_node(_node(node))
+    return graph
+
+
+def graph_add_edge(graph, from_node, to_node, weight=1):
+    """Add an edge, with an optional weight."""
+    _check(graph, KaynatGraph, "Graph add edge")
+    graph.value.add_edge(_node(from_node), _node(to_node), _weight(weight))
+    return graph
+
+
+def graph_neighbors(graph, node):
+    """Get the nodes an edge leads to from node."""
+    _check(graph, KaynatGraph, "Graph neighbors")
+    return KaynatList(graph.value.neighbors(_node(node)))
+
+
+def graph_bfs(graph, start):
+    """Get the nodes reachable from start in breadth-first order."""
+    _check(graph, KaynatGraph, "Graph bfs")
+    return KaynatList(graph.value.bfs(_node(start)))
+
+
+def graph_dfs(graph, start):
+    """Get the nodes reachable from start in depth-first order."""
+    _check(graph, KaynatGraph, "Graph dfs")
+    return KaynatList(graph.value.dfs(_node(start)))
+
+
+def graph_shortest_path(graph, source, target):
+    """Find the shortest path; gives a map with distance (nothing if unreachable) and path."""
+    _check(graph, KaynatGraph, "Graph shortest path")
+    distance, path = graph.value.shortest_path(_node(source), _node(target))
+    return KaynatMap({
+        'distance': KaynatNumber(distance) if distance is not None else KaynatNull(),
+        'path': KaynatList(path),
+    })
+
+
+def _distance_map(distances):
+    return KaynatMap({node.to_string(): KaynatNumber(d) for node, d in distances.items()})
+
+
+def graph_distances(graph, source):
+    """Get a map from each reachable node to its shortest distance from source."""
+    _check(graph, KaynatGraph, "Graph distances")
+    return _distance_map(graph.value.dijkstra(_node(source)))
+
+
+def graph_bellman_ford(graph, source):
+    """Get shortest distances from source like graph_distances, allowing negative weights."""
+    _check(graph, KaynatGraph, "Graph bellman ford")
+    return _distance_map(graph.value.bellman_ford(_node(source)))
+
+
+def graph_topological_sort(graph):
+    """Order the nodes so every edge points forward."""
+    _check(graph, KaynatGraph, "Graph topological sort")
+    return KaynatList(graph.value.topological_sort())
+
+
+def graph_components(graph):
+    """Get the connected components, ignoring edge direction, as lists of nodes."""
+    _check(graph, KaynatGraph, "Graph components")
+    return KaynatList([KaynatList(component) for component in graph.value.connected_components()])
+
+
+def graph_strong_components(graph):
+    """Get the strongly connected components as lists of nodes."""
+    _check(graph, KaynatGraph, "Graph strong components")
+    return KaynatList([KaynatList(component) for component in graph.value.strongly_connected_components()])
+
+
+def graph_has_cycle(graph):
+    """Check if a graph contains a cycle."""
+    _check(graph, KaynatGraph, "Graph has cycle")
+    return KaynatBoolean(graph.value.has_cycle())
+
+
+def _spanning_map(total, edges):
+    return KaynatMap({
+        'weight': KaynatNumber(total),
+        'edges': KaynatList([KaynatList([u, v, KaynatNumber(w)]) for u, v, w in edges]),
+    })
+
+
+def graph_spanning_tree(graph):
+    """Get the minimum spanning forest as a map with its weight and [from, to, weight] edges."""
+    _check(graph, KaynatGraph, "Graph spanning tree")
+    return _spanning_map(*graph.value.kruskal())
+
+
+def graph_prim(graph):
+    """Get the minimum spanning forest like graph_spanning_tree, grown with Prim's algorithm."""
+    _check(graph, KaynatGraph, "Graph prim")
+    return _spanning_map(*graph.value.prim())
+
+
+def graph_node_count(graph):
+    """Get number of nodes in a graph."""
+    _check(graph, KaynatGraph, "Graph node count")
+    return KaynatNumber(graph.value.node_count())
+
+
+def graph_edge_count(graph):
+    """Get number of edges in a graph."""
+    _check(graph, KaynatGraph, "Graph edge count")
+    return KaynatNumber(graph.value.edge_count())
+
+
+def _edge_label(name):
+    return _node(box_json(name))
+
+
+def graph_load_edges(graph, filepath, weighted=True, dedupe=False):
+    """Add every edge of a CSV, TSV or JSON-lines edge list (dedupe skips existing ones); gives the number added."""
+    _check(graph, KaynatGraph, "Graph load edges")
+    return KaynatNumber(graph.value.load_edges(
+        _text(filepath), weighted=_flag(weighted), dedupe=_flag(dedupe), label=_edge_label
+    ))
+
+
+def graph_save(graph, filepath):
+    """Write a graph to a binary file."""
+    _check(graph, KaynatGraph, "Graph save")
+    graph.value.save(_text(filepath), encode=raw_key)
+    return KaynatBoolean(True)
+
+
+def graph_load(filepath):
+    """Read a graph written by graph_save."""
+    return KaynatGraph(Graph.load(_text(filepath), decode=box_json))
+
+
+def create_hash_map(pairs=None):
+    """Create a hash map, optionally filled from a map."""
+    table = HashMap()
+    if pairs is not None:
+        hash_put_all(KaynatHashMap(table), pairs)
+    return KaynatHashMap(table)
+
+
+def hash_put(table, key, value):
+    """Store value under key."""
+    _check(table, KaynatHashMap, "Hash put")
+    table.value.put(key, value)
+    return table
+
+
+def hash_put_all(table, pairs):
+    """Store every key and value of a map."""
+    _check(table, KaynatHashMap, "Hash put all")
+    if not isinstance(pairs, KaynatMap):
+        raise KaynatTypeError("Hash put all requires a map")
+    # Map keys are plain strings; box them like any string key
+    table.value.put_all({KaynatString(key): value for key, value in pairs.value.items()})
+    return table
+
+
+def hash_get(table, key):
+    """Get the value stored under key, or nothing."""
+    _check(table, KaynatHashMap, "Hash get")
+    return _or_nothing(table.value.get(key))
+
+
+def hash_remove(table, key):
+    """Remove key; give whether it was present."""
+    _check(table, KaynatHashMap, "Hash remove")
+    return KaynatBoolean(table.value.remove(key))
+
+
+def hash_contains(table, key):
+    """Check if a hash map has key."""
+    _check(table, KaynatHashMap, "Hash contains")
+    return KaynatBoolean(key in table.value)
+
+
+def hash_size(table):
+    """Get number of keys in a hash map."""
+    _check(table, KaynatHashMap, "Hash size")
+    return KaynatNumber(len(table.value))
+
+
+def hash_keys(table):
+    """Get the keys of a hash map as a list."""
+    _check(table, KaynatHashMap, "Hash keys")
+    return KaynatList(list(table.value.keys()))
+
+
+def hash_values(table):
+    """Get the values of a hash map as a list."""
+    _check(table, KaynatHashMap, "Hash values")
+    return KaynatList(list(table.value.values()))
+
+
+def hash_load_factor(table):
+    """Get the fraction of a hash map's slots that hold a key."""
+    _check(table, KaynatHashMap, "Hash load factor")
+    return KaynatNumber(table.value.load_factor())
+
+
+def hash_stats(table):
+    """Get a map of a hash map's size, capacity, load factor, resizes and probe lengths."""
+    _check(table, KaynatHashMap, "Hash stats")
+    return KaynatMap({name: KaynatNumber(value) for name, value in table.value.stats().items()})
+
+
+def create_trie(words=None):
+    """Create a trie, optionally from a list of words."""
+    if words is None:
+        return KaynatTrie(Trie())
+    return KaynatTrie(Trie.from_sorted(sorted(_text(word) for word in _items(words, "Create trie"))))
+
+
+def trie_insert(trie, word, frequency=1):
+    """Add word, or raise its frequency if it is already there."""
+    _check(trie, KaynatTrie, "Trie insert")
+    trie.value.insert(_text(word), _count(frequency))
+    return trie
+
+
+def trie_contains(trie, word):
+    """Check if a trie holds word."""
+    _check(trie, KaynatTrie, "Trie contains")
+    return KaynatBoolean(trie.value.search(_text(word)))
+
+
+def trie_delete(trie, word):
+    """Remove word; give whether it was there."""
+    _check(trie, KaynatTrie, "Trie delete")
+    return KaynatBoolean(trie.value.delete(_text(word)))
+
+
+def trie_frequency(trie, word):
+    """Get how often word was inserted, 0 when absent."""
+    _check(trie, KaynatTrie, "Trie frequency")
+    return KaynatNumber(trie.value.frequency(_text(word)))
+
+
+def trie_starts_with(trie, prefix):
+    """Check if any word starts with prefix."""
+    _check(trie, KaynatTrie, "Trie starts with")
+    return KaynatBoolean(trie.value.starts_with(_text(prefix)))
+
+
+def trie_words(trie, prefix=None):
+    """Get the words starting with prefix as a lazy sequence in sorted order."""
+    _check(trie, KaynatTrie, "Trie words")
+    return KaynatWordSequence(trie.value, _text(prefix) if prefix is not None else '')
+
+
+def trie_top(trie, prefix, k):
+    """Get the k most frequent words starting with prefix."""
+    _check(trie, KaynatTrie, "Trie top")
+    return KaynatList([KaynatString(word) for word, _ in trie.value.top_k(_text(prefix), _count(k))])
+
+
+def trie_save(trie, filepath):
+    """Write a trie to a binary file."""
+    _check(trie, KaynatTrie, "Trie save")
+    trie.value.save(_text(filepath))
+    return KaynatBoolean(True)
+
+
+def trie_load(filepath):
+    """Read a trie written by trie_save."""
+    return KaynatTrie(Trie.load(_text(filepath)))
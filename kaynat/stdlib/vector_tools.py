@@ -0,0 +1,268 @@
+"""
+Kaynat Vector Tools - Element-wise math and statistics over lists.
+
+Extends math_tools with operations that work on whole numeric lists
+in a single call. NumPy is used when it is installed and only where
+it produces exactly the same result as the pure-Python fallback;
+reductions always go through math.fsum so both paths agree.
+"""
+
+import math
+from itertools import accumulate
+from kaynat.interpreter.runtime_types import KaynatNumber, KaynatBoolean, KaynatList
+from kaynat.errors.error_types import TypeError as KaynatTypeError, ValueError as KaynatValueError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Below this many elements NumPy's call overhead outweighs its speed
+NUMPY_THRESHOLD = 256
+
+
+def _numbers(values, name):
+    """Get raw numbers from a Kaynat list."""
+    if not isinstance(values, KaynatList):
+        raise KaynatTypeError(f"{name} requires a list of numbers")
+
+    data = values.numbers
+    if data is not None:
+        return data
+
+    raw = []
+    for item in values.value:
+        if not isinstance(item, KaynatNumber):
+            raise KaynatTypeError(f"{name} requires a list of numbers")
+        raw.append(item.value)
+    return raw
+
+
+def _operand(value, length, name):
+    """Get raw numbers from a list, or repeat a scalar to length."""
+    if isinstance(value, KaynatNumber):
+        return [value.value] * length
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return [value] * length
+
+    data = _numbers(value, name)
+    if len(data) != length:
+        raise KaynatValueError(f"{name} requires lists of equal length")
+    return data
+
+
+def _all_float(*sequences):
+    """Check if every sequence holds only floats."""
+    for seq in sequences:
+        if getattr(seq, 'typecode', None) == 'd':
+            continue
+        if not all(type(x) is float for x in seq):
+            return False
+    return True
+
+
+def _all_same_kind(*sequences):
+    """Check if the sequences are all ints or all floats."""
+    if _all_float(*sequences):
+        return True
+    for seq in sequences:
+        if getattr(seq, 'typecode', None) == 'q':
+            continue
+        if not all(type(x) is int for x in seq):
+            return False
+    return True
+
+
+def _use_numpy(length):
+    return np is not None and length >= NUMPY_THRESHOLD
+
+
+def _as_ndarray(seq):
+    """View an array.array without copying, or convert a list."""
+    if getattr(seq, 'typecode', None) == 'd':
+        return np.frombuffer(seq, dtype=np.float64)
+    if getattr(seq, 'typecode', None) == 'q':
+        return np.frombuffer(seq, dtype=np.int64)
+    return np.asarray(seq)
+
+
+def _from_ndarray(result):
+    """Convert a NumPy result back into a Kaynat list."""
+    return KaynatList.from_numbers(result.tolist())
+
+
+def _elementwise(a, b, name, operation, ufunc):
+    left = _numbers(a, name)
+    right = _operand(b, len(left), name)
+
+    if _use_numpy(len(left)) and _all_float(left, right):
+        return _from_ndarray(ufunc(_as_ndarray(left), _as_ndarray(right)))
+
+    return KaynatList.from_numbers(map(operation, left, right))
+
+
+def _compare(a, b, name, operation, ufunc):
+    left = _numbers(a, name)
+    right = _operand(b, len(left), name)
+
+    if _use_numpy(len(left)) and _all_same_kind(left, right):
+        mask = ufunc(_as_ndarray(left), _as_ndarray(right)).tolist()
+    else:
+        mask = list(map(operation, left, right))
+
+    return KaynatList([KaynatBoolean(flag) for flag in mask])
+
+
+def vector_add(a, b):
+    """Add a list and a list or number element-wise."""
+    return _elementwise(a, b, "Vector add", lambda x, y: x + y, np and np.add)
+
+
+def vector_subtract(a, b):
+    """Subtract a list or number from a list element-wise."""
+    return _elementwise(a, b, "Vector subtract", lambda x, y: x - y, np and np.subtract)
+
+
+def vector_multiply(a, b):
+    """Multiply a list by a list or number element-wise."""
+    return _elementwise(a, b, "Vector multiply", lambda x, y: x * y, np and np.multiply)
+
+
+def vector_divide(a, b):
+    """Divide a list by a list or number element-wise."""
+    left = _numbers(a, "Vector divide")
+    right = _operand(b, len(left), "Vector divide")
+    if any(y == 0 for y in right):
+        raise KaynatValueError("Cannot divide by zero")
+
+    if _use_numpy(len(left)) and _all_float(left, right):
+        return _from_ndarray(np.true_divide(_as_ndarray(left), _as_ndarray(right)))
+
+    return KaynatList.from_numbers(x / y for x, y in zip(left, right))
+
+
+def vector_greater(a, b):
+    """Compare element-wise, giving a list of booleans."""
+    return _compare(a, b, "Vector greater", lambda x, y: x > y, np and np.greater)
+
+
+def vector_less(a, b):
+    """Compare element-wise, giving a list of booleans."""
+    return _compare(a, b, "Vector less", lambda x, y: x < y, np and np.less)
+
+
+def vector_equal(a, b):
+    """Compare element-wise, giving a list of booleans."""
+    return _compare(a, b, "Vector equal", lambda x, y: x == y, np and np.equal)
+
+
+def vector_mask(values, mask):
+    """Keep the elements whose matching mask entry is true."""
+    data = _numbers(values, "Vector mask")
+    if not isinstance(mask, KaynatList):
+        raise KaynatTypeError("Vector mask requires a list of booleans")
+    if len(mask.value) != len(data):
+        raise KaynatValueError("Vector mask requires lists of equal length")
+
+    return KaynatList.from_numbers(
+        x for x, keep in zip(data, mask.value) if keep.is_truthy()
+    )
+
+
+def dot_product(a, b):
+    """Calculate the dot product of two lists."""
+    left = _numbers(a, "Dot product")
+    right = _operand(b, len(left), "Dot product")
+
+    if _all_same_kind(left, right) and not _all_float(left, right):
+        return KaynatNumber(sum(x * y for x, y in zip(left, right)))
+
+    if _use_numpy(len(left)) and _all_float(left, right):
+        products = np.multiply(_as_ndarray(left), _as_ndarray(right)).tolist()
+    else:
+        products = [x * y for x, y in zip(left, right)]
+    return KaynatNumber(math.fsum(products))
+
+
+def cumulative_sum(values):
+    """Running totals of a list."""
+    data = _numbers(values, "Cumulative sum")
+
+    if _use_numpy(len(data)) and _all_float(data):
+        return _from_ndarray(np.cumsum(_as_ndarray(data)))
+
+    return KaynatList.from_numbers(accumulate(data))
+
+
+def _total(data):
+    """Exact sum for ints, correctly rounded sum otherwise."""
+    if getattr(data, 'typecode', None) == 'q' or all(type(x) is int for x in data):
+        return sum(data)
+    return math.fsum(data)
+
+
+def _sorted(data):
+    if _use_numpy(len(data)) and _all_same_kind(data):
+        return np.sort(_as_ndarray(data)).tolist()
+    return sorted(data)
+
+
+def vector_mean(values):
+    """Arithmetic mean of a list."""
+    data = _numbers(values, "Mean")
+    if len(data) == 0:
+        raise KaynatValueError("Cannot calculate mean of empty list")
+    return KaynatNumber(_total(data) / len(data))
+
+
+def vector_median(values):
+    """Median of a list."""
+    data = _numbers(values, "Median")
+    if len(data) == 0:
+        raise KaynatValueError("Cannot calculate median of empty list")
+
+    ordered = _sorted(data)
+    mid = len(ordered) // 2
+    if len(ordered) % 2:
+        return KaynatNumber(ordered[mid])
+    return KaynatNumber((ordered[mid - 1] + ordered[mid]) / 2)
+
+
+def vector_variance(values, sample=False):
+    """Population variance of a list (sample variance if sample is true)."""
+    data = _numbers(values, "Variance")
+    is_sample = sample.is_truthy() if isinstance(sample, KaynatBoolean) else bool(sample)
+    divisor = len(data) - 1 if is_sample else len(data)
+    if divisor <= 0:
+        raise KaynatValueError("Not enough values to calculate variance")
+
+    mean = _total(data) / len(data)
+    if _use_numpy(len(data)) and _all_float(data):
+        diffs = np.subtract(_as_ndarray(data), mean)
+        squares = np.multiply(diffs, diffs).tolist()
+    else:
+        squares = [(x - mean) * (x - mean) for x in data]
+    return KaynatNumber(math.fsum(squares) / divisor)
+
+
+def vector_percentile(values, percent):
+    """Percentile of a list using linear interpolation."""
+    data = _numbers(values, "Percentile")
+    if len(data) == 0:
+        raise KaynatValueError("Cannot calculate percentile of empty list")
+
+    p = percent.value if isinstance(percent, KaynatNumber) else percent
+    if p < 0 or p > 100:
+        raise KaynatValueError("Percentile must be between 0 and 100")
+
+    ordered = _sorted(data)
+    k = (len(ordered) - 1) * p / 100
+    lower = math.floor(k)
+    upper = math.ceil(k)
+    if lower == upper:
+        return KaynatNumber(ordered[int(k)])
+
+    low_val = ordered[lower]
+    high_val = ordered[upper]
+    return KaynatNumber(low_val + (high_val - low_val) * (k - lower))